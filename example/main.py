@@ -1,67 +1,87 @@
+import logging
 import os
 
 from dotenv import load_dotenv
 
 from sharepointer.sharepoint import SharePointManager
 
-load_dotenv()
+logger = logging.getLogger("sharepointmanager")
 
+BANNER = "=" * 60
 
-# Configuration
-CLIENT_ID = os.getenv('CLIENT_ID')
-CLIENT_SECRET = os.getenv('CLIENT_SECRET')
-TENANT_ID = os.getenv('TENANT_ID')
 
-SITE_NAME = os.getenv('SITE_NAME')  # Your SharePoint tenant name (or full URL)
-SITE_PATH = os.getenv('SITE_PATH')  # Site path (e.g., '/sites/yoursite' or '' for root)
-DRIVE_NAME = os.getenv('DRIVE_NAME')  # Document library name (usually 'Documents')
+def load_config():
+    """Read the configuration from the environment (and .env), only when the example runs"""
+    load_dotenv()
 
+    return {
+        "CLIENT_ID": os.getenv('CLIENT_ID'),
+        "CLIENT_SECRET": os.getenv('CLIENT_SECRET'),
+        "TENANT_ID": os.getenv('TENANT_ID'),
+        "SITE_NAME": os.getenv('SITE_NAME'),  # Your SharePoint tenant name (or full URL)
+        "SITE_PATH": os.getenv('SITE_PATH'),  # Site path (e.g., '/sites/yoursite' or '' for root)
+        "DRIVE_NAME": os.getenv('DRIVE_NAME'),  # Document library name (usually 'Documents')
+        "CACHE_DIR": os.getenv('CACHE_DIR', '~/.cache/sharepointmanager'),  # Token and ID cache between runs
+        "LOG_LEVEL": os.getenv('SPM_LOG', 'INFO'),
+    }
 
-try:
-    # Initialize SharePoint manager
-    print("=" * 60)
-    print("Connecting to SharePoint using MSAL...")
-    print("=" * 60)
-    sp_manager = SharePointManager(TENANT_ID, CLIENT_ID, CLIENT_SECRET, SITE_NAME)
 
-    # Get site and drive IDs
-    print("\nRetrieving site information...")
-    sp_manager.get_site_id(SITE_PATH)
-    sp_manager.get_drive_id(DRIVE_NAME)
+def run(sp_manager, config):
+    """Find the first .csv folder, download it and move it to the archive folder"""
+    # Get site and drive IDs (one batched round trip)
+    logger.info("\nRetrieving site information...")
+    sp_manager.connect(config["SITE_PATH"], config["DRIVE_NAME"])
 
-    # Search for .gdb folder in SharePoint
-    print("\n" + "=" * 60)
-    print("Searching folder from SharePoint...")
-    print("=" * 60)
+    # Search for .csv folder in SharePoint
+    logger.info("\n%s", BANNER)
+    logger.info("Searching folder from SharePoint...")
+    logger.info(BANNER)
     matches = sp_manager.search_folders_by_suffix(".csv", folder_path='')
 
     if len(matches) == 0:
-        print("✗ No .csv folders found")
-    else:
-        to_download = matches[0].name
-        print(f"✓ Found folder: {to_download}")
-
-        # Download folder from SharePoint
-        print("\n" + "=" * 60)
-        print("Downloading folder from SharePoint...")
-        print("=" * 60)
-        downloaded_path = sp_manager.download_folder(to_download)
-
-    # Move folder in SharePoint
-    print("\n" + "=" * 60)
-    print("Moving folder in SharePoint...")
-    print("=" * 60)
+        logger.info("✗ No .csv folders found")
+        return
+
+    to_download = matches[0].name
+    logger.info("✓ Found folder: %s", to_download)
+
+    # Download folder from SharePoint
+    logger.info("\n%s", BANNER)
+    logger.info("Downloading folder from SharePoint...")
+    logger.info(BANNER)
+    sp_manager.download_folder(to_download)
+
+    # Move folder in SharePoint (only after the download has finished, since it moves the same folder)
+    logger.info("\n%s", BANNER)
+    logger.info("Moving folder in SharePoint...")
+    logger.info(BANNER)
     destination_folder = "Archive"
     sp_manager.move_item(item_path=to_download, destination_folder_path=destination_folder)
 
-    print("\n" + "=" * 60)
-    print("✓ Process completed successfully!")
-    print("=" * 60)
 
-except Exception as e:
-    print("\n" + "=" * 60)
-    print(f"✗ Error occurred: {str(e)}")
-    print("=" * 60)
-    raise
+def main(config):
+    logging.basicConfig(level=config["LOG_LEVEL"], format="%(message)s")
 
+    try:
+        # Initialize SharePoint manager
+        logger.info(BANNER)
+        logger.info("Connecting to SharePoint using MSAL...")
+        logger.info(BANNER)
+        with SharePointManager(config["TENANT_ID"], config["CLIENT_ID"], config["CLIENT_SECRET"],
+                               config["SITE_NAME"], cache_dir=config["CACHE_DIR"],
+                               prewarm_connection=True) as sp_manager:
+            run(sp_manager, config)
 
+        logger.info("\n%s", BANNER)
+        logger.info("✓ Process completed successfully!")
+        logger.info(BANNER)
+
+    except Exception as e:
+        logger.error("\n%s", BANNER)
+        logger.error("✗ Error occurred: %s", e)
+        logger.error(BANNER)
+        raise
+
+
+if __name__ == "__main__":
+    main(load_config())
@@ -1,16 +1,157 @@
+import hashlib
+import json
+import logging
 import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from io import BytesIO
+from itertools import chain
+from operator import attrgetter
 from urllib.parse import quote
 
 import msal
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:  # Optional, install with the 'fast' extra
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Percent-encode SharePoint item paths; the same paths are encoded over and over during walks and bulk moves
+_quote_path = lru_cache(maxsize=8192)(quote)
+
+
+def _parse_json(response):
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _parse_retry_after(value):
+    """Convert a Retry-After header (delay in seconds or an HTTP date) to seconds to wait, 0 if missing or invalid"""
+    if not value:
+        return 0
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _has_ancestor_in(item_path, paths):
+    """Check whether any folder above item_path is one of paths"""
+    parent_path = item_path.rpartition("/")[0]
+    while parent_path:
+        if parent_path in paths:
+            return True
+        parent_path = parent_path.rpartition("/")[0]
+    return False
+
+
+def _read_json_file(path):
+    """Read a JSON file, returning an empty dict if it is missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as json_file:
+            return json.load(json_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_file_atomic(path, content):
+    """Write a text file atomically (temporary file + rename) so readers never see partial content"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as output_file:
+            output_file.write(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _write_json_file_atomic(path, data):
+    """Write a JSON file atomically so readers never see partial content"""
+    _write_file_atomic(path, json.dumps(data))
+
+
+@contextmanager
+def _file_lock(path):
+    """Hold an exclusive advisory lock on path for the duration of the block (no-op without fcntl)"""
+    if fcntl is None:
+        yield
+        return
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a') as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class _LoggingRetry(Retry):
+    """urllib3 Retry that logs every retried request and only replays idempotent requests on gateway errors"""
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
 
-load_dotenv(dotenv_path='keys.env')
+    def __init__(self, *args, idempotent_status_forcelist=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        # Statuses that may arrive after the request was already processed, retried for idempotent methods only
+        self.idempotent_status_forcelist = frozenset(idempotent_status_forcelist)
 
+    def new(self, **kw):
+        kw.setdefault("idempotent_status_forcelist", self.idempotent_status_forcelist)
+        return super().new(**kw)
 
-@dataclass
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if status_code in self.idempotent_status_forcelist:
+            return method.upper() in self.IDEMPOTENT_METHODS
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+
+        # Leave out the query string, pre-authenticated download URLs carry a token in it
+        reason = response.status if response is not None else error
+        logger.warning(
+            "✗ Retrying %s %s after %s (%s retries left)",
+            method, (url or "").split("?")[0], reason, new_retry.total
+        )
+        return new_retry
+
+
+@dataclass(slots=True)
 class ItemInfo:
     """Data class for file or folder information from SharePoint"""
     name: str
@@ -20,12 +161,76 @@ class ItemInfo:
     id: str
     webUrl: str
 
+    @staticmethod
+    def total_size(items):
+        """
+        Sum the sizes of several items
+
+        Args:
+            items: Iterable of ItemInfo objects (e.g., search results)
+
+        Returns:
+            Total size in bytes
+        """
+        return sum(map(attrgetter("size"), items))
+
 
 class SharePointManager:
     # Base URL for Microsoft Graph API
     GRAPH_API_BASE = "https://graph.microsoft.com/v1.0"
 
-    def __init__(self, tenant_id, client_id, client_secret, site_name):
+    # Maximum number of sub-requests Graph accepts in a single $batch request
+    GRAPH_BATCH_LIMIT = 20
+
+    # Properties requested when listing folder children, and the page size for those listings
+    CHILDREN_SELECT = "id,name,size,eTag,lastModifiedDateTime,webUrl,parentReference,file,folder,@microsoft.graph.downloadUrl"
+    CHILDREN_PAGE_SIZE = 999
+
+    # File in a synced local directory holding the delta link and item tree of the last sync
+    DELTA_STATE_FILE = ".sp_delta"
+
+    # Maximum number of item IDs remembered per manager (least recently used are evicted)
+    ITEM_ID_CACHE_SIZE = 4096
+
+    # How long resolved site and drive IDs stay valid in the on-disk cache (seconds)
+    ID_CACHE_TTL = 7 * 24 * 60 * 60
+
+    # Chunk size used when streaming file downloads to disk
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+    # Files larger than this are uploaded through a resumable upload session in chunks;
+    # chunk sizes must be a multiple of 320 KiB
+    SIMPLE_UPLOAD_LIMIT = 4 * 1024 * 1024
+    UPLOAD_CHUNK_SIZE = 10 * 1024 * 1024
+
+    # How often a large upload resumes its session after a dropped connection
+    UPLOAD_RESUME_ATTEMPTS = 3
+
+    # Files at least this large are downloaded as several concurrent byte ranges
+    RANGE_DOWNLOAD_THRESHOLD = 32 * 1024 * 1024
+    RANGE_DOWNLOAD_PARTS = 6
+
+    # Retry settings for throttled or temporarily unavailable HTTP responses; Retry-After is honored.
+    # HTTP_RETRY_STATUSES are retried for every method, HTTP_IDEMPOTENT_RETRY_STATUSES only for
+    # idempotent ones, since a gateway error can arrive after Graph already applied the request.
+    # HTTP_MAX_RETRIES retries means up to HTTP_MAX_RETRIES + 1 attempts per request
+    HTTP_RETRY_STATUSES = (429, 503)
+    HTTP_IDEMPOTENT_RETRY_STATUSES = (502, 504)
+    HTTP_MAX_RETRIES = 6
+    HTTP_BACKOFF_FACTOR = 0.5
+
+    # Acquire a new access token when the current one expires within this many seconds
+    TOKEN_REFRESH_MARGIN = 5 * 60
+
+    # Timeout (seconds) for the request that opens the Graph connection during authentication
+    PREWARM_TIMEOUT = 10
+
+    # Retry settings for throttled (429/503) batch sub-requests
+    BATCH_MAX_RETRIES = 5
+    BATCH_BACKOFF_BASE = 0.5
+
+    def __init__(self, tenant_id, client_id, client_secret, site_name, max_workers=16, cache_dir=None,
+                 prewarm_connection=False):
         """
         Initialize SharePoint connection using MSAL
 
@@ -34,10 +239,51 @@ class SharePointManager:
             client_id: Azure AD Application (client) ID
             client_secret: Azure AD Application client secret
             site_name: SharePoint site name (e.g., 'yourtenant.sharepoint.com' or just 'yourtenant')
+            max_workers: Maximum number of concurrent listings and downloads (default: 16)
+            cache_dir: Directory to cache access tokens and resolved site and drive IDs
+                       between runs (e.g., '~/.cache/sharepointmanager'). Caching is disabled if None
+            prewarm_connection: Open the TCP/TLS connection to Microsoft Graph while the access
+                                token is acquired, so the first Graph call doesn't pay for it (default: False)
         """
         self.tenant_id = tenant_id
         self.client_id = client_id
         self.client_secret = client_secret
+        self.max_workers = max_workers
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+
+        # Shared worker pools for concurrent listings and downloads, and for the byte
+        # ranges of large files (separate so ranges never queue behind whole files)
+        self._io_pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._range_pool = ThreadPoolExecutor(max_workers=max_workers)
+        # Chunks of large $batch requests get their own pool, so a batch sent from an
+        # I/O worker never waits for a free slot in the pool it is occupying
+        self._batch_pool = ThreadPoolExecutor(max_workers=max_workers)
+
+        # Persistent HTTP session so TCP/TLS connections are reused across Graph calls;
+        # the pool is large enough for every concurrent download worker plus the
+        # workers fetching byte ranges of large files, and blocks rather than opening
+        # extra connections beyond that. Throttled requests are retried with
+        # exponential backoff and jitter (or after Retry-After when Graph sends it),
+        # gateway errors only for idempotent methods, each retry is logged, and the
+        # final response is returned so raise_for_status() reports it
+        retry = _LoggingRetry(
+            total=self.HTTP_MAX_RETRIES,
+            status_forcelist=self.HTTP_RETRY_STATUSES + self.HTTP_IDEMPOTENT_RETRY_STATUSES,
+            idempotent_status_forcelist=self.HTTP_IDEMPOTENT_RETRY_STATUSES,
+            allowed_methods=None,
+            backoff_factor=self.HTTP_BACKOFF_FACTOR,
+            backoff_jitter=self.HTTP_BACKOFF_FACTOR,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=max(10, 2 * max_workers),
+            pool_block=True,
+            max_retries=retry
+        )
+        self._session.mount("https://", adapter)
 
         # Ensure site_name has the correct format
         if not site_name.endswith('.sharepoint.com'):
@@ -46,42 +292,133 @@ class SharePointManager:
             self.site_name = site_name
 
         self.access_token = None
+        self._token_expires_at = None
+        self._token_lock = threading.Lock()
+        # Request headers for the access_token they were built for
+        self._headers = (None, None)
         self.site_id = None
         self.drive_id = None
+        # Drive root URL for the (site_id, drive_id) it was built for
+        self._drive_root_url = (None, None, None)
+
+        # Item IDs by (site_id, drive_id, path), and the drives of the last listed site by name
+        self._item_ids = OrderedDict()
+        self._item_ids_lock = threading.Lock()
+        self._drives_by_name = {}
+        self._drives_site_id = None
+        # Cleared once the drive rejects $filter on folder listings
+        self._children_filter_supported = True
+
+        # Authenticate and get access token, optionally connecting to Graph at the same time
+        prewarm_thread = None
+        if prewarm_connection:
+            prewarm_thread = threading.Thread(target=self._prewarm_connection, daemon=True)
+            prewarm_thread.start()
 
-        # Authenticate and get access token
-        self._authenticate()
+        try:
+            self._authenticate()
+        finally:
+            if prewarm_thread is not None:
+                prewarm_thread.join()
+
+    def close(self):
+        """Stop the worker pools and close the pooled HTTP connections held by this manager"""
+        self._io_pool.shutdown(wait=True)
+        self._range_pool.shutdown(wait=True)
+        self._batch_pool.shutdown(wait=True)
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _prewarm_connection(self):
+        """Open a pooled connection to Microsoft Graph; the response itself is irrelevant"""
+        try:
+            self._session.head(f"{self.GRAPH_API_BASE}/$metadata", timeout=self.PREWARM_TIMEOUT).close()
+        except requests.exceptions.RequestException as e:
+            logger.debug("Prewarming the Graph connection failed: %s", e)
 
     def _authenticate(self):
         """
         Authenticate using MSAL and get access token
         """
+        if not self.cache_dir:
+            self._acquire_token()
+            return
+
+        # Share the MSAL token cache between runs; the lock keeps concurrent runs
+        # from overwriting each other's cache file
+        cache_path = os.path.join(self.cache_dir, "msal.bin")
+        with _file_lock(cache_path + ".lock"):
+            token_cache = msal.SerializableTokenCache()
+            if os.path.exists(cache_path):
+                with open(cache_path, 'r', encoding='utf-8') as cache_file:
+                    token_cache.deserialize(cache_file.read())
+
+            self._acquire_token(token_cache)
+
+            if token_cache.has_state_changed:
+                _write_file_atomic(cache_path, token_cache.serialize())
+
+    def _acquire_token(self, token_cache=None):
+        """
+        Acquire an app-only access token, served from token_cache while it is still valid
+
+        Args:
+            token_cache: Optional msal.SerializableTokenCache to read from and write to
+        """
         authority = f"https://login.microsoftonline.com/{self.tenant_id}"
         scope = ["https://graph.microsoft.com/.default"]
 
         # Create a confidential client application
+        app_kwargs = {"token_cache": token_cache} if token_cache is not None else {}
         app = msal.ConfidentialClientApplication(
             self.client_id,
             authority=authority,
-            client_credential=self.client_secret
+            client_credential=self.client_secret,
+            **app_kwargs
         )
 
-        # Acquire token
+        # Acquire token (MSAL returns a cached token if one is still valid)
         result = app.acquire_token_for_client(scopes=scope)
 
         if "access_token" in result:
             self.access_token = result["access_token"]
-            print("✓ Authentication successful")
+            expires_in = result.get("expires_in")
+            self._token_expires_at = time.time() + int(expires_in) if expires_in else None
+            logger.info("✓ Authentication successful")
         else:
             error_msg = result.get("error_description", result.get("error"))
             raise Exception(f"Authentication failed: {error_msg}")
 
+    def _ensure_token(self):
+        """Acquire a new access token if the current one is about to expire"""
+        if self._token_expires_at is None or time.time() < self._token_expires_at - self.TOKEN_REFRESH_MARGIN:
+            return
+
+        # Concurrent workers may notice the expiry at the same time, refresh only once
+        with self._token_lock:
+            if time.time() >= self._token_expires_at - self.TOKEN_REFRESH_MARGIN:
+                self._authenticate()
+
     def _get_headers(self):
-        """Get request headers with access token"""
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
+        """Get request headers with access token (rebuilt only when the token changes)"""
+        self._ensure_token()
+
+        token, headers = self._headers
+        if token != self.access_token:
+            token = self.access_token
+            headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+                "Accept": "application/json;odata.metadata=minimal"
+            }
+            self._headers = (token, headers)
+        # Callers needing other headers copy the dict first
+        return headers
 
     def _get_site_url(self, site_path=""):
         """Build site URL"""
@@ -94,25 +431,212 @@ class SharePointManager:
         """Build drives list URL"""
         return f"{self.GRAPH_API_BASE}/sites/{self.site_id}/drives"
 
-    def _get_drive_root_url(self):
-        """Build drive root URL"""
-        return f"{self.GRAPH_API_BASE}/sites/{self.site_id}/drives/{self.drive_id}/root"
+    def _get_drive_root_url(self, relative=False):
+        """
+        Build drive root URL (rebuilt only when the site or drive changes)
+
+        Args:
+            relative: Return the URL without GRAPH_API_BASE, as used by $batch sub-requests
+
+        Returns:
+            Drive root URL string
+        """
+        ids, root_url, relative_root_url = self._drive_root_url
+        if ids != (self.site_id, self.drive_id):
+            ids = (self.site_id, self.drive_id)
+            relative_root_url = f"/sites/{self.site_id}/drives/{self.drive_id}/root"
+            root_url = f"{self.GRAPH_API_BASE}{relative_root_url}"
+            self._drive_root_url = (ids, root_url, relative_root_url)
+        return relative_root_url if relative else root_url
 
     def _get_drive_item_url(self, encoded_path):
         """Build drive item URL with path"""
         return f"{self._get_drive_root_url()}:/{encoded_path}"
 
     def _get_drive_item_content_url(self, encoded_path):
-        """Build drive item content URL for upload"""
-        return f"{self._get_drive_item_url(encoded_path)}:/content"
+        """Build drive item content URL for upload and direct download"""
+        return f"{self._get_drive_root_url()}:/{encoded_path}:/content"
+
+    def _get_drive_item_upload_session_url(self, encoded_path):
+        """Build drive item URL for creating a resumable upload session"""
+        return f"{self._get_drive_root_url()}:/{encoded_path}:/createUploadSession"
 
-    def _get_drive_children_url(self, folder_path=""):
+    def _get_drive_children_url(self, folder_path="", relative=False):
         """Build drive children URL for listing items in a folder"""
+        root_url = self._get_drive_root_url(relative)
         if folder_path:
-            encoded_path = quote(folder_path)
-            return f"{self._get_drive_item_url(encoded_path)}:/children"
+            return f"{root_url}:/{_quote_path(folder_path)}:/children"
         else:
-            return f"{self._get_drive_root_url()}/children"
+            return f"{root_url}/children"
+
+    def _get_drive_search_url(self, query):
+        """Build drive search URL for a server-side search across the whole drive"""
+        escaped_query = quote(query.replace("'", "''"))
+        return f"{self._get_drive_root_url()}/search(q='{escaped_query}')"
+
+    def _get_batch_url(self):
+        """Build JSON batch URL"""
+        return f"{self.GRAPH_API_BASE}/$batch"
+
+    def _to_relative_url(self, url):
+        """Strip the Graph API base from a URL, as required for $batch sub-requests"""
+        if url.startswith(self.GRAPH_API_BASE):
+            return url[len(self.GRAPH_API_BASE):]
+        return url
+
+    def _get_drive_item_batch_urls(self, item_paths):
+        """Build the relative item URLs of several paths at once for use in $batch requests"""
+        root = self._get_drive_root_url(relative=True)
+        return [f"{root}:/{_quote_path(item_path)}" for item_path in item_paths]
+
+    def _graph_batch(self, batch_requests):
+        """
+        Send multiple Graph requests using the JSON batching ($batch) endpoint
+
+        Requests are sent in chunks of GRAPH_BATCH_LIMIT, several chunks concurrently on a
+        dedicated batch worker pool (so this is safe to call from the I/O pool's workers). Sub-requests
+        that are throttled (429/503) are retried with exponential backoff, honoring the Retry-After header.
+
+        Args:
+            batch_requests: List of dicts with 'method' and 'url' (relative to GRAPH_API_BASE),
+                            and optionally 'body' and 'headers'
+
+        Returns:
+            List of sub-response dicts ('status', 'headers', 'body') in the same order as batch_requests
+        """
+        responses = [None] * len(batch_requests)
+        pending = list(range(len(batch_requests)))
+
+        def post_chunk(chunk):
+            body = {"requests": [dict(batch_requests[index], id=str(index)) for index in chunk]}
+            response = self._session.post(self._get_batch_url(), headers=self._get_headers(), json=body)
+            response.raise_for_status()
+            return _parse_json(response)
+
+        for attempt in range(self.BATCH_MAX_RETRIES + 1):
+            throttled = []
+            retry_after = 0
+
+            chunks = [pending[start:start + self.GRAPH_BATCH_LIMIT]
+                      for start in range(0, len(pending), self.GRAPH_BATCH_LIMIT)]
+
+            # Independent batches are sent concurrently, e.g. when a folder walk reaches a wide level
+            if len(chunks) == 1:
+                batch_bodies = [post_chunk(chunks[0])]
+            else:
+                batch_bodies = self._batch_pool.map(post_chunk, chunks)
+
+            received = set()
+            for batch_body in batch_bodies:
+                for sub_response in batch_body.get("responses", []):
+                    index = int(sub_response["id"])
+                    responses[index] = sub_response
+                    received.add(index)
+
+                    if sub_response.get("status") in (429, 503):
+                        throttled.append(index)
+                        headers = sub_response.get("headers") or {}
+                        retry_after = max(retry_after, _parse_retry_after(
+                            headers.get("Retry-After") or headers.get("retry-after")))
+
+            missing = [index for index in pending if index not in received]
+            if missing:
+                raise Exception(f"$batch response is missing sub-responses for request ids: "
+                                f"{', '.join(map(str, missing))}")
+
+            if not throttled or attempt == self.BATCH_MAX_RETRIES:
+                break
+
+            # Back off before retrying only the throttled sub-requests
+            backoff = self.BATCH_BACKOFF_BASE * (2 ** attempt) + random.uniform(0, self.BATCH_BACKOFF_BASE)
+            time.sleep(max(retry_after, backoff))
+            pending = sorted(throttled)
+
+        return responses
+
+    def _search_drive(self, query):
+        """
+        Search the whole drive server-side and return the raw items found
+
+        Args:
+            query: Search text passed to the Graph search endpoint
+
+        Returns:
+            List of item dictionaries, or None if server-side search is not supported
+            for the drive (400 or 501); other errors are raised
+        """
+        url = self._get_drive_search_url(query)
+        params = {
+            "$select": "id,name,size,lastModifiedDateTime,webUrl,parentReference,file,folder",
+            "$top": 200
+        }
+
+        items = []
+        while url:
+            response = self._session.get(url, headers=self._get_headers(), params=params)
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError as e:
+                # Only unsupported search falls back to walking the tree, auth and throttling errors surface
+                if e.response is not None and e.response.status_code in (400, 501):
+                    return None
+                raise
+
+            page = _parse_json(response)
+            items.extend(page.get("value", []))
+
+            # nextLink already carries the query parameters
+            url = page.get("@odata.nextLink")
+            params = None
+
+        return items
+
+    def _resolve_parent_paths(self, items):
+        """
+        Fill in parentReference.path for items that lack it, with batch requests by item ID
+
+        Search results usually only carry the parent's ID, while full item paths and folder
+        scoping need the parent path.
+
+        Args:
+            items: List of item dictionaries, updated in place
+
+        Returns:
+            The items that still exist, or None if a parent path could not be determined
+        """
+        missing = [item for item in items if item.get("parentReference", {}).get("path") is None]
+        if not missing:
+            return items
+
+        batch_requests = [
+            {
+                "method": "GET",
+                "url": f"/sites/{self.site_id}/drives/{self.drive_id}/items/{item.get('id')}?$select=id,parentReference"
+            }
+            for item in missing
+        ]
+
+        deleted_ids = set()
+        for item, sub_response in zip(missing, self._graph_batch(batch_requests)):
+            if sub_response.get("status") == 404:
+                # Deleted since it was indexed for search
+                deleted_ids.add(item.get("id"))
+                continue
+            self._raise_for_batch_status(sub_response, f"getting the path of item '{item.get('name', '')}'")
+
+            parent_reference = (sub_response.get("body") or {}).get("parentReference") or {}
+            if parent_reference.get("path") is None:
+                return None
+            item["parentReference"] = parent_reference
+
+        return [item for item in items if item.get("id") not in deleted_ids]
+
+    def _raise_for_batch_status(self, sub_response, description):
+        """Raise an exception if a $batch sub-response indicates an error"""
+        status = sub_response.get("status", 0)
+        if status >= 400:
+            error = (sub_response.get("body") or {}).get("error", {})
+            raise Exception(f"Error {description}: {status} - {error.get('message', '')}")
 
     def _get_item_id_by_path(self, item_path):
         """
@@ -124,16 +648,21 @@ class SharePointManager:
         Returns:
             Item ID string
         """
+        item_id = self._get_remembered_item_id(item_path)
+        if item_id:
+            return item_id
+
         try:
-            encoded_path = quote(item_path)
+            encoded_path = _quote_path(item_path)
             url = self._get_drive_item_url(encoded_path)
-            response = requests.get(url, headers=self._get_headers())
+            response = self._session.get(url, headers=self._get_headers(), params={"$select": "id"})
             response.raise_for_status()
 
-            item_id = response.json().get("id")
+            item_id = _parse_json(response).get("id")
             if not item_id:
                 raise Exception(f"Could not retrieve ID for item: {item_path}")
 
+            self._remember_item_id(item_path, item_id)
             return item_id
 
         except requests.exceptions.HTTPError as e:
@@ -144,6 +673,103 @@ class SharePointManager:
         except Exception as e:
             raise Exception(f"Error retrieving item ID: {str(e)}")
 
+    def _get_item_ids_by_paths(self, item_paths):
+        """
+        Get the SharePoint item IDs for several files or folders with a single batch request
+
+        Args:
+            item_paths: List of paths to the items (e.g., ['folder/file.txt', 'archive'])
+
+        Returns:
+            List of item ID strings, in the same order as item_paths
+        """
+        ids_by_path = {item_path: self._get_remembered_item_id(item_path) for item_path in item_paths}
+
+        # Only look up the paths whose IDs aren't known yet
+        unknown_paths = [item_path for item_path, item_id in ids_by_path.items() if not item_id]
+        batch_requests = [
+            {"method": "GET", "url": f"{item_url}?$select=id"}
+            for item_url in self._get_drive_item_batch_urls(unknown_paths)
+        ]
+
+        for item_path, sub_response in zip(unknown_paths, self._graph_batch(batch_requests)):
+            if sub_response.get("status") == 404:
+                raise Exception(f"Item not found: {item_path}")
+            self._raise_for_batch_status(sub_response, "getting item ID")
+
+            item_id = (sub_response.get("body") or {}).get("id")
+            if not item_id:
+                raise Exception(f"Could not retrieve ID for item: {item_path}")
+
+            self._remember_item_id(item_path, item_id)
+            ids_by_path[item_path] = item_id
+
+        return [ids_by_path[item_path] for item_path in item_paths]
+
+    def _get_remembered_item_id(self, item_path):
+        """Get a previously resolved item ID for a path in the current drive, or None"""
+        key = (self.site_id, self.drive_id, item_path)
+        with self._item_ids_lock:
+            item_id = self._item_ids.get(key)
+            if item_id:
+                self._item_ids.move_to_end(key)
+            return item_id
+
+    def _remember_item_id(self, item_path, item_id):
+        """Remember the item ID for a path in the current drive"""
+        with self._item_ids_lock:
+            self._item_ids[(self.site_id, self.drive_id, item_path)] = item_id
+            self._item_ids.move_to_end((self.site_id, self.drive_id, item_path))
+            while len(self._item_ids) > self.ITEM_ID_CACHE_SIZE:
+                self._item_ids.popitem(last=False)
+
+    def _forget_item_path(self, item_path):
+        """Forget the IDs remembered for a path and everything below it (after a move or delete)"""
+        prefix = item_path.rstrip("/") + "/"
+        with self._item_ids_lock:
+            for key in list(self._item_ids):
+                site_id, drive_id, path = key
+                if (site_id, drive_id) == (self.site_id, self.drive_id) and (path == item_path or path.startswith(prefix)):
+                    del self._item_ids[key]
+
+    def _get_id_cache_key(self, kind, *parts):
+        """Build the on-disk cache key for a resolved ID"""
+        raw_key = json.dumps([self.tenant_id, self.site_name, kind, *parts])
+        return hashlib.sha1(raw_key.encode('utf-8')).hexdigest()
+
+    def _get_cached_id(self, key):
+        """Get a resolved ID from the on-disk cache, or None if caching is disabled, missing or expired"""
+        if not self.cache_dir:
+            return None
+
+        entry = _read_json_file(os.path.join(self.cache_dir, "ids.json")).get(key)
+        if not entry or entry.get("expires", 0) < time.time():
+            return None
+        return entry.get("id")
+
+    def _set_cached_id(self, key, value):
+        """Store a resolved ID in the on-disk cache"""
+        if not self.cache_dir:
+            return
+
+        cache_path = os.path.join(self.cache_dir, "ids.json")
+        # Lock the read-modify-write so concurrent processes don't drop each other's entries
+        with _file_lock(cache_path + ".lock"):
+            cache = _read_json_file(cache_path)
+            now = time.time()
+
+            # Drop expired entries while rewriting the file
+            cache = {k: v for k, v in cache.items() if v.get("expires", 0) >= now}
+            cache[key] = {"id": value, "expires": now + self.ID_CACHE_TTL}
+            _write_json_file_atomic(cache_path, cache)
+
+    def clear_id_cache(self):
+        """Remove all cached site and drive IDs (e.g., after a site or library was recreated)"""
+        if self.cache_dir:
+            cache_path = os.path.join(self.cache_dir, "ids.json")
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+
     def get_site_id(self, site_path=""):
         """
         Get SharePoint site ID
@@ -154,12 +780,20 @@ class SharePointManager:
         Returns:
             Site ID
         """
+        cache_key = self._get_id_cache_key("site", site_path)
+        cached_id = self._get_cached_id(cache_key)
+        if cached_id:
+            self.site_id = cached_id
+            logger.info("✓ Site ID retrieved from cache: %s", self.site_id)
+            return self.site_id
+
         url = self._get_site_url(site_path)
-        response = requests.get(url, headers=self._get_headers())
+        response = self._session.get(url, headers=self._get_headers())
         response.raise_for_status()
 
-        self.site_id = response.json()["id"]
-        print(f"✓ Site ID retrieved: {self.site_id}")
+        self.site_id = _parse_json(response)["id"]
+        self._set_cached_id(cache_key, self.site_id)
+        logger.info("✓ Site ID retrieved: %s", self.site_id)
         return self.site_id
 
     def get_drive_id(self, drive_name="Documenten"):
@@ -175,28 +809,90 @@ class SharePointManager:
         if not self.site_id:
             raise Exception("Site ID not set. Call get_site_id() first.")
 
+        # The drives of this site were already listed
+        if self._drives_site_id == self.site_id and drive_name in self._drives_by_name:
+            self.drive_id = self._drives_by_name[drive_name]
+            logger.info("✓ Drive ID retrieved: %s", self.drive_id)
+            return self.drive_id
+
+        cache_key = self._get_id_cache_key("drive", self.site_id, drive_name)
+        cached_id = self._get_cached_id(cache_key)
+        if cached_id:
+            self.drive_id = cached_id
+            logger.info("✓ Drive ID retrieved from cache: %s", self.drive_id)
+            return self.drive_id
+
         url = self._get_drives_url()
-        response = requests.get(url, headers=self._get_headers())
+        response = self._session.get(url, headers=self._get_headers())
         response.raise_for_status()
 
-        drives = response.json()["value"]
+        self._select_drive(_parse_json(response)["value"], drive_name)
+        self._set_cached_id(cache_key, self.drive_id)
+        return self.drive_id
+
+    def _select_drive(self, drives, drive_name):
+        """Set the drive ID from a list of drives, falling back to the first (default) drive"""
+        # Remember all drives of the site by name for later lookups
+        self._drives_by_name = {drive["name"]: drive["id"] for drive in drives}
+        self._drives_site_id = self.site_id
 
         # Find the drive by name
-        for drive in drives:
-            if drive["name"] == drive_name:
-                self.drive_id = drive["id"]
-                print(f"✓ Drive ID retrieved: {self.drive_id}")
-                return self.drive_id
+        if drive_name in self._drives_by_name:
+            self.drive_id = self._drives_by_name[drive_name]
+            logger.info("✓ Drive ID retrieved: %s", self.drive_id)
+            return self.drive_id
 
         # If not found, use the default drive
         if drives:
             self.drive_id = drives[0]["id"]
-            print(f"✓ Using default drive ID: {self.drive_id}")
+            logger.info("✓ Using default drive ID: %s", self.drive_id)
             return self.drive_id
 
         raise Exception(f"No drives found or drive '{drive_name}' not found")
 
-    def download_item(self, item_path, local_path=None):
+    def connect(self, site_path="", drive_name="Documenten"):
+        """
+        Get SharePoint site ID and document library (drive) ID in a single batch request
+
+        Equivalent to calling get_site_id() followed by get_drive_id(), but both lookups
+        share one round trip to Microsoft Graph.
+
+        Args:
+            site_path: Site path (e.g., '/sites/yoursite' or empty for root site)
+            drive_name: Name of the document library (default: 'Documents')
+
+        Returns:
+            Tuple of (site ID, drive ID)
+        """
+        site_cache_key = self._get_id_cache_key("site", site_path)
+        cached_site_id = self._get_cached_id(site_cache_key)
+        if cached_site_id:
+            cached_drive_id = self._get_cached_id(self._get_id_cache_key("drive", cached_site_id, drive_name))
+            if cached_drive_id:
+                self.site_id = cached_site_id
+                self.drive_id = cached_drive_id
+                logger.info("✓ Site and drive IDs retrieved from cache: %s, %s", self.site_id, self.drive_id)
+                return self.site_id, self.drive_id
+
+        site_url = self._get_site_url(site_path)
+        drives_url = f"{site_url}:/drives" if site_path else f"{site_url}/drives"
+
+        site_response, drives_response = self._graph_batch([
+            {"method": "GET", "url": self._to_relative_url(site_url)},
+            {"method": "GET", "url": self._to_relative_url(drives_url)}
+        ])
+        self._raise_for_batch_status(site_response, "retrieving site")
+        self._raise_for_batch_status(drives_response, "retrieving drives")
+
+        self.site_id = site_response["body"]["id"]
+        self._set_cached_id(site_cache_key, self.site_id)
+        logger.info("✓ Site ID retrieved: %s", self.site_id)
+
+        self._select_drive(drives_response["body"]["value"], drive_name)
+        self._set_cached_id(self._get_id_cache_key("drive", self.site_id, drive_name), self.drive_id)
+        return self.site_id, self.drive_id
+
+    def download_item(self, item_path, local_path=None, progress_callback=None):
         """
         Download a file or folder from SharePoint (auto-detects type)
 
@@ -205,6 +901,8 @@ class SharePointManager:
             local_path: Local path to save the item (optional)
                         - For files: full file path or None for in-memory
                         - For folders: directory path or None for current directory
+            progress_callback: Optional callable for folders, called as progress_callback(files_done, files_total)
+                               each time a file finishes downloading
 
         Returns:
             For files: BytesIO object if local_path is None, otherwise the local file path
@@ -215,14 +913,15 @@ class SharePointManager:
 
         try:
             # Encode the item path
-            encoded_path = quote(item_path)
+            encoded_path = _quote_path(item_path)
 
-            # Get item metadata to determine if it's a file or folder
+            # Get item metadata to determine if it's a file or folder; for folders the
+            # first page of children (with download URLs) comes back in the same response
             url = self._get_drive_item_url(encoded_path)
-            response = requests.get(url, headers=self._get_headers())
+            response = self._session.get(url, headers=self._get_headers(), params={"$expand": "children"})
             response.raise_for_status()
 
-            item_info = response.json()
+            item_info = _parse_json(response)
 
             # Check if it's a file or folder
             if "file" in item_info:
@@ -230,40 +929,63 @@ class SharePointManager:
                 return self._download_file_internal(item_path, local_path, item_info)
             elif "folder" in item_info:
                 # It's a folder - use download_folder logic
-                return self._download_folder_internal(item_path, local_path)
+                # Only reuse the expanded children if the listing is complete
+                prefetched_children = None
+                if "children" in item_info and "children@odata.nextLink" not in item_info:
+                    prefetched_children = item_info["children"]
+                return self._download_folder_internal(item_path, local_path, prefetched_children, progress_callback)
             else:
                 raise Exception(f"Unknown item type for: {item_path}")
 
         except requests.exceptions.HTTPError as e:
-            print(f"✗ Error downloading item: {e.response.status_code} - {e.response.text}")
+            logger.error("✗ Error downloading item: %s - %s", e.response.status_code, e.response.text)
             raise
         except Exception as e:
-            print(f"✗ Error downloading item: {str(e)}")
+            logger.error("✗ Error downloading item: %s", e)
             raise
 
     def _download_file_internal(self, file_path, local_path, item_info):
         """Internal method to download a file (used by download_item)"""
         download_url = item_info["@microsoft.graph.downloadUrl"]
 
-        # Download file content
-        file_response = requests.get(download_url)
-        file_response.raise_for_status()
-
         if local_path:
-            # Save to local file
-            with open(local_path, 'wb') as local_file:
-                local_file.write(file_response.content)
-            print(f"✓ File downloaded successfully to: {local_path}")
+            # Stream to disk like folder downloads do (in ranges for large files)
+            self._download_to_local_file((download_url, local_path, item_info.get("size")), self._range_pool)
+            logger.info("✓ File downloaded successfully to: %s", local_path)
             return local_path
-        else:
-            # Return as BytesIO object for in-memory processing
-            print("✓ File downloaded successfully to memory")
-            return BytesIO(file_response.content)
 
-    def _download_folder_internal(self, folder_path, local_directory):
-        """Internal method to download a folder (used by download_item)"""
+        file_buffer = self._download_to_memory(download_url)
+        logger.info("✓ File downloaded successfully to memory")
+        return file_buffer
+
+    def _download_to_memory(self, download_url, headers=None):
+        """Stream a file into a BytesIO object for in-memory processing, without a second full copy"""
+        file_buffer = BytesIO()
+        file_response = self._session.get(download_url, headers=headers, stream=True)
+        try:
+            file_response.raise_for_status()
+            for chunk in file_response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                file_buffer.write(chunk)
+        finally:
+            file_response.close()
+
+        file_buffer.seek(0)
+        return file_buffer
+
+    def _download_folder_internal(self, folder_path, local_directory, prefetched_children=None,
+                                  progress_callback=None):
+        """
+        Internal method to download a folder (used by download_item)
+
+        Args:
+            folder_path: Path to the folder in SharePoint
+            local_directory: Local directory to save the folder to
+            prefetched_children: Complete list of the folder's children if already retrieved
+                                 (skips listing the top-level folder again)
+            progress_callback: Optional callable called as progress_callback(files_done, files_total)
+        """
         # Get folder name from path
-        folder_name = folder_path.split("/")[-1]
+        folder_name = folder_path.rpartition("/")[2]
 
         # Set default local directory
         if local_directory is None:
@@ -272,55 +994,365 @@ class SharePointManager:
         # Create local directory if it doesn't exist
         os.makedirs(local_directory, exist_ok=True)
 
-        print(f"✓ Starting download of folder: {folder_path}")
-
-        def download_folder_recursive(sharepoint_path, local_path):
-            """Recursively download folder and its contents"""
-            # Build the URL for current folder
-            url = self._get_drive_children_url(sharepoint_path)
+        logger.info("✓ Starting download of folder: %s", folder_path)
 
-            # Get all items in the current folder
-            response = requests.get(url, headers=self._get_headers())
-            response.raise_for_status()
+        # Files to download as (download_url, local_file_path, size) tuples
+        download_tasks = []
+        # (task index, item ID) of listed files whose download URL was not included
+        missing_download_urls = []
 
-            items = response.json().get("value", [])
+        # Previously downloaded files by drive item, used to skip files that haven't changed
+        manifest_path = os.path.join(self.cache_dir, "manifest.json") if self.cache_dir else None
+        manifest = _read_json_file(manifest_path) if manifest_path else {}
+        manifest_updates = {}
 
+        def collect_folder_items(sharepoint_path, local_path, items):
+            """Create local subfolders and queue the files of one folder; returns its subfolders"""
+            subfolders = []
             for item in items:
                 item_name = item.get("name", "")
 
                 if "file" in item:
-                    # Download file
+                    local_file_path = os.path.join(local_path, item_name)
+
+                    if item.get("size") == 0:
+                        # Empty file, create it locally without a download request
+                        open(local_file_path, 'wb').close()
+                        continue
+
+                    manifest_key = f"{self.drive_id}:{item.get('id')}"
+                    manifest_entry = {
+                        "etag": item.get("eTag"),
+                        "path": os.path.abspath(local_file_path),
+                        "size": item.get("size")
+                    }
+                    if manifest_path and manifest_entry["etag"] and self._is_unchanged_download(
+                            manifest.get(manifest_key), manifest_entry):
+                        logger.debug("✓ Unchanged, skipping file: %s", item_name)
+                        continue
+
+                    # Queue file for download
                     file_download_url = item.get("@microsoft.graph.downloadUrl")
-                    if file_download_url:
-                        file_response = requests.get(file_download_url)
-                        file_response.raise_for_status()
-
-                        # Save file to local path
-                        local_file_path = os.path.join(local_path, item_name)
-                        with open(local_file_path, 'wb') as local_file:
-                            local_file.write(file_response.content)
-                        print(f"  ✓ Downloaded file: {item_name}")
+                    if not file_download_url:
+                        missing_download_urls.append((len(download_tasks), item.get("id")))
+                    download_tasks.append((file_download_url, local_file_path, item.get("size")))
+                    if manifest_path and manifest_entry["etag"]:
+                        manifest_updates[local_file_path] = (manifest_key, manifest_entry)
 
                 elif "folder" in item:
                     # Create local subfolder
                     local_subfolder = os.path.join(local_path, item_name)
                     os.makedirs(local_subfolder, exist_ok=True)
 
-                    # Recursively download subfolder
                     new_sharepoint_path = f"{sharepoint_path}/{item_name}" if sharepoint_path else item_name
-                    download_folder_recursive(new_sharepoint_path, local_subfolder)
+                    subfolders.append((new_sharepoint_path, local_subfolder))
 
-        # Start the recursive download
-        download_folder_recursive(folder_path, local_directory)
+            return subfolders
+
+        # Walk the folder tree breadth-first before downloading anything, listing all
+        # folders of one level concurrently
+        if prefetched_children is not None:
+            level = collect_folder_items(folder_path, local_directory, prefetched_children)
+        else:
+            level = [(folder_path, local_directory)]
+
+        while level:
+            listings = self._io_pool.map(self._list_children, [sharepoint_path for sharepoint_path, _ in level])
+            next_level = []
+            for (sharepoint_path, local_path), items in zip(level, listings):
+                next_level.extend(collect_folder_items(sharepoint_path, local_path, items))
+            level = next_level
+
+        # Listings don't always include download URLs, look those up in batches
+        if missing_download_urls:
+            download_urls = self._get_download_urls_by_ids([item_id for _, item_id in missing_download_urls])
+            for (task_index, _), download_url in zip(missing_download_urls, download_urls):
+                _, local_file_path, size = download_tasks[task_index]
+                download_tasks[task_index] = (download_url, local_file_path, size)
+
+        self._download_files(
+            download_tasks,
+            lambda completed_tasks: self._update_download_manifest(manifest_path, manifest_updates, completed_tasks),
+            progress_callback
+        )
 
-        print(f"✓ Folder downloaded successfully to: {local_directory}")
+        logger.info("✓ Folder downloaded successfully to: %s", local_directory)
         return local_directory
 
+    def _download_files(self, download_tasks, on_completed=None, progress_callback=None):
+        """
+        Download several files concurrently, re-raising the first error
+
+        Args:
+            download_tasks: List of (download_url, local_file_path, size) tuples
+            on_completed: Optional callback receiving the list of tasks that finished, called once
+                          all downloads have stopped (also when one of them failed)
+            progress_callback: Optional callable called as progress_callback(files_done, files_total)
+                               from the calling thread as each download finishes
+        """
+        if not download_tasks:
+            return
+
+        # Download all files on the shared pool; byte ranges of large files use their own
+        # pool so they never wait behind whole files
+        futures = [
+            self._io_pool.submit(self._download_to_local_file, task, self._range_pool)
+            for task in download_tasks
+        ]
+        try:
+            # Re-raise the first error
+            for files_done, future in enumerate(as_completed(futures), start=1):
+                future.result()
+                if progress_callback is not None:
+                    progress_callback(files_done, len(futures))
+        finally:
+            # Don't leave downloads running after a failure, then record the files that
+            # finished even if another download failed
+            for future in futures:
+                future.cancel()
+            wait(futures)
+
+            if on_completed is not None:
+                completed_tasks = [
+                    task for task, future in zip(download_tasks, futures)
+                    if not future.cancelled() and future.exception() is None
+                ]
+                on_completed(completed_tasks)
+
+    def _list_children(self, folder_path, name_suffixes=None):
+        """
+        List the items in a folder, following pagination
+
+        Args:
+            folder_path: Path to the folder in SharePoint ('' for the drive root)
+            name_suffixes: Optional tuple of name suffixes to filter on server-side (see _iter_children)
+
+        Returns:
+            List of driveItem dictionaries
+        """
+        return list(self._iter_children(folder_path, name_suffixes))
+
+    def _iter_children(self, folder_path, name_suffixes=None):
+        """
+        Iterate over the items in a folder, fetching the next page only when it is needed
+
+        Args:
+            folder_path: Path to the folder in SharePoint ('' for the drive root)
+            name_suffixes: Optional tuple of casefolded name suffixes to filter on server-side; items may
+                           still have to be filtered by the caller, as not every drive supports the filter
+
+        Yields:
+            driveItem dictionaries
+        """
+        url = self._get_drive_children_url(folder_path)
+        params = {"$select": self.CHILDREN_SELECT, "$top": self.CHILDREN_PAGE_SIZE}
+        pages = None
+
+        # endswith() is case-sensitive, so the filter compares against the lowercased name; lower() only
+        # matches casefold() for ASCII, other suffixes are matched locally
+        if (name_suffixes and all(name_suffixes) and all(suffix.isascii() for suffix in name_suffixes)
+                and self._children_filter_supported):
+            escaped_suffixes = (suffix.replace("'", "''") for suffix in name_suffixes)
+            name_filter = " or ".join(f"endswith(tolower(name),'{suffix}')" for suffix in escaped_suffixes)
+            filtered_pages = self._iter_children_pages(url, dict(params, **{"$filter": name_filter}))
+            try:
+                # An unsupported filter is rejected on the first page
+                pages = chain([next(filtered_pages)], filtered_pages)
+            except requests.exceptions.HTTPError as e:
+                status_code = e.response.status_code if e.response is not None else None
+                # Drives reject an unsupported filter with 400 (invalidRequest) or 501 (notSupported)
+                if status_code not in (400, 501):
+                    raise
+                # The filter is not supported for this drive, list everything from now on
+                self._children_filter_supported = False
+
+        if pages is None:
+            pages = self._iter_children_pages(url, params)
+
+        for page in pages:
+            yield from page
+
+    def _iter_children_pages(self, url, params):
+        """Fetch the pages of a folder listing one at a time, yielding each page's items"""
+        while url:
+            response = self._session.get(url, headers=self._get_headers(), params=params)
+            response.raise_for_status()
+
+            page = _parse_json(response)
+            yield page.get("value", [])
+
+            # nextLink already carries the query parameters
+            url = page.get("@odata.nextLink")
+            params = None
+
+    def _get_children_batch_url(self, folder_path):
+        """Build the relative URL of a folder listing page for use in a $batch request"""
+        children_url = self._get_drive_children_url(folder_path, relative=True)
+        return f"{children_url}?$select={self.CHILDREN_SELECT}&$top={self.CHILDREN_PAGE_SIZE}"
+
+    def _is_unchanged_download(self, previous_entry, current_entry):
+        """Check whether a file was already downloaded to the same path at the same version"""
+        if previous_entry != current_entry:
+            return False
+
+        local_file_path = current_entry["path"]
+        return os.path.isfile(local_file_path) and os.path.getsize(local_file_path) == current_entry["size"]
+
+    def _update_download_manifest(self, manifest_path, manifest_updates, completed_tasks):
+        """Store the versions of the downloaded files in the download manifest"""
+        updates = [manifest_updates[task[1]] for task in completed_tasks if task[1] in manifest_updates]
+        if not manifest_path or not updates:
+            return
+
+        with _file_lock(manifest_path + ".lock"):
+            manifest = _read_json_file(manifest_path)
+            manifest.update(updates)
+            _write_json_file_atomic(manifest_path, manifest)
+
+    def _download_to_local_file(self, download_task, range_executor=None, headers=None):
+        """
+        Download a single file to a local path (used by _download_folder_internal)
+
+        Args:
+            download_task: Tuple of (download_url, local_file_path, size)
+            range_executor: Executor used to fetch byte ranges of large files concurrently
+            headers: Optional request headers, for download URLs that aren't pre-authenticated
+        """
+        download_url, local_file_path, file_size = download_task
+
+        # Write to a temporary file next to the target and rename it into place when complete,
+        # so an interrupted download never leaves a truncated file behind under the final name
+        partial_file_path = local_file_path + ".part"
+        try:
+            downloaded = False
+            if range_executor is not None and file_size and file_size >= self.RANGE_DOWNLOAD_THRESHOLD:
+                downloaded = self._download_file_ranges(download_url, partial_file_path, file_size, range_executor)
+
+            if not downloaded:
+                self._download_file_stream(download_url, partial_file_path, headers)
+
+            # Same directory, so this is a metadata-only rename rather than a data copy
+            os.replace(partial_file_path, local_file_path)
+        except BaseException:
+            if os.path.exists(partial_file_path):
+                os.remove(partial_file_path)
+            raise
+
+        logger.debug("✓ Downloaded file: %s", os.path.basename(local_file_path))
+
+    def _download_file_stream(self, download_url, local_file_path, headers=None):
+        """Stream a file to disk so only one chunk is held in memory at a time"""
+        file_response = self._session.get(download_url, headers=headers, stream=True)
+        try:
+            file_response.raise_for_status()
+
+            with open(local_file_path, 'wb') as local_file:
+                preallocated = self._preallocate_file(local_file, file_response.headers.get("Content-Length"))
+
+                for chunk in file_response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                    local_file.write(chunk)
+
+                # Content-Length may differ from the decoded size, drop any unused preallocated space
+                if preallocated:
+                    local_file.truncate()
+        finally:
+            file_response.close()
+
+    def _download_file_ranges(self, download_url, local_file_path, file_size, range_executor):
+        """
+        Download a large file as concurrent byte ranges, each written at its own offset
+
+        Returns:
+            True if the file was downloaded, False if the server does not support range requests
+        """
+        part_size = -(-file_size // self.RANGE_DOWNLOAD_PARTS)
+        byte_ranges = [(start, min(start + part_size, file_size) - 1) for start in range(0, file_size, part_size)]
+
+        # The first range doubles as the probe for range support
+        first_start, first_end = byte_ranges[0]
+        first_response = self._get_byte_range(download_url, first_start, first_end)
+        try:
+            first_response.raise_for_status()
+            if first_response.status_code != 206:
+                return False
+
+            with open(local_file_path, 'wb') as local_file:
+                if not self._preallocate_file(local_file, file_size):
+                    local_file.truncate(file_size)
+
+            futures = [
+                range_executor.submit(self._download_byte_range, download_url, local_file_path, start, end)
+                for start, end in byte_ranges[1:]
+            ]
+            try:
+                self._write_byte_range(first_response, local_file_path, first_start, first_end)
+                for future in futures:
+                    future.result()
+            except BaseException:
+                # Don't leave ranges writing into a file that is about to be removed
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+                raise
+        finally:
+            first_response.close()
+
+        return True
+
+    def _get_byte_range(self, download_url, start, end):
+        """Request bytes start-end (inclusive) of a file; identity encoding keeps offsets exact"""
+        return self._session.get(
+            download_url,
+            headers={"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"},
+            stream=True
+        )
+
+    def _download_byte_range(self, download_url, local_file_path, start, end):
+        """Download bytes start-end (inclusive) of a file into the same range of the local file"""
+        range_response = self._get_byte_range(download_url, start, end)
+        try:
+            range_response.raise_for_status()
+            if range_response.status_code != 206:
+                raise Exception(f"Range request not honored for bytes {start}-{end}")
+            self._write_byte_range(range_response, local_file_path, start, end)
+        finally:
+            range_response.close()
+
+    def _write_byte_range(self, range_response, local_file_path, start, end):
+        """Write a range response body at its offset in an existing local file"""
+        written = 0
+        with open(local_file_path, 'r+b') as local_file:
+            local_file.seek(start)
+            for chunk in range_response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                local_file.write(chunk)
+                written += len(chunk)
+
+        if written != end - start + 1:
+            raise Exception(f"Incomplete range download: expected {end - start + 1} bytes, got {written}")
+
+    def _preallocate_file(self, local_file, content_length):
+        """
+        Reserve disk space for a download to avoid fragmentation (Linux/Unix only)
+
+        Returns:
+            True if space was preallocated
+        """
+        if not content_length or not hasattr(os, "posix_fallocate"):
+            return False
+
+        try:
+            os.posix_fallocate(local_file.fileno(), 0, int(content_length))
+        except (OSError, ValueError):
+            # Not supported by the filesystem or invalid header; fall back to normal writes
+            return False
+        return True
+
     def download_file(self, file_path, local_path=None):
         """
         Download a file from SharePoint
 
-        Deprecated: Use download_item() instead. This method is kept for backward compatibility.
+        Deprecated: Use download_item() or download_file_direct() instead. This method is kept for
+        backward compatibility.
 
         Args:
             file_path: Path to file in SharePoint (e.g., 'folder/data.csv' or 'data.csv')
@@ -330,9 +1362,51 @@ class SharePointManager:
             BytesIO object containing file content if local_path is None,
             otherwise saves to local_path and returns the path
         """
+        return self.download_file_direct(file_path, local_path)
+
+    def download_file_direct(self, file_path, local_path=None):
+        """
+        Download a file from SharePoint with a single request to its content
+
+        Unlike download_item(), no metadata request is made first. If the path turns out not to be
+        a downloadable file (e.g., it is a folder), the download falls back to download_item().
+
+        Args:
+            file_path: Path to file in SharePoint (e.g., 'folder/data.csv' or 'data.csv')
+            local_path: Local path to save the file (optional)
+
+        Returns:
+            BytesIO object containing file content if local_path is None,
+            otherwise saves to local_path and returns the path
+        """
+        if not self.drive_id:
+            raise Exception("Drive ID not set. Call get_drive_id() first.")
+
+        # Graph redirects to a pre-authenticated download URL; requests drops the
+        # Authorization header when following a redirect to another host
+        url = self._get_drive_item_content_url(_quote_path(file_path))
+        headers = {"Authorization": self._get_headers()["Authorization"]}
+
+        try:
+            if local_path:
+                self._download_to_local_file((url, local_path, None), headers=headers)
+                logger.info("✓ File downloaded successfully to: %s", local_path)
+                return local_path
+
+            file_buffer = self._download_to_memory(url, headers)
+            logger.info("✓ File downloaded successfully to memory")
+            return file_buffer
+
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else None
+            if status_code is None or not 400 <= status_code < 500 or status_code in (401, 403, 429):
+                logger.error("✗ Error downloading file: %s", e)
+                raise
+
+        # Not a file or not found; the auto-detecting download handles folders and reports errors
         return self.download_item(file_path, local_path)
 
-    def upload_file(self, local_file_path, sharepoint_path, file_name=None):
+    def upload_file(self, local_file_path, sharepoint_path, file_name=None, progress_callback=None):
         """
         Upload a file to SharePoint
 
@@ -340,6 +1414,8 @@ class SharePointManager:
             local_file_path: Path to the local file to upload
             sharepoint_path: Folder path in SharePoint (e.g., 'folder' or '' for root)
             file_name: Name for the file in SharePoint (defaults to local filename)
+            progress_callback: Optional callable called as progress_callback(bytes_sent, total_bytes)
+                               after each uploaded chunk
 
         Returns:
             Response from upload
@@ -351,17 +1427,16 @@ class SharePointManager:
             if file_name is None:
                 file_name = os.path.basename(local_file_path)
 
-            # Read file content
+            # Stream the file from disk instead of reading it into memory
+            file_size = os.path.getsize(local_file_path)
             with open(local_file_path, 'rb') as content_file:
-                file_content = content_file.read()
-
-            return self.upload_file_from_memory(file_content, sharepoint_path, file_name)
+                return self._upload_stream(content_file, file_size, sharepoint_path, file_name, progress_callback)
 
         except Exception as e:
-            print(f"✗ Error uploading file: {str(e)}")
+            logger.error("✗ Error uploading file: %s", e)
             raise
 
-    def upload_file_from_memory(self, file_content, sharepoint_path, file_name):
+    def upload_file_from_memory(self, file_content, sharepoint_path, file_name, progress_callback=None):
         """
         Upload a file to SharePoint from memory (bytes)
 
@@ -369,6 +1444,8 @@ class SharePointManager:
             file_content: File content as bytes
             sharepoint_path: Folder path in SharePoint (e.g., 'folder' or '' for root)
             file_name: Name for the file in SharePoint
+            progress_callback: Optional callable called as progress_callback(bytes_sent, total_bytes)
+                               after each uploaded chunk
 
         Returns:
             Response from upload
@@ -377,33 +1454,125 @@ class SharePointManager:
             raise Exception("Drive ID not set. Call get_drive_id() first.")
 
         try:
-            # Build the upload URL
-            if sharepoint_path:
-                encoded_path = quote(f"{sharepoint_path}/{file_name}")
-            else:
-                encoded_path = quote(file_name)
+            return self._upload_stream(
+                BytesIO(file_content), len(file_content), sharepoint_path, file_name, progress_callback
+            )
 
-            url = self._get_drive_item_content_url(encoded_path)
+        except requests.exceptions.HTTPError as e:
+            logger.error("✗ Error uploading file: %s - %s", e.response.status_code, e.response.text)
+            raise
+        except Exception as e:
+            logger.error("✗ Error uploading file from memory: %s", e)
+            raise
 
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "Content-Type": "application/octet-stream"
-            }
+    def _upload_stream(self, content_stream, file_size, sharepoint_path, file_name, progress_callback=None):
+        """
+        Upload file content from a binary stream, in chunks for large files
+
+        Args:
+            content_stream: Readable binary file object positioned at the start of the content
+            file_size: Size of the content in bytes
+            sharepoint_path: Folder path in SharePoint (e.g., 'folder' or '' for root)
+            file_name: Name for the file in SharePoint
+            progress_callback: Optional callable called as progress_callback(bytes_sent, total_bytes)
+
+        Returns:
+            Uploaded item metadata
+        """
+        # Build the upload URL
+        if sharepoint_path:
+            encoded_path = _quote_path(f"{sharepoint_path}/{file_name}")
+        else:
+            encoded_path = _quote_path(file_name)
+
+        if file_size > self.SIMPLE_UPLOAD_LIMIT:
+            item = self._upload_large(content_stream, file_size, encoded_path, progress_callback)
+        else:
+            url = self._get_drive_item_content_url(encoded_path)
+            headers = dict(self._get_headers(), **{"Content-Type": "application/octet-stream"})
 
             # Upload file
-            response = requests.put(url, headers=headers, data=file_content)
+            response = self._session.put(url, headers=headers, data=content_stream)
             response.raise_for_status()
+            item = _parse_json(response)
 
-            print(f"✓ File uploaded successfully: {file_name}")
-            return response.json()
+            if progress_callback is not None:
+                progress_callback(file_size, file_size)
 
-        except requests.exceptions.HTTPError as e:
-            print(f"✗ Error uploading file: {e.response.status_code} - {e.response.text}")
-            raise
-        except Exception as e:
-            print(f"✗ Error uploading file from memory: {str(e)}")
+        logger.info("✓ File uploaded successfully: %s", file_name)
+        return item
+
+    def _upload_large(self, content_stream, file_size, encoded_path, progress_callback=None):
+        """
+        Upload a large file through a resumable upload session, one chunk in memory at a time
+
+        Args:
+            content_stream: Readable binary file object positioned at the start of the content
+            file_size: Size of the content in bytes
+            encoded_path: URL-encoded path of the file in SharePoint
+            progress_callback: Optional callable called as progress_callback(bytes_sent, total_bytes)
+
+        Returns:
+            Uploaded item metadata
+        """
+        # Replace an existing file, like the single-request upload does
+        url = self._get_drive_item_upload_session_url(encoded_path)
+        session_body = {"item": {"@microsoft.graph.conflictBehavior": "replace"}}
+        response = self._session.post(url, headers=self._get_headers(), json=session_body)
+        response.raise_for_status()
+
+        upload_url = _parse_json(response)["uploadUrl"]
+
+        # Ranges must be sent in order; the upload URL is pre-authenticated, so no Authorization header
+        stream_start = content_stream.tell()
+        resume_attempts = self.UPLOAD_RESUME_ATTEMPTS
+        try:
+            start = 0
+            while start < file_size:
+                chunk = content_stream.read(min(self.UPLOAD_CHUNK_SIZE, file_size - start))
+                if not chunk:
+                    raise Exception(f"Unexpected end of file after {start} of {file_size} bytes")
+
+                end = start + len(chunk) - 1
+                chunk_headers = {"Content-Range": f"bytes {start}-{end}/{file_size}"}
+                try:
+                    response = self._session.put(upload_url, headers=chunk_headers, data=chunk)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    if not resume_attempts:
+                        raise
+                    resume_attempts -= 1
+
+                    # The session survives a dropped connection; continue from what the server received
+                    start = self._get_upload_session_offset(upload_url)
+                    content_stream.seek(stream_start + start)
+                    logger.warning("✗ Resuming upload at byte %s of %s after: %s", start, file_size, e)
+                    continue
+
+                response.raise_for_status()
+                start = end + 1
+
+                if progress_callback is not None:
+                    progress_callback(start, file_size)
+        except BaseException:
+            # Release the partially uploaded session
+            try:
+                self._session.delete(upload_url)
+            except requests.exceptions.RequestException:
+                pass
             raise
 
+        # The final chunk's response holds the created item
+        return _parse_json(response)
+
+    def _get_upload_session_offset(self, upload_url):
+        """Return the first byte offset an upload session still expects"""
+        response = self._session.get(upload_url)
+        response.raise_for_status()
+
+        # Ranges are reported as "start-end" or an open-ended "start-"
+        next_ranges = _parse_json(response).get("nextExpectedRanges") or ["0-"]
+        return int(next_ranges[0].partition("-")[0])
+
     def _create_item_info_from_api_response(self, item, item_type="file"):
         """
         Helper method to create ItemInfo from API response
@@ -415,22 +1584,24 @@ class SharePointManager:
         Returns:
             ItemInfo object
         """
-        item_name = item.get("name", "")
-        parent_path = item.get("parentReference", {}).get("path", "")
+        # Called once per item of large listings, so look up the dict method only once
+        get = item.get
+        item_name = get("name", "")
+        parent_path = get("parentReference", {}).get("path", "")
 
         # Extract path after the colon (removes drive prefix)
         if parent_path:
-            path = parent_path.split(":")[-1] + "/" + item_name
+            path = parent_path.rpartition(":")[2] + "/" + item_name
         else:
             path = item_name
 
         return ItemInfo(
-            name=item_name,
-            path=path,
-            size=item.get("size", 0),
-            modified=item.get("lastModifiedDateTime", ""),
-            id=item.get("id", ""),
-            webUrl=item.get("webUrl", "")
+            item_name,
+            path,
+            get("size", 0),
+            get("lastModifiedDateTime", ""),
+            get("id", ""),
+            get("webUrl", "")
         )
 
     def search_files_by_suffix(self, suffix, folder_path=""):
@@ -438,7 +1609,7 @@ class SharePointManager:
         Search for files with a specific suffix/extension in SharePoint
 
         Args:
-            suffix: File suffix/extension to search for (e.g., '.csv', '.txt', 'pdf')
+            suffix: File suffix/extension, or tuple of them, to search for (e.g., '.csv', 'pdf' or ('.csv', '.tsv'))
             folder_path: Optional folder path to search in (e.g., 'folder' or '' for root)
 
         Returns:
@@ -448,37 +1619,19 @@ class SharePointManager:
             raise Exception("Drive ID not set. Call get_drive_id() first.")
 
         try:
-            # Ensure suffix starts with a dot
-            if suffix and not suffix.startswith('.'):
-                suffix = f".{suffix}"
-
-            # Build the search URL
-            url = self._get_drive_children_url(folder_path)
-
-            # Get all items in the folder
-            response = requests.get(url, headers=self._get_headers())
-            response.raise_for_status()
+            suffixes = self._normalize_suffixes(suffix)
 
-            items = response.json().get("value", [])
-
-            # Filter files by suffix
-            matching_files = []
-            for item in items:
-                # Check if it's a file (not a folder)
-                if "file" in item:
-                    file_name = item.get("name", "")
-                    if file_name.endswith(suffix):
-                        file_info = self._create_item_info_from_api_response(item)
-                        matching_files.append(file_info)
+            # Get the items in the folder, filtered server-side where supported
+            matching_files = list(self._iter_items_by_suffix(suffixes, folder_path, "file"))
 
-            print(f"✓ Found {len(matching_files)} file(s) with suffix '{suffix}'")
+            logger.info("✓ Found %s file(s) with suffix '%s'", len(matching_files), "', '".join(suffixes))
             return matching_files
 
         except requests.exceptions.HTTPError as e:
-            print(f"✗ Error searching files: {e.response.status_code} - {e.response.text}")
+            logger.error("✗ Error searching files: %s - %s", e.response.status_code, e.response.text)
             raise
         except Exception as e:
-            print(f"✗ Error searching files: {str(e)}")
+            logger.error("✗ Error searching files: %s", e)
             raise
 
     def search_files_by_suffix_recursive(self, suffix, folder_path=""):
@@ -486,7 +1639,7 @@ class SharePointManager:
         Recursively search for files with a specific suffix/extension in SharePoint
 
         Args:
-            suffix: File suffix/extension to search for (e.g., '.csv', '.txt', 'pdf')
+            suffix: File suffix/extension, or tuple of them, to search for (e.g., '.csv', 'pdf' or ('.csv', '.tsv'))
             folder_path: Optional folder path to start search from (e.g., 'folder' or '' for root)
 
         Returns:
@@ -496,48 +1649,21 @@ class SharePointManager:
             raise Exception("Drive ID not set. Call get_drive_id() first.")
 
         try:
-            # Ensure suffix starts with a dot
-            if suffix and not suffix.startswith('.'):
-                suffix = f".{suffix}"
-
-            matching_files = []
-
-            def search_folder_for_files(current_path):
-                """Recursively search through folders for files with matching suffix"""
-                # Build the URL for current folder
-                url = self._get_drive_children_url(current_path)
-
-                # Get all items in the current folder
-                response = requests.get(url, headers=self._get_headers())
-                response.raise_for_status()
-
-                items = response.json().get("value", [])
-
-                for item in items:
-                    # If it's a file, check suffix
-                    if "file" in item:
-                        file_name = item.get("name", "")
-                        if file_name.endswith(suffix):
-                            file_info = self._create_item_info_from_api_response(item)
-                            matching_files.append(file_info)
-
-                    # If it's a folder, search recursively
-                    elif "folder" in item:
-                        folder_name = item.get("name", "")
-                        new_path = f"{current_path}/{folder_name}" if current_path else folder_name
-                        search_folder_for_files(new_path)
+            suffixes = self._normalize_suffixes(suffix)
 
-            # Start the recursive search
-            search_folder_for_files(folder_path)
+            # Let Graph find candidates server-side, suffix and type are verified locally
+            matching_files = list(self._iter_items_by_suffix(suffixes, folder_path, "file", recursive=True))
 
-            print(f"✓ Found {len(matching_files)} file(s) with suffix '{suffix}' (recursive search)")
+            logger.info(
+                "✓ Found %s file(s) with suffix '%s' (recursive search)", len(matching_files), "', '".join(suffixes)
+            )
             return matching_files
 
         except requests.exceptions.HTTPError as e:
-            print(f"✗ Error searching files: {e.response.status_code} - {e.response.text}")
+            logger.error("✗ Error searching files: %s - %s", e.response.status_code, e.response.text)
             raise
         except Exception as e:
-            print(f"✗ Error searching files recursively: {str(e)}")
+            logger.error("✗ Error searching files recursively: %s", e)
             raise
 
     def search_folders_by_suffix(self, suffix, folder_path=""):
@@ -545,7 +1671,7 @@ class SharePointManager:
         Search for folders with a specific suffix in SharePoint (non-recursive)
 
         Args:
-            suffix: Folder suffix to search for (e.g., '.gdb', '.bundle')
+            suffix: Folder suffix, or tuple of them, to search for (e.g., '.gdb' or ('.gdb', '.bundle'))
             folder_path: Optional folder path to search in (e.g., 'folder' or '' for root)
 
         Returns:
@@ -555,37 +1681,19 @@ class SharePointManager:
             raise Exception("Drive ID not set. Call get_drive_id() first.")
 
         try:
-            # Ensure suffix starts with a dot
-            if suffix and not suffix.startswith('.'):
-                suffix = f".{suffix}"
+            suffixes = self._normalize_suffixes(suffix)
 
-            # Build the search URL
-            url = self._get_drive_children_url(folder_path)
+            # Get the items in the folder, filtered server-side where supported
+            matching_folders = list(self._iter_items_by_suffix(suffixes, folder_path, "folder"))
 
-            # Get all items in the folder
-            response = requests.get(url, headers=self._get_headers())
-            response.raise_for_status()
-
-            items = response.json().get("value", [])
-
-            # Filter folders by suffix
-            matching_folders = []
-            for item in items:
-                # Check if it's a folder (not a file)
-                if "folder" in item:
-                    folder_name = item.get("name", "")
-                    if folder_name.endswith(suffix):
-                        folder_info = self._create_item_info_from_api_response(item, "folder")
-                        matching_folders.append(folder_info)
-
-            print(f"✓ Found {len(matching_folders)} folder(s) with suffix '{suffix}'")
+            logger.info("✓ Found %s folder(s) with suffix '%s'", len(matching_folders), "', '".join(suffixes))
             return matching_folders
 
         except requests.exceptions.HTTPError as e:
-            print(f"✗ Error searching folders: {e.response.status_code} - {e.response.text}")
+            logger.error("✗ Error searching folders: %s - %s", e.response.status_code, e.response.text)
             raise
         except Exception as e:
-            print(f"✗ Error searching folders: {str(e)}")
+            logger.error("✗ Error searching folders: %s", e)
             raise
 
     def search_folders_by_suffix_recursive(self, suffix, folder_path=""):
@@ -593,7 +1701,7 @@ class SharePointManager:
         Recursively search for folders with a specific suffix in SharePoint
 
         Args:
-            suffix: Folder suffix to search for (e.g., '.gdb', '.bundle')
+            suffix: Folder suffix, or tuple of them, to search for (e.g., '.gdb' or ('.gdb', '.bundle'))
             folder_path: Optional folder path to start search from (e.g., 'folder' or '' for root)
 
         Returns:
@@ -603,52 +1711,218 @@ class SharePointManager:
             raise Exception("Drive ID not set. Call get_drive_id() first.")
 
         try:
-            # Ensure suffix starts with a dot
-            if suffix and not suffix.startswith('.'):
-                suffix = f".{suffix}"
-
-            matching_folders = []
-
-            def search_folder_for_folders(current_path):
-                """Recursively search through folders for folders with matching suffix"""
-                # Build the URL for current folder
-                url = self._get_drive_children_url(current_path)
-
-                # Get all items in the current folder
-                response = requests.get(url, headers=self._get_headers())
-                response.raise_for_status()
+            suffixes = self._normalize_suffixes(suffix)
 
-                items = response.json().get("value", [])
+            # Let Graph find candidates server-side, suffix and type are verified locally
+            matching_folders = list(self._iter_items_by_suffix(suffixes, folder_path, "folder", recursive=True))
 
-                for item in items:
-                    # If it's a folder, check suffix
-                    if "folder" in item:
-                        folder_name = item.get("name", "")
-                        if folder_name.endswith(suffix):
-                            folder_info = self._create_item_info_from_api_response(item, "folder")
-                            matching_folders.append(folder_info)
-
-                        # Continue searching in all subfolders regardless of match
-                        new_path = f"{current_path}/{folder_name}" if current_path else folder_name
-                        search_folder_for_folders(new_path)
-                    else:
-                        # If it's not a folder (it's a file), skip it
-                        pass
-
-            # Start the recursive search
-            search_folder_for_folders(folder_path)
-
-            print(f"✓ Found {len(matching_folders)} folder(s) with suffix '{suffix}' (recursive search)")
+            logger.info(
+                "✓ Found %s folder(s) with suffix '%s' (recursive search)", len(matching_folders), "', '".join(suffixes)
+            )
             return matching_folders
 
         except requests.exceptions.HTTPError as e:
-            print(f"✗ Error searching folders: {e.response.status_code} - {e.response.text}")
+            logger.error("✗ Error searching folders: %s - %s", e.response.status_code, e.response.text)
             raise
         except Exception as e:
-            print(f"✗ Error searching folders recursively: {str(e)}")
+            logger.error("✗ Error searching folders recursively: %s", e)
             raise
 
-    def download_folder(self, folder_path, local_directory=None):
+    def isearch_files_by_suffix(self, suffix, folder_path="", recursive=False):
+        """
+        Search for files with a specific suffix, yielding matches as they are found
+
+        Unlike search_files_by_suffix(), folder listings are fetched page by page as the matches are
+        consumed, so stopping early (e.g., with next() or itertools.islice()) skips the remaining
+        requests. Recursive searches answered by server-side drive search only page through the
+        candidate items; the folder walk used when search is unavailable is lazy like a listing.
+
+        Args:
+            suffix: File suffix/extension, or tuple of them, to search for (e.g., '.csv', 'pdf' or ('.csv', '.tsv'))
+            folder_path: Optional folder path to search in (e.g., 'folder' or '' for root)
+            recursive: Whether to include files in subfolders (default: False)
+
+        Returns:
+            Iterator of ItemInfo objects
+        """
+        if not self.drive_id:
+            raise Exception("Drive ID not set. Call get_drive_id() first.")
+
+        return self._iter_items_by_suffix(self._normalize_suffixes(suffix), folder_path, "file", recursive)
+
+    def isearch_folders_by_suffix(self, suffix, folder_path="", recursive=False):
+        """
+        Search for folders with a specific suffix, yielding matches as they are found
+
+        See isearch_files_by_suffix() for how pages are fetched.
+
+        Args:
+            suffix: Folder suffix, or tuple of them, to search for (e.g., '.gdb' or ('.gdb', '.bundle'))
+            folder_path: Optional folder path to search in (e.g., 'folder' or '' for root)
+            recursive: Whether to include folders in subfolders (default: False)
+
+        Returns:
+            Iterator of ItemInfo objects
+        """
+        if not self.drive_id:
+            raise Exception("Drive ID not set. Call get_drive_id() first.")
+
+        return self._iter_items_by_suffix(self._normalize_suffixes(suffix), folder_path, "folder", recursive)
+
+    def walk(self, folder_path=""):
+        """
+        Recursively walk a folder in SharePoint, yielding every file and folder below it once
+
+        Folders are listed level by level with batch requests. Use this to filter on several
+        conditions in a single pass instead of running one recursive search per condition.
+
+        Args:
+            folder_path: Optional folder path to start from (e.g., 'folder' or '' for root)
+
+        Returns:
+            Iterator of (item_type, ItemInfo) tuples, where item_type is 'file' or 'folder'
+        """
+        if not self.drive_id:
+            raise Exception("Drive ID not set. Call get_drive_id() first.")
+
+        return (
+            (item_type, self._create_item_info_from_api_response(item, item_type))
+            for item in self._walk_items(folder_path)
+            for item_type in ("file", "folder")
+            if item_type in item
+        )
+
+    def _iter_items_by_suffix(self, suffixes, folder_path, item_type, recursive=False):
+        """
+        Find files or folders with a suffix, yielding matches as the listing pages arrive
+
+        Recursive searches use server-side drive search, falling back to walking the folder
+        tree when search is unavailable.
+
+        Args:
+            suffixes: Tuple of case-folded name suffixes to match
+            folder_path: Folder path to search in ('' for root)
+            item_type: 'file' or 'folder', the type of items to match
+            recursive: Whether to include items in subfolders
+
+        Returns:
+            Iterator of ItemInfo objects for the matching items
+        """
+        if not recursive:
+            items = self._iter_children(folder_path, suffixes)
+        else:
+            items = self._search_drive_by_suffixes(suffixes, folder_path)
+            if items is None:
+                items = self._walk_items(folder_path)
+
+        return self._filter_items_by_suffix(items, suffixes, item_type)
+
+    def _normalize_suffixes(self, suffix):
+        """Turn a suffix or tuple of suffixes into a tuple of case-folded suffixes that start with a dot"""
+        if isinstance(suffix, str):
+            suffix = (suffix,)
+        return tuple((s if not s or s.startswith('.') else f".{s}").casefold() for s in suffix)
+
+    def _filter_items_by_suffix(self, items, suffixes, item_type):
+        """
+        Select the files or folders whose name ends with one of the suffixes, ignoring case like SharePoint does
+
+        Args:
+            items: Iterable of driveItem dictionaries
+            suffixes: Tuple of case-folded name suffixes to match
+            item_type: 'file' or 'folder', the type of items to match
+
+        Returns:
+            Iterator of ItemInfo objects for the matching items
+        """
+        return (
+            self._create_item_info_from_api_response(item, item_type)
+            for item in items
+            if item_type in item and item.get("name", "").casefold().endswith(suffixes)
+        )
+
+    def _search_drive_by_suffixes(self, suffixes, folder_path):
+        """
+        Search the drive server-side for candidates matching any of the suffixes
+
+        Args:
+            suffixes: Tuple of name suffixes (one search per suffix, run concurrently)
+            folder_path: Folder path to limit results to ('' for root)
+
+        Returns:
+            List of unique item dictionaries, or None if the folder tree has to be walked instead
+        """
+        # An empty suffix matches everything, which search can't express
+        if not all(suffixes):
+            return None
+
+        # The searches are independent, so several suffixes are searched concurrently
+        if len(suffixes) == 1:
+            search_results = [self._search_drive(suffixes[0])]
+        else:
+            search_results = list(self._io_pool.map(self._search_drive, suffixes))
+
+        items_by_id = {}
+        for items in search_results:
+            if items is None:
+                return None
+            for item in items:
+                # Search also matches file contents, so only look up paths for names that can match
+                if item.get("name", "").casefold().endswith(suffixes):
+                    items_by_id.setdefault(item.get("id", id(item)), item)
+
+        items = self._resolve_parent_paths(list(items_by_id.values()))
+        if items is None:
+            return None
+
+        scope = f"/{folder_path.strip('/')}" if folder_path.strip("/") else ""
+        if not scope:
+            return items
+
+        scope_prefix = f"{scope}/"
+        scoped_items = []
+        for item in items:
+            relative_parent = item["parentReference"]["path"].rpartition(":")[2]
+            if relative_parent == scope or relative_parent.startswith(scope_prefix):
+                scoped_items.append(item)
+        return scoped_items
+
+    def _walk_items(self, folder_path):
+        """
+        Walk the folder tree breadth-first, yielding every raw driveItem dictionary once
+
+        Args:
+            folder_path: Folder path to start from ('' for root)
+
+        Yields:
+            driveItem dictionaries
+        """
+        # Walk the tree level by level, listing up to GRAPH_BATCH_LIMIT folder pages per request
+        pending_pages = [(folder_path, self._get_children_batch_url(folder_path))]
+        while pending_pages:
+            batch_requests = [{"method": "GET", "url": page_url} for _, page_url in pending_pages]
+            batch_responses = self._graph_batch(batch_requests)
+
+            next_pages = []
+            for (current_path, _), sub_response in zip(pending_pages, batch_responses):
+                self._raise_for_batch_status(sub_response, f"listing folder '{current_path}'")
+
+                # Fetch the folder's next page together with the next level
+                next_link = sub_response["body"].get("@odata.nextLink")
+                if next_link:
+                    next_pages.append((current_path, self._to_relative_url(next_link)))
+
+                for item in sub_response["body"].get("value", []):
+                    yield item
+
+                    if "folder" in item:
+                        item_name = item.get("name", "")
+                        new_path = f"{current_path}/{item_name}" if current_path else item_name
+                        next_pages.append((new_path, self._get_children_batch_url(new_path)))
+
+            pending_pages = next_pages
+
+    def download_folder(self, folder_path, local_directory=None, progress_callback=None):
         """
         Recursively download an entire folder and its contents from SharePoint
 
@@ -657,11 +1931,263 @@ class SharePointManager:
         Args:
             folder_path: Path to the folder in SharePoint (e.g., 'folder_name' or 'parent/folder_name')
             local_directory: Local directory path to save the folder (defaults to folder name in current directory)
+            progress_callback: Optional callable called as progress_callback(files_done, files_total)
 
         Returns:
             Path to the downloaded folder
         """
-        return self.download_item(folder_path, local_directory)
+        return self.download_item(folder_path, local_directory, progress_callback)
+
+    def sync_folder(self, folder_path, local_directory=None):
+        """
+        Incrementally sync a folder from SharePoint to a local directory using a delta query
+
+        The first call downloads the whole folder. Later calls only fetch the items changed since
+        the previous sync: new and modified files are downloaded, moved items are moved locally and
+        deleted items are removed. The delta link and the drive's folder tree are stored in a
+        '.sp_delta' file inside the local directory.
+
+        Args:
+            folder_path: Path to the folder in SharePoint (e.g., 'folder_name' or '' for the whole drive)
+            local_directory: Local directory to sync into (defaults to folder name in current directory)
+
+        Returns:
+            Path to the local directory
+        """
+        if not self.drive_id:
+            raise Exception("Drive ID not set. Call get_drive_id() first.")
+
+        scope = folder_path.strip("/")
+        if local_directory is None:
+            local_directory = scope.rpartition("/")[2] or "root"
+        os.makedirs(local_directory, exist_ok=True)
+
+        logger.info("✓ Starting sync of folder: %s", folder_path)
+
+        # Only resume from a previous sync of the same folder
+        state_path = os.path.join(local_directory, self.DELTA_STATE_FILE)
+        state = _read_json_file(state_path)
+        if state.get("drive_id") != self.drive_id or state.get("folder") != scope:
+            state = {}
+
+        try:
+            changes, delta_link = self._get_drive_delta(state.get("delta_link"))
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code != 410:
+                raise
+            # The delta link expired on the server, start over with a full sync
+            logger.warning("✗ Sync state expired, running a full sync of folder: %s", folder_path)
+            state = {}
+            changes, delta_link = self._get_drive_delta(None)
+
+        # Delta items don't carry their path, so paths are rebuilt from the stored folder tree
+        # (item ID -> name and parent ID)
+        items = state.get("items", {})
+        root_id = state.get("root_id")
+        for item in changes:
+            if "root" in item:
+                root_id = item["id"]
+        if root_id is None:
+            root_id = self._get_root_item_id()
+
+        def get_local_path(item_id):
+            """Local path of an item in the stored tree, or None if it is outside the synced folder"""
+            names = []
+            while item_id != root_id:
+                entry = items.get(item_id)
+                if entry is None:
+                    return None
+                names.append(entry["name"])
+                item_id = entry["parent"]
+            drive_path = "/".join(reversed(names))
+
+            if scope:
+                if drive_path == scope:
+                    return local_directory
+                if not drive_path.startswith(f"{scope}/"):
+                    return None
+                drive_path = drive_path[len(scope) + 1:]
+            return os.path.join(local_directory, *drive_path.split("/")) if drive_path else local_directory
+
+        # Where the changed items were locally before this sync
+        previous_paths = {item["id"]: get_local_path(item["id"]) for item in changes if "root" not in item}
+
+        for item in changes:
+            if "root" in item:
+                continue
+            if "deleted" in item:
+                items.pop(item["id"], None)
+            else:
+                items[item["id"]] = {
+                    "name": item.get("name", ""),
+                    "parent": item.get("parentReference", {}).get("id"),
+                    "folder": "folder" in item
+                }
+
+        download_tasks = []
+        modified_times = {}
+        missing_download_urls = []
+        removed_count = 0
+
+        for item in changes:
+            if "root" in item:
+                continue
+
+            item_id = item["id"]
+            previous_path = previous_paths[item_id]
+            local_path = None if "deleted" in item else get_local_path(item_id)
+
+            if previous_path and previous_path not in (local_path, local_directory):
+                if "folder" in item and local_path and os.path.isdir(previous_path) and not os.path.exists(local_path):
+                    # Moved or renamed folder, keep its already synced contents
+                    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                    os.replace(previous_path, local_path)
+                elif self._remove_local_item(previous_path):
+                    removed_count += 1
+
+            if local_path is None:
+                # Only folders outside the synced folder are tracked, to rebuild paths
+                if not items.get(item_id, {}).get("folder"):
+                    items.pop(item_id, None)
+                continue
+
+            if "folder" in item:
+                os.makedirs(local_path, exist_ok=True)
+            elif "file" in item:
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                modified_time = self._parse_timestamp(item.get("lastModifiedDateTime"))
+                if self._is_synced_file(local_path, item.get("size"), modified_time):
+                    continue
+
+                modified_times[local_path] = modified_time
+                if item.get("size") == 0:
+                    # Empty file, create it locally without a download request
+                    open(local_path, 'wb').close()
+                    self._set_modified_time(local_path, modified_time)
+                    continue
+
+                download_url = item.get("@microsoft.graph.downloadUrl")
+                if not download_url:
+                    missing_download_urls.append((len(download_tasks), item_id))
+                download_tasks.append((download_url, local_path, item.get("size")))
+
+        # Delta pages don't always include download URLs, look those up in batches
+        if missing_download_urls:
+            download_urls = self._get_download_urls_by_ids([item_id for _, item_id in missing_download_urls])
+            for (task_index, _), download_url in zip(missing_download_urls, download_urls):
+                _, local_path, size = download_tasks[task_index]
+                download_tasks[task_index] = (download_url, local_path, size)
+
+        def set_modified_times(completed_tasks):
+            # A file dated like its SharePoint version is skipped by the next sync
+            for _, local_path, _ in completed_tasks:
+                self._set_modified_time(local_path, modified_times[local_path])
+
+        # On failure the sync state isn't saved, so the next sync retries the same changes
+        self._download_files(download_tasks, set_modified_times)
+
+        _write_json_file_atomic(state_path, {
+            "drive_id": self.drive_id,
+            "folder": scope,
+            "root_id": root_id,
+            "delta_link": delta_link,
+            "items": items
+        })
+
+        logger.info(
+            "✓ Folder synced to: %s (%s file(s) downloaded, %s item(s) removed)",
+            local_directory, len(download_tasks), removed_count
+        )
+        return local_directory
+
+    def _get_drive_delta(self, delta_link=None):
+        """
+        Get the items changed in the drive since a previous delta query, following pagination
+
+        Args:
+            delta_link: @odata.deltaLink of the previous query, or None to enumerate the whole drive
+
+        Returns:
+            Tuple of (list of changed driveItem dictionaries, new delta link)
+        """
+        if delta_link:
+            url, params = delta_link, None
+        else:
+            url = f"{self._get_drive_root_url()}/delta"
+            params = {"$select": f"{self.CHILDREN_SELECT},root,deleted"}
+
+        changes = []
+        while url:
+            response = self._session.get(url, headers=self._get_headers(), params=params)
+            response.raise_for_status()
+
+            page = _parse_json(response)
+            changes.extend(page.get("value", []))
+
+            # The last page carries the delta link for the next sync instead of a nextLink
+            delta_link = page.get("@odata.deltaLink", delta_link)
+            url = page.get("@odata.nextLink")
+            params = None
+
+        return changes, delta_link
+
+    def _get_root_item_id(self):
+        """Get the item ID of the drive root"""
+        response = self._session.get(self._get_drive_root_url(), headers=self._get_headers(), params={"$select": "id"})
+        response.raise_for_status()
+
+        return _parse_json(response).get("id")
+
+    def _get_download_urls_by_ids(self, item_ids):
+        """Get the download URLs of several files by item ID with batch requests"""
+        batch_requests = [
+            {
+                "method": "GET",
+                "url": f"/sites/{self.site_id}/drives/{self.drive_id}/items/{item_id}"
+                       "?$select=id,@microsoft.graph.downloadUrl"
+            }
+            for item_id in item_ids
+        ]
+
+        download_urls = []
+        for item_id, sub_response in zip(item_ids, self._graph_batch(batch_requests)):
+            self._raise_for_batch_status(sub_response, f"getting download URL for item '{item_id}'")
+
+            download_url = (sub_response.get("body") or {}).get("@microsoft.graph.downloadUrl")
+            if not download_url:
+                raise Exception(f"Could not retrieve download URL for item: {item_id}")
+            download_urls.append(download_url)
+
+        return download_urls
+
+    def _parse_timestamp(self, value):
+        """Convert a Graph ISO 8601 datetime to a POSIX timestamp (0 if missing)"""
+        if not value:
+            return 0
+        return datetime.fromisoformat(value).timestamp()
+
+    def _is_synced_file(self, local_file_path, size, modified_time):
+        """Check whether a local file matches a SharePoint file's size and is not older than it"""
+        return (
+            os.path.isfile(local_file_path)
+            and os.path.getsize(local_file_path) == size
+            and os.path.getmtime(local_file_path) >= modified_time
+        )
+
+    def _set_modified_time(self, local_file_path, modified_time):
+        """Date a local file like its SharePoint version"""
+        if modified_time:
+            os.utime(local_file_path, (modified_time, modified_time))
+
+    def _remove_local_item(self, local_path):
+        """Remove a local file or directory tree; returns whether anything was removed"""
+        if os.path.isdir(local_path):
+            shutil.rmtree(local_path)
+            return True
+        if os.path.isfile(local_path):
+            os.remove(local_path)
+            return True
+        return False
 
     def delete_item(self, item_path):
         """
@@ -681,26 +2207,27 @@ class SharePointManager:
 
         try:
             # Encode the item path
-            encoded_path = quote(item_path)
+            encoded_path = _quote_path(item_path)
 
             # Build the delete URL
             url = self._get_drive_item_url(encoded_path)
 
             # Delete item
-            response = requests.delete(url, headers=self._get_headers())
+            response = self._session.delete(url, headers=self._get_headers())
             response.raise_for_status()
 
-            print(f"✓ Item deleted successfully: {item_path}")
+            self._forget_item_path(item_path)
+            logger.info("✓ Item deleted successfully: %s", item_path)
             return True
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
-                print(f"✗ Item not found: {item_path}")
+                logger.error("✗ Item not found: %s", item_path)
             else:
-                print(f"✗ Error deleting item: {e.response.status_code} - {e.response.text}")
+                logger.error("✗ Error deleting item: %s - %s", e.response.status_code, e.response.text)
             raise
         except Exception as e:
-            print(f"✗ Error deleting item: {str(e)}")
+            logger.error("✗ Error deleting item: %s", e)
             raise
 
     def delete_file(self, file_path):
@@ -734,6 +2261,56 @@ class SharePointManager:
         """
         return self.delete_item(folder_path)
 
+    def delete_items(self, item_paths):
+        """
+        Delete several files or folders from SharePoint using batch requests
+
+        Args:
+            item_paths: Iterable of paths to files or folders in SharePoint
+                        (e.g., ['reports/a.csv', 'reports/old_folder'])
+
+        Returns:
+            True if all deletions were successful
+
+        Warning:
+            Deleting a folder is permanent and will delete all files and subfolders within.
+        """
+        if not self.drive_id:
+            raise Exception("Drive ID not set. Call get_drive_id() first.")
+
+        item_paths = list(dict.fromkeys(item_path.strip("/") for item_path in item_paths))
+        if not item_paths:
+            return True
+
+        # Items inside a folder that is deleted as well go with it; deleting them too would fail with 404
+        # or race the folder delete in the same batch
+        requested_paths = set(item_paths)
+        item_paths = [item_path for item_path in item_paths if not _has_ancestor_in(item_path, requested_paths)]
+
+        try:
+            batch_requests = [
+                {"method": "DELETE", "url": item_url}
+                for item_url in self._get_drive_item_batch_urls(item_paths)
+            ]
+
+            failed_deletes = []
+            for item_path, sub_response in zip(item_paths, self._graph_batch(batch_requests)):
+                try:
+                    self._raise_for_batch_status(sub_response, f"deleting item '{item_path}'")
+                    self._forget_item_path(item_path)
+                    logger.info("✓ Item deleted successfully: %s", item_path)
+                except Exception as e:
+                    failed_deletes.append(str(e))
+
+            if failed_deletes:
+                raise Exception("; ".join(failed_deletes))
+
+            return True
+
+        except Exception as e:
+            logger.error("✗ Error deleting items: %s", e)
+            raise
+
     def move_item(self, item_path, destination_folder_path):
         """
         Move a file or folder to a different location in SharePoint
@@ -749,11 +2326,8 @@ class SharePointManager:
             raise Exception("Drive ID not set. Call get_drive_id() first.")
 
         try:
-            # Get the item ID
-            item_id = self._get_item_id_by_path(item_path)
-
-            # Get the destination folder ID
-            destination_folder_id = self._get_item_id_by_path(destination_folder_path)
+            # Get the item ID and the destination folder ID in one round trip
+            item_id, destination_folder_id = self._get_item_ids_by_paths([item_path, destination_folder_path])
 
             # Build the move URL
             url = f"{self.GRAPH_API_BASE}/sites/{self.site_id}/drives/{self.drive_id}/items/{item_id}"
@@ -766,20 +2340,75 @@ class SharePointManager:
             }
 
             # Move item
-            response = requests.patch(url, headers=self._get_headers(), json=move_body)
+            response = self._session.patch(url, headers=self._get_headers(), json=move_body)
             response.raise_for_status()
 
-            print(f"✓ Item moved successfully: {item_path} → {destination_folder_path}")
+            self._forget_item_path(item_path)
+            logger.info("✓ Item moved successfully: %s → %s", item_path, destination_folder_path)
             return True
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
-                print("✗ Item or destination folder not found")
+                logger.error("✗ Item or destination folder not found")
             else:
-                print(f"✗ Error moving item: {e.response.status_code} - {e.response.text}")
+                logger.error("✗ Error moving item: %s - %s", e.response.status_code, e.response.text)
             raise
         except Exception as e:
-            print(f"✗ Error moving item: {str(e)}")
+            logger.error("✗ Error moving item: %s", e)
+            raise
+
+    def move_items(self, moves):
+        """
+        Move several files or folders in SharePoint using batch requests
+
+        All paths are resolved to item IDs with batched lookups (each distinct path once),
+        then the moves themselves are sent as batched PATCH requests.
+
+        Args:
+            moves: Iterable of (item_path, destination_folder_path) tuples
+                   (e.g., [('reports/a.csv', 'archive'), ('reports/b.csv', 'archive')])
+
+        Returns:
+            True if all moves were successful
+        """
+        if not self.drive_id:
+            raise Exception("Drive ID not set. Call get_drive_id() first.")
+
+        moves = list(moves)
+        if not moves:
+            return True
+
+        try:
+            # Resolve every distinct path once, shared destinations are only looked up once
+            unique_paths = list(dict.fromkeys(path for move in moves for path in move))
+            ids_by_path = dict(zip(unique_paths, self._get_item_ids_by_paths(unique_paths)))
+
+            batch_requests = [
+                {
+                    "method": "PATCH",
+                    "url": f"/sites/{self.site_id}/drives/{self.drive_id}/items/{ids_by_path[item_path]}",
+                    "headers": {"Content-Type": "application/json"},
+                    "body": {"parentReference": {"id": ids_by_path[destination_folder_path]}}
+                }
+                for item_path, destination_folder_path in moves
+            ]
+
+            failed_moves = []
+            for (item_path, destination_folder_path), sub_response in zip(moves, self._graph_batch(batch_requests)):
+                try:
+                    self._raise_for_batch_status(sub_response, f"moving item '{item_path}'")
+                    self._forget_item_path(item_path)
+                    logger.info("✓ Item moved successfully: %s → %s", item_path, destination_folder_path)
+                except Exception as e:
+                    failed_moves.append(str(e))
+
+            if failed_moves:
+                raise Exception("; ".join(failed_moves))
+
+            return True
+
+        except Exception as e:
+            logger.error("✗ Error moving items: %s", e)
             raise
 
     def move_file(self, file_path, destination_folder_path):
@@ -810,4 +2439,4 @@ class SharePointManager:
         Returns:
             True if move was successful
         """
-        return self.move_item(folder_path, destination_parent_folder_path)
\ No newline at end of file
+        return self.move_item(folder_path, destination_parent_folder_path)
@@ -1,101 +1,190 @@
 """
 Pytest configuration and shared fixtures for SharePoint Manager tests
 """
+import copy
 import pytest
+from collections import OrderedDict
 from unittest.mock import Mock, patch
 import sys
 import os
 
-# Add parent directory to path so we can import sharepointmanager.sharepoint
+# Add parent directory to path so we can import sharepointer.sharepoint
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dotenv import load_dotenv
 
-load_dotenv()
+@pytest.fixture(scope="session", autouse=True)
+def mock_msal():
+    """Patch the MSAL client app for the whole session so no test can reach Azure AD"""
+    with patch('sharepointer.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
+        mock_auth.return_value.acquire_token_for_client.return_value = {"access_token": "test-token"}
+        yield mock_auth
 
-# Configuration
-CLIENT_ID = os.getenv('CLIENT_ID')
-CLIENT_SECRET = os.getenv('CLIENT_SECRET')
-TENANT_ID = os.getenv('TENANT_ID')
 
-SITE_NAME = os.getenv('SITE_NAME')  # Your SharePoint tenant name (or full URL)
-SITE_PATH = os.getenv('SITE_PATH')  # Site path (e.g., '/sites/yoursite' or '' for root)
-DRIVE_NAME = os.getenv('DRIVE_NAME')  # Document library name (usually 'Documents')
+@pytest.fixture
+def msal_app(mock_msal):
+    """Fixture that provides a fresh mocked MSAL app for tests that customise token acquisition"""
+    default_app = mock_msal.return_value
 
+    app = Mock()
+    app.acquire_token_for_client.return_value = {"access_token": "test-token"}
+    mock_msal.reset_mock()
+    mock_msal.return_value = app
+    yield app
 
-@pytest.fixture
+    mock_msal.return_value = default_app
+
+
+@pytest.fixture(autouse=True)
+def stdlib_json(monkeypatch):
+    """Decode responses with response.json() so mocked responses don't need a raw body"""
+    monkeypatch.setattr('sharepointer.sharepoint.orjson', None)
+
+
+@pytest.fixture(scope="session")
 def config():
-    """Fixture that provides configuration data"""
+    """Fixture that provides configuration data (read-only, shared by all tests)"""
+    # Read .env once per session, only when a test actually needs the configuration
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
     return {
-        "CLIENT_ID": CLIENT_ID,
-        "CLIENT_SECRET": CLIENT_SECRET,
-        "TENANT_ID": TENANT_ID,
-        "SITE_NAME": SITE_NAME,
-        "SITE_PATH": SITE_PATH,
-        "DRIVE_NAME": DRIVE_NAME
+        "CLIENT_ID": os.getenv('CLIENT_ID'),
+        "CLIENT_SECRET": os.getenv('CLIENT_SECRET'),
+        "TENANT_ID": os.getenv('TENANT_ID'),
+        "SITE_NAME": os.getenv('SITE_NAME'),  # Your SharePoint tenant name (or full URL)
+        "SITE_PATH": os.getenv('SITE_PATH'),  # Site path (e.g., '/sites/yoursite' or '' for root)
+        "DRIVE_NAME": os.getenv('DRIVE_NAME')  # Document library name (usually 'Documents')
     }
 
 
+def build_mock_sharepoint_manager(config):
+    """Build a SharePointManager authenticated against the mocked MSAL app"""
+    from sharepointer.sharepoint import SharePointManager
+
+    manager = SharePointManager(
+        tenant_id=config["TENANT_ID"],
+        client_id=config["CLIENT_ID"],
+        client_secret=config["CLIENT_SECRET"],
+        site_name=config["SITE_NAME"]
+    )
+
+    # Set the required IDs
+    manager.site_id = "test-site-id"
+    manager.drive_id = "test-drive-id"
+
+    return manager
+
+
+@pytest.fixture(scope="session")
+def base_sharepoint_manager(config, mock_msal):
+    """Fixture that builds one mocked SharePointManager for the whole test session"""
+    manager = build_mock_sharepoint_manager(config)
+    yield manager
+    manager.close()
+
+
 @pytest.fixture
-def mock_sharepoint_manager(config):
-    """Fixture that provides a mocked SharePointManager instance"""
-    with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-        from sharepointer.sharepoint import SharePointManager
+def mock_sharepoint_manager(base_sharepoint_manager):
+    """Fixture that provides a mocked SharePointManager instance
+
+    A shallow copy of the session-wide manager: attributes a test assigns stay local to the
+    test, while the HTTP session and worker pools are shared. Use isolated_sharepoint_manager
+    for tests that close the manager.
+    """
+    manager = copy.copy(base_sharepoint_manager)
+
+    # Reset state that is mutated in place rather than reassigned
+    manager._item_ids = OrderedDict()
+    manager._drives_by_name = {}
 
-        # Configure the mock to return a proper access token
-        mock_app = Mock()
-        mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-        mock_auth.return_value = mock_app
+    manager.access_token = "test-token"
+    manager.site_id = "test-site-id"
+    manager.drive_id = "test-drive-id"
+    return manager
+
+
+@pytest.fixture
+def manager_missing(mock_sharepoint_manager, request):
+    """Fixture providing a mocked manager with one ID unset, named by indirect parametrization
 
-        manager = SharePointManager(
-            tenant_id=config["TENANT_ID"],
-            client_id=config["CLIENT_ID"],
-            client_secret=config["CLIENT_SECRET"],
-            site_name=config["SITE_NAME"]
-        )
+    Example:
+        @pytest.mark.parametrize("manager_missing", ["drive_id"], indirect=True)
+    """
+    setattr(mock_sharepoint_manager, request.param, None)
+    return mock_sharepoint_manager
 
-        # Set the required IDs
-        manager.site_id = "test-site-id"
-        manager.drive_id = "test-drive-id"
 
-        return manager
+@pytest.fixture
+def isolated_sharepoint_manager(config, mock_msal):
+    """Fixture that provides a mocked SharePointManager instance with its own session and pools"""
+    return build_mock_sharepoint_manager(config)
 
 
 @pytest.fixture
 def mock_requests_get():
-    """Fixture that provides a mock for requests.get"""
-    with patch('sharepointmanager.sharepoint.requests.get') as mock:
+    """Fixture that provides a mock for requests.Session.get"""
+    with patch('sharepointer.sharepoint.requests.Session.get') as mock:
         yield mock
 
 
 @pytest.fixture
 def mock_requests_post():
-    """Fixture that provides a mock for requests.post"""
-    with patch('sharepointmanager.sharepoint.requests.post') as mock:
+    """Fixture that provides a mock for requests.Session.post"""
+    with patch('sharepointer.sharepoint.requests.Session.post') as mock:
         yield mock
 
 
 @pytest.fixture
 def mock_requests_patch():
-    """Fixture that provides a mock for requests.patch"""
-    with patch('sharepointmanager.sharepoint.requests.patch') as mock:
+    """Fixture that provides a mock for requests.Session.patch"""
+    with patch('sharepointer.sharepoint.requests.Session.patch') as mock:
         yield mock
 
 
 @pytest.fixture
 def mock_requests_put():
-    """Fixture that provides a mock for requests.put"""
-    with patch('sharepointmanager.sharepoint.requests.put') as mock:
+    """Fixture that provides a mock for requests.Session.put"""
+    with patch('sharepointer.sharepoint.requests.Session.put') as mock:
         yield mock
 
 
 @pytest.fixture
 def mock_requests_delete():
-    """Fixture that provides a mock for requests.delete"""
-    with patch('sharepointmanager.sharepoint.requests.delete') as mock:
+    """Fixture that provides a mock for requests.Session.delete"""
+    with patch('sharepointer.sharepoint.requests.Session.delete') as mock:
         yield mock
 
 
+@pytest.fixture
+def make_response():
+    """Fixture providing a factory for successful JSON responses wrapping the given body"""
+    def factory(body=None):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = body
+        response.raise_for_status.return_value = None
+        return response
+    return factory
+
+
+@pytest.fixture
+def make_batch_response():
+    """Fixture providing a factory for $batch responses wrapping the given sub-response bodies"""
+    def factory(*bodies, status=200):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {
+            "responses": [
+                {"id": str(index), "status": status, "headers": {}, "body": body}
+                for index, body in enumerate(bodies)
+            ]
+        }
+        response.raise_for_status.return_value = None
+        return response
+    return factory
+
+
 @pytest.fixture
 def sample_file_info():
     """Fixture providing sample FileInfo data"""
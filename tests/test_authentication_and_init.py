@@ -1,8 +1,15 @@
 """
 Tests for SharePointManager initialization and authentication
 """
+import io
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pytest
+import requests
 from unittest.mock import Mock, patch
+from urllib3.response import HTTPResponse
+from sharepointer import sharepoint
 from sharepointer.sharepoint import SharePointManager
 
 
@@ -12,88 +19,178 @@ class TestInitialization:
     def test_manager_initialization(self, config):
         """Test basic manager initialization"""
         print(config)
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            # Configure the mock to return a proper access token
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {
-                "access_token": "test-token"
-            }
-            mock_auth.return_value = mock_app
+        manager = SharePointManager(
+            tenant_id=config["TENANT_ID"],
+            client_id=config["CLIENT_ID"],
+            client_secret=config["CLIENT_SECRET"],
+            site_name=config["SITE_NAME"]
+        )
 
-            manager = SharePointManager(
-                tenant_id=config["TENANT_ID"],
-                client_id=config["CLIENT_ID"],
-                client_secret=config["CLIENT_SECRET"],
-                site_name=config["SITE_NAME"]
-            )
-
-            assert manager.tenant_id == config["TENANT_ID"]
-            assert manager.client_id == config["CLIENT_ID"]
-            assert manager.client_secret == config["CLIENT_SECRET"]
+        assert manager.tenant_id == config["TENANT_ID"]
+        assert manager.client_id == config["CLIENT_ID"]
+        assert manager.client_secret == config["CLIENT_SECRET"]
 
     def test_site_name_formatting_without_domain(self):
         """Test site name is auto-formatted with domain"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
+        manager = SharePointManager(
+            tenant_id="test-tenant",
+            client_id="test-client",
+            client_secret="test-secret",
+            site_name="mysite"
+        )
 
-            manager = SharePointManager(
-                tenant_id="test-tenant",
-                client_id="test-client",
-                client_secret="test-secret",
-                site_name="mysite"
-            )
-
-            assert manager.site_name == "mysite.sharepoint.com"
+        assert manager.site_name == "mysite.sharepoint.com"
 
     def test_site_name_formatting_with_domain(self):
         """Test site name with domain is kept as-is"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
-
-            manager = SharePointManager(
-                tenant_id="test-tenant",
-                client_id="test-client",
-                client_secret="test-secret",
-                site_name="mysite.sharepoint.com"
-            )
+        manager = SharePointManager(
+            tenant_id="test-tenant",
+            client_id="test-client",
+            client_secret="test-secret",
+            site_name="mysite.sharepoint.com"
+        )
 
-            assert manager.site_name == "mysite.sharepoint.com"
+        assert manager.site_name == "mysite.sharepoint.com"
 
     def test_initial_ids_are_none(self, config):
         """Test that IDs are initially None"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
+        manager = SharePointManager(
+            tenant_id=config["TENANT_ID"],
+            client_id=config["CLIENT_ID"],
+            client_secret=config["CLIENT_SECRET"],
+            site_name=config["SITE_NAME"]
+        )
+
+        assert manager.site_id is None
+        assert manager.drive_id is None
+
+    def test_access_token_set_after_auth(self, config):
+        """Test that access token is set after authentication"""
+        manager = SharePointManager(
+            tenant_id=config["TENANT_ID"],
+            client_id=config["CLIENT_ID"],
+            client_secret=config["CLIENT_SECRET"],
+            site_name=config["SITE_NAME"]
+        )
+
+        assert manager.access_token == "test-token"
+
+    def test_session_pool_sized_for_workers(self, config):
+        """Test that the shared HTTP session can hold a connection per download and range worker"""
+        manager = SharePointManager(
+            tenant_id=config["TENANT_ID"],
+            client_id=config["CLIENT_ID"],
+            client_secret=config["CLIENT_SECRET"],
+            site_name=config["SITE_NAME"],
+            max_workers=32
+        )
+
+        adapter = manager._session.get_adapter("https://graph.microsoft.com/v1.0")
+        assert adapter._pool_maxsize == 64
+
+    def test_session_retries_throttled_requests(self, config):
+        """Test that the shared HTTP session retries throttled and unavailable responses"""
+        manager = SharePointManager(
+            tenant_id=config["TENANT_ID"],
+            client_id=config["CLIENT_ID"],
+            client_secret=config["CLIENT_SECRET"],
+            site_name=config["SITE_NAME"]
+        )
+
+        adapter = manager._session.get_adapter("https://graph.microsoft.com/v1.0")
+        retry = adapter.max_retries
+        assert set(retry.status_forcelist) == {429, 502, 503, 504}
+        assert retry.respect_retry_after_header is True
+        assert retry.raise_on_status is False
+        assert retry.is_retry("POST", 429)
+        assert retry.is_retry("GET", 504)
+        assert retry.is_retry("DELETE", 502)
+        assert not retry.is_retry("POST", 502)
+        assert not retry.is_retry("POST", 504)
+        assert not retry.is_retry("PATCH", 504)
+        # The idempotent-only statuses survive the copy urllib3 makes on every retry
+        assert not retry.increment("POST", "/v1.0/$batch").is_retry("POST", 504)
+        assert adapter._pool_block is True
+
+    def test_session_logs_retries(self, mock_sharepoint_manager, caplog):
+        """Test each retried request is logged without the URL's query string"""
+        retry = mock_sharepoint_manager._session.get_adapter("https://graph.microsoft.com/v1.0").max_retries
+        response = Mock(status=503)
+        response.get_redirect_location.return_value = None
+        response.headers = {}
+
+        with caplog.at_level(logging.WARNING, logger="sharepointer.sharepoint"):
+            new_retry = retry.increment("GET", "/download.aspx?tempauth=secret", response=response)
+
+        assert new_retry.total == retry.total - 1
+        assert "Retrying GET /download.aspx after 503" in caplog.text
+        assert "secret" not in caplog.text
+
+    def test_retry_on_429(self, isolated_sharepoint_manager):
+        """Test the mounted adapter retries a throttled Graph request after Retry-After"""
+        responses = [
+            HTTPResponse(body=io.BytesIO(b""), status=429, headers={"Retry-After": "0"}, preload_content=False),
+            HTTPResponse(body=io.BytesIO(b'{"id": "site-123"}'), status=200,
+                         headers={"Content-Type": "application/json"}, preload_content=False)
+        ]
+
+        with patch("urllib3.connectionpool.HTTPConnectionPool._make_request",
+                   side_effect=lambda *args, **kwargs: responses.pop(0)) as mock_make_request:
+            result = isolated_sharepoint_manager.get_site_id()
+
+        assert result == "site-123"
+        assert mock_make_request.call_count == 2
+
+
+class TestClose:
+    """Tests for releasing the HTTP session"""
+
+    def test_close_closes_session(self, isolated_sharepoint_manager):
+        """Test that close() closes the pooled session"""
+        with patch('sharepointer.sharepoint.requests.Session.close') as mock_close:
+            isolated_sharepoint_manager.close()
+
+            mock_close.assert_called_once()
+
+    def test_context_manager_closes_session(self, isolated_sharepoint_manager):
+        """Test that leaving a with block closes the pooled session"""
+        with patch('sharepointer.sharepoint.requests.Session.close') as mock_close:
+            with isolated_sharepoint_manager as manager:
+                assert manager is isolated_sharepoint_manager
+                mock_close.assert_not_called()
+
+            mock_close.assert_called_once()
 
+
+class TestPrewarmConnection:
+    """Tests for opening the Graph connection during authentication"""
+
+    def test_prewarm_connection_opens_graph_connection(self, config):
+        """Test that prewarming issues a request to Graph while authenticating"""
+        with patch('sharepointer.sharepoint.requests.Session.head') as mock_head:
             manager = SharePointManager(
                 tenant_id=config["TENANT_ID"],
                 client_id=config["CLIENT_ID"],
                 client_secret=config["CLIENT_SECRET"],
-                site_name=config["SITE_NAME"]
+                site_name=config["SITE_NAME"],
+                prewarm_connection=True
             )
 
-            assert manager.site_id is None
-            assert manager.drive_id is None
+            assert manager.access_token == "test-token"
+            mock_head.assert_called_once()
+            assert mock_head.call_args[0][0] == "https://graph.microsoft.com/v1.0/$metadata"
 
-    def test_access_token_set_after_auth(self, config):
-        """Test that access token is set after authentication"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {
-                "access_token": "test-token"
-            }
-            mock_auth.return_value = mock_app
+    def test_prewarm_connection_failure_is_ignored(self, config):
+        """Test that a failed prewarm request does not affect initialization"""
+        with patch('sharepointer.sharepoint.requests.Session.head') as mock_head:
+            mock_head.side_effect = requests.exceptions.ConnectionError("unreachable")
 
             manager = SharePointManager(
                 tenant_id=config["TENANT_ID"],
                 client_id=config["CLIENT_ID"],
                 client_secret=config["CLIENT_SECRET"],
-                site_name=config["SITE_NAME"]
+                site_name=config["SITE_NAME"],
+                prewarm_connection=True
             )
 
             assert manager.access_token == "test-token"
@@ -102,11 +199,9 @@ class TestInitialization:
 class TestGetSiteId:
     """Tests for get_site_id method"""
 
-    def test_get_site_id_success(self, mock_sharepoint_manager, mock_requests_get):
+    def test_get_site_id_success(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test getting site ID successfully"""
-        response = Mock()
-        response.json.return_value = {"id": "site-123"}
-        response.raise_for_status.return_value = None
+        response = make_response({"id": "site-123"})
 
         mock_requests_get.return_value = response
 
@@ -115,11 +210,9 @@ class TestGetSiteId:
         assert result == "site-123"
         assert mock_sharepoint_manager.site_id == "site-123"
 
-    def test_get_site_id_with_path(self, mock_sharepoint_manager, mock_requests_get):
+    def test_get_site_id_with_path(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test getting site ID with site path"""
-        response = Mock()
-        response.json.return_value = {"id": "site-456"}
-        response.raise_for_status.return_value = None
+        response = make_response({"id": "site-456"})
 
         mock_requests_get.return_value = response
 
@@ -131,15 +224,13 @@ class TestGetSiteId:
 class TestGetDriveId:
     """Tests for get_drive_id method"""
 
-    def test_get_drive_id_success(self, mock_sharepoint_manager, mock_requests_get):
+    def test_get_drive_id_success(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test getting drive ID successfully"""
-        response = Mock()
-        response.json.return_value = {
+        response = make_response({
             "value": [
                 {"name": "Documents", "id": "drive-123"}
             ]
-        }
-        response.raise_for_status.return_value = None
+        })
 
         mock_requests_get.return_value = response
 
@@ -148,15 +239,13 @@ class TestGetDriveId:
         assert result == "drive-123"
         assert mock_sharepoint_manager.drive_id == "drive-123"
 
-    def test_get_drive_id_default_name(self, mock_sharepoint_manager, mock_requests_get):
+    def test_get_drive_id_default_name(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test getting drive ID with default name"""
-        response = Mock()
-        response.json.return_value = {
+        response = make_response({
             "value": [
                 {"name": "Documenten", "id": "drive-456"}
             ]
-        }
-        response.raise_for_status.return_value = None
+        })
 
         mock_requests_get.return_value = response
 
@@ -164,45 +253,42 @@ class TestGetDriveId:
 
         assert result == "drive-456"
 
-    def test_get_drive_id_not_found(self, mock_sharepoint_manager, mock_requests_get):
+    def test_get_drive_id_not_found(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test getting non-existent drive"""
-        response = Mock()
-        response.json.return_value = {"value": []}
-        response.raise_for_status.return_value = None
+        response = make_response({"value": []})
 
         mock_requests_get.return_value = response
 
         with pytest.raises(Exception, match="No drives found"):
             mock_sharepoint_manager.get_drive_id("NonExistent")
 
-    def test_get_drive_id_without_site_id(self, config):
+    @pytest.mark.parametrize("manager_missing", ["site_id"], indirect=True)
+    def test_get_drive_id_without_site_id(self, manager_missing):
         """Test get_drive_id raises exception without site_id"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
+        with pytest.raises(Exception, match="Site ID not set"):
+            manager_missing.get_drive_id()
 
-            manager = SharePointManager(
-                tenant_id=config["TENANT_ID"],
-                client_id=config["CLIENT_ID"],
-                client_secret=config["CLIENT_SECRET"],
-                site_name=config["SITE_NAME"]
-            )
-            manager.access_token = "token"
-            manager.site_id = None
+    def test_get_drive_id_reuses_listed_drives(self, mock_sharepoint_manager, mock_requests_get, make_response):
+        """Test that another drive of the same site is found without listing the drives again"""
+        response = make_response({
+            "value": [
+                {"id": "drive-1", "name": "Documents"},
+                {"id": "drive-2", "name": "Archive"}
+            ]
+        })
+        mock_requests_get.return_value = response
 
-            with pytest.raises(Exception, match="Site ID not set"):
-                manager.get_drive_id()
+        assert mock_sharepoint_manager.get_drive_id("Documents") == "drive-1"
+        assert mock_sharepoint_manager.get_drive_id("Archive") == "drive-2"
+        mock_requests_get.assert_called_once()
 
-    def test_get_drive_id_fallback_to_first_drive(self, mock_sharepoint_manager, mock_requests_get):
+    def test_get_drive_id_fallback_to_first_drive(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test fallback to first drive if named drive not found"""
-        response = Mock()
-        response.json.return_value = {
+        response = make_response({
             "value": [
                 {"name": "Documenten", "id": "drive-789"}
             ]
-        }
-        response.raise_for_status.return_value = None
+        })
 
         mock_requests_get.return_value = response
 
@@ -211,6 +297,94 @@ class TestGetDriveId:
         assert result == "drive-789"
 
 
+class TestIdCache:
+    """Tests for the on-disk site and drive ID cache"""
+
+    def test_site_id_cached_between_runs(self, mock_sharepoint_manager, mock_requests_get, tmp_path, make_response):
+        """Test that a cached site ID is reused without a Graph request"""
+        response = make_response({"id": "site-123"})
+        mock_requests_get.return_value = response
+
+        mock_sharepoint_manager.cache_dir = str(tmp_path)
+        mock_sharepoint_manager.get_site_id("/sites/mysite")
+        mock_sharepoint_manager.site_id = None
+
+        result = mock_sharepoint_manager.get_site_id("/sites/mysite")
+
+        assert result == "site-123"
+        assert mock_requests_get.call_count == 1
+        assert (tmp_path / "ids.json").exists()
+
+    def test_drive_id_cached_between_runs(self, mock_sharepoint_manager, mock_requests_get, tmp_path, make_response):
+        """Test that a cached drive ID is reused without a Graph request"""
+        response = make_response({"value": [{"id": "drive-123", "name": "Documenten"}]})
+        mock_requests_get.return_value = response
+
+        mock_sharepoint_manager.cache_dir = str(tmp_path)
+        mock_sharepoint_manager.get_drive_id()
+        mock_sharepoint_manager.drive_id = None
+
+        result = mock_sharepoint_manager.get_drive_id()
+
+        assert result == "drive-123"
+        assert mock_requests_get.call_count == 1
+
+    def test_expired_cache_entry_is_refreshed(self, mock_sharepoint_manager, mock_requests_get, tmp_path,
+                                              make_response):
+        """Test that an expired cache entry triggers a new Graph request"""
+        response = make_response({"id": "site-123"})
+        mock_requests_get.return_value = response
+
+        mock_sharepoint_manager.cache_dir = str(tmp_path)
+        mock_sharepoint_manager.ID_CACHE_TTL = -1
+        mock_sharepoint_manager.get_site_id()
+        mock_sharepoint_manager.get_site_id()
+
+        assert mock_requests_get.call_count == 2
+
+    def test_clear_id_cache(self, mock_sharepoint_manager, mock_requests_get, tmp_path, make_response):
+        """Test that clearing the cache removes the cache file"""
+        response = make_response({"id": "site-123"})
+        mock_requests_get.return_value = response
+
+        mock_sharepoint_manager.cache_dir = str(tmp_path)
+        mock_sharepoint_manager.get_site_id()
+        mock_sharepoint_manager.clear_id_cache()
+
+        assert not (tmp_path / "ids.json").exists()
+
+    def test_concurrent_cache_writes_keep_all_entries(self, mock_sharepoint_manager, tmp_path):
+        """Test that concurrent writers don't overwrite each other's cache entries"""
+        mock_sharepoint_manager.cache_dir = str(tmp_path)
+        read_json_file = sharepoint._read_json_file
+
+        def slow_read(path):
+            # Widen the window between reading and rewriting the cache file
+            data = read_json_file(path)
+            time.sleep(0.1)
+            return data
+
+        with patch("sharepointer.sharepoint._read_json_file", side_effect=slow_read):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(lambda key: mock_sharepoint_manager._set_cached_id(key, f"id-{key}"),
+                                  ["site", "drive"]))
+
+        assert mock_sharepoint_manager._get_cached_id("site") == "id-site"
+        assert mock_sharepoint_manager._get_cached_id("drive") == "id-drive"
+
+    def test_no_cache_file_without_cache_dir(self, mock_sharepoint_manager, mock_requests_get, tmp_path, monkeypatch,
+                                             make_response):
+        """Test that nothing is written to disk when caching is disabled"""
+        response = make_response({"id": "site-123"})
+        mock_requests_get.return_value = response
+        monkeypatch.chdir(tmp_path)
+
+        mock_sharepoint_manager.get_site_id()
+
+        assert mock_sharepoint_manager.cache_dir is None
+        assert list(tmp_path.iterdir()) == []
+
+
 class TestHeaders:
     """Tests for header generation"""
 
@@ -229,19 +403,41 @@ class TestHeaders:
 
         assert "custom-token" in headers["Authorization"]
 
+    def test_headers_reused_until_token_changes(self, mock_sharepoint_manager):
+        """Test the headers dict is built once per access token"""
+        headers = mock_sharepoint_manager._get_headers()
+
+        assert mock_sharepoint_manager._get_headers() is headers
+
+        mock_sharepoint_manager.access_token = "new-token"
+
+        assert mock_sharepoint_manager._get_headers()["Authorization"] == "Bearer new-token"
+
 
 class TestAuthentication:
     """Tests for authentication process"""
 
-    def test_authentication_success(self, config):
+    def test_authentication_success(self, config, msal_app):
         """Test successful authentication"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {
-                "access_token": "auth-token"
-            }
-            mock_auth.return_value = mock_app
+        msal_app.acquire_token_for_client.return_value = {"access_token": "auth-token"}
+
+        manager = SharePointManager(
+            tenant_id=config["TENANT_ID"],
+            client_id=config["CLIENT_ID"],
+            client_secret=config["CLIENT_SECRET"],
+            site_name=config["SITE_NAME"]
+        )
+
+        assert manager.access_token is not None
+
+    def test_authentication_failure(self, config, msal_app):
+        """Test authentication failure"""
+        msal_app.acquire_token_for_client.return_value = {
+            "error": "invalid_client",
+            "error_description": "Client authentication failed"
+        }
 
+        with pytest.raises(Exception, match="Authentication failed"):
             manager = SharePointManager(
                 tenant_id=config["TENANT_ID"],
                 client_id=config["CLIENT_ID"],
@@ -249,43 +445,83 @@ class TestAuthentication:
                 site_name=config["SITE_NAME"]
             )
 
-            assert manager.access_token is not None
-
-    def test_authentication_failure(self, config):
-        """Test authentication failure"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {
-                "error": "invalid_client",
-                "error_description": "Client authentication failed"
-            }
-            mock_auth.return_value = mock_app
-
-            with pytest.raises(Exception, match="Authentication failed"):
-                manager = SharePointManager(
+    def test_authentication_with_msal_app(self, config, mock_msal, msal_app):
+        """Test that MSAL app is created correctly"""
+        manager = SharePointManager(
+            tenant_id=config["TENANT_ID"],
+            client_id=config["CLIENT_ID"],
+            client_secret=config["CLIENT_SECRET"],
+            site_name=config["SITE_NAME"]
+        )
+
+        # Verify MSAL was called with correct parameters
+        mock_msal.assert_called_once()
+        call_args = mock_msal.call_args
+        assert config["CLIENT_ID"] in call_args[1].values() or call_args[0][0] == config["CLIENT_ID"]
+
+    def test_token_refreshed_before_expiry(self, config, msal_app):
+        """Test that a token close to expiry is replaced before building request headers"""
+        msal_app.acquire_token_for_client.side_effect = [
+            {"access_token": "first-token", "expires_in": 60},
+            {"access_token": "second-token", "expires_in": 3600}
+        ]
+
+        manager = SharePointManager(
+            tenant_id=config["TENANT_ID"],
+            client_id=config["CLIENT_ID"],
+            client_secret=config["CLIENT_SECRET"],
+            site_name=config["SITE_NAME"]
+        )
+
+        assert manager.access_token == "first-token"
+        assert manager._get_headers()["Authorization"] == "Bearer second-token"
+        assert manager._get_headers()["Authorization"] == "Bearer second-token"
+        assert msal_app.acquire_token_for_client.call_count == 2
+
+    def test_concurrent_requests_share_token_refresh(self, config, msal_app):
+        """Test that workers noticing an expiring token at the same time refresh it only once"""
+        tokens = iter([
+            {"access_token": "first-token", "expires_in": 60},
+            {"access_token": "second-token", "expires_in": 3600}
+        ])
+
+        def acquire_token(scopes):
+            # Slow token endpoint, so concurrent callers overlap with the refresh
+            time.sleep(0.05)
+            return next(tokens)
+
+        msal_app.acquire_token_for_client.side_effect = acquire_token
+
+        manager = SharePointManager(
+            tenant_id=config["TENANT_ID"],
+            client_id=config["CLIENT_ID"],
+            client_secret=config["CLIENT_SECRET"],
+            site_name=config["SITE_NAME"]
+        )
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            headers = list(executor.map(lambda _: manager._get_headers(), range(10)))
+
+        assert {header["Authorization"] for header in headers} == {"Bearer second-token"}
+        assert msal_app.acquire_token_for_client.call_count == 2
+
+    def test_authentication_uses_on_disk_token_cache(self, config, mock_msal, msal_app, tmp_path):
+        """Test that the MSAL token cache is persisted to and loaded from cache_dir"""
+        with patch('sharepointer.sharepoint.msal.SerializableTokenCache') as mock_cache_class:
+            mock_cache = Mock()
+            mock_cache.has_state_changed = True
+            mock_cache.serialize.return_value = '{"AccessToken": {}}'
+            mock_cache_class.return_value = mock_cache
+
+            for _ in range(2):
+                SharePointManager(
                     tenant_id=config["TENANT_ID"],
                     client_id=config["CLIENT_ID"],
                     client_secret=config["CLIENT_SECRET"],
-                    site_name=config["SITE_NAME"]
+                    site_name=config["SITE_NAME"],
+                    cache_dir=str(tmp_path)
                 )
 
-    def test_authentication_with_msal_app(self, config):
-        """Test that MSAL app is created correctly"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {
-                "access_token": "token"
-            }
-            mock_auth.return_value = mock_app
-
-            manager = SharePointManager(
-                tenant_id=config["TENANT_ID"],
-                client_id=config["CLIENT_ID"],
-                client_secret=config["CLIENT_SECRET"],
-                site_name=config["SITE_NAME"]
-            )
-
-            # Verify MSAL was called with correct parameters
-            mock_auth.assert_called_once()
-            call_args = mock_auth.call_args
-            assert config["CLIENT_ID"] in call_args[1].values() or call_args[0][0] == config["CLIENT_ID"]
+            assert mock_msal.call_args[1]["token_cache"] is mock_cache
+            assert (tmp_path / "msal.bin").read_text() == '{"AccessToken": {}}'
+            mock_cache.deserialize.assert_called_once_with('{"AccessToken": {}}')
@@ -0,0 +1,224 @@
+"""
+Tests for Microsoft Graph JSON batching ($batch)
+"""
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import pytest
+from unittest.mock import Mock, patch
+from sharepointer.sharepoint import SharePointManager, _parse_retry_after
+
+
+class TestGraphBatch:
+    """Tests for _graph_batch helper"""
+
+    def test_graph_batch_returns_responses_in_request_order(self, mock_sharepoint_manager, mock_requests_post,
+                                                            make_response):
+        """Test sub-responses are matched to requests by id"""
+        response = make_response({
+            "responses": [
+                {"id": "1", "status": 200, "body": {"id": "second"}},
+                {"id": "0", "status": 200, "body": {"id": "first"}}
+            ]
+        })
+        mock_requests_post.return_value = response
+
+        results = mock_sharepoint_manager._graph_batch([
+            {"method": "GET", "url": "/first"},
+            {"method": "GET", "url": "/second"}
+        ])
+
+        assert [result["body"]["id"] for result in results] == ["first", "second"]
+        assert mock_requests_post.call_args[0][0] == "https://graph.microsoft.com/v1.0/$batch"
+
+    def test_graph_batch_splits_large_batches(self, mock_sharepoint_manager, mock_requests_post, make_response):
+        """Test that more than 20 requests are split into multiple batches"""
+        def fake_post(url, headers=None, json=None):
+            response = make_response({
+                "responses": [
+                    {"id": request["id"], "status": 200, "body": {}} for request in json["requests"]
+                ]
+            })
+            return response
+
+        mock_requests_post.side_effect = fake_post
+
+        results = mock_sharepoint_manager._graph_batch([{"method": "GET", "url": f"/item/{i}"} for i in range(45)])
+
+        assert len(results) == 45
+        assert mock_requests_post.call_count == 3
+        batch_sizes = [len(call[1]["json"]["requests"]) for call in mock_requests_post.call_args_list]
+        assert sorted(batch_sizes) == [5, 20, 20]
+
+    def test_graph_batch_sends_chunks_concurrently(self, mock_sharepoint_manager, mock_requests_post, make_response):
+        """Test that the chunks of a large batch are in flight at the same time"""
+        # Both chunks must reach the barrier before either can respond
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_post(url, headers=None, json=None):
+            barrier.wait()
+            return make_response({
+                "responses": [{"id": request["id"], "status": 200, "body": {}} for request in json["requests"]]
+            })
+
+        mock_requests_post.side_effect = fake_post
+
+        results = mock_sharepoint_manager._graph_batch([{"method": "GET", "url": f"/item/{i}"} for i in range(40)])
+
+        assert [result["id"] for result in results] == [str(i) for i in range(40)]
+
+    def test_graph_batch_from_io_worker_does_not_deadlock(self, config, mock_requests_post, make_response):
+        """Test a large batch sent from a busy I/O pool worker still gets its chunks dispatched"""
+        manager = SharePointManager(
+            tenant_id=config["TENANT_ID"],
+            client_id=config["CLIENT_ID"],
+            client_secret=config["CLIENT_SECRET"],
+            site_name=config["SITE_NAME"],
+            max_workers=1
+        )
+
+        def fake_post(url, headers=None, json=None):
+            return make_response({
+                "responses": [{"id": request["id"], "status": 200, "body": {}} for request in json["requests"]]
+            })
+
+        mock_requests_post.side_effect = fake_post
+
+        # The only I/O worker is busy sending the batch itself
+        future = manager._io_pool.submit(
+            manager._graph_batch, [{"method": "GET", "url": f"/item/{i}"} for i in range(40)]
+        )
+
+        assert len(future.result(timeout=5)) == 40
+        manager.close()
+
+    def test_graph_batch_retries_throttled_requests(self, mock_sharepoint_manager, mock_requests_post, make_response):
+        """Test that throttled sub-requests are retried after backing off"""
+        throttled_response = make_response({
+            "responses": [
+                {"id": "0", "status": 200, "body": {"id": "ok"}},
+                {"id": "1", "status": 429, "headers": {"Retry-After": "2"}, "body": {}}
+            ]
+        })
+
+        retry_response = make_response({"responses": [{"id": "1", "status": 200, "body": {"id": "retried"}}]})
+
+        mock_requests_post.side_effect = [throttled_response, retry_response]
+
+        with patch('sharepointer.sharepoint.time.sleep') as mock_sleep:
+            results = mock_sharepoint_manager._graph_batch([
+                {"method": "GET", "url": "/first"},
+                {"method": "GET", "url": "/second"}
+            ])
+
+        assert [result["body"]["id"] for result in results] == ["ok", "retried"]
+        assert mock_sleep.call_args[0][0] >= 2
+        retried_requests = mock_requests_post.call_args_list[1][1]["json"]["requests"]
+        assert [request["url"] for request in retried_requests] == ["/second"]
+
+    def test_graph_batch_accepts_http_date_retry_after(self, mock_sharepoint_manager, mock_requests_post,
+                                                       make_response):
+        """Test a Retry-After header in HTTP-date form is honored instead of failing to parse"""
+        retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        throttled_response = make_response({
+            "responses": [{"id": "0", "status": 503, "headers": {"Retry-After": retry_at}, "body": {}}]
+        })
+        retry_response = make_response({"responses": [{"id": "0", "status": 200, "body": {"id": "retried"}}]})
+        mock_requests_post.side_effect = [throttled_response, retry_response]
+
+        with patch('sharepointer.sharepoint.time.sleep') as mock_sleep:
+            results = mock_sharepoint_manager._graph_batch([{"method": "GET", "url": "/first"}])
+
+        assert results[0]["body"]["id"] == "retried"
+        assert 25 <= mock_sleep.call_args[0][0] <= 30
+
+    def test_parse_retry_after_invalid_value(self):
+        """Test an unparseable Retry-After falls back to the regular backoff"""
+        assert _parse_retry_after("soon") == 0
+        assert _parse_retry_after(None) == 0
+        assert _parse_retry_after("2") == 2
+
+    def test_graph_batch_missing_sub_response_raises(self, mock_sharepoint_manager, mock_requests_post,
+                                                     make_response):
+        """Test a $batch envelope lacking a sub-response raises a clear error naming the request"""
+        mock_requests_post.return_value = make_response({
+            "responses": [{"id": "0", "status": 200, "body": {"id": "ok"}}]
+        })
+
+        with pytest.raises(Exception, match="missing sub-responses for request ids: 1"):
+            mock_sharepoint_manager._graph_batch([
+                {"method": "GET", "url": "/first"},
+                {"method": "GET", "url": "/second"}
+            ])
+
+
+class TestParseJson:
+    """Tests for response JSON decoding"""
+
+    def test_parse_json_uses_orjson_when_installed(self, monkeypatch):
+        """Test orjson decodes the raw body when it is available"""
+        orjson = pytest.importorskip("orjson")
+        from sharepointer import sharepoint
+        monkeypatch.setattr(sharepoint, "orjson", orjson)
+
+        response = Mock()
+        response.content = b'{"value": [{"name": "data.csv"}]}'
+
+        assert sharepoint._parse_json(response) == {"value": [{"name": "data.csv"}]}
+        response.json.assert_not_called()
+
+    def test_parse_json_falls_back_to_response_json(self):
+        """Test response.json() is used without orjson"""
+        from sharepointer import sharepoint
+
+        response = Mock()
+        response.json.return_value = {"id": "item-123"}
+
+        assert sharepoint._parse_json(response) == {"id": "item-123"}
+
+
+class TestConnect:
+    """Tests for connect method"""
+
+    def test_connect_uses_single_batch(self, config, mock_sharepoint_manager, mock_requests_post, make_batch_response):
+        """Test site and drive IDs are retrieved with one request"""
+        mock_requests_post.return_value = make_batch_response(
+            {"id": "site-123"},
+            {"value": [{"name": "Documents", "id": "drive-123"}]}
+        )
+
+        result = mock_sharepoint_manager.connect("/sites/mysite", "Documents")
+
+        assert result == ("site-123", "drive-123")
+        assert mock_sharepoint_manager.site_id == "site-123"
+        assert mock_sharepoint_manager.drive_id == "drive-123"
+        mock_requests_post.assert_called_once()
+
+        sub_requests = mock_requests_post.call_args[1]["json"]["requests"]
+        assert sub_requests[0]["url"] == f"/sites/{config['SITE_NAME']}.sharepoint.com:/sites/mysite"
+        assert sub_requests[1]["url"] == f"/sites/{config['SITE_NAME']}.sharepoint.com:/sites/mysite:/drives"
+
+    def test_connect_site_not_found(self, mock_sharepoint_manager, mock_requests_post, make_batch_response):
+        """Test connect raises exception when the site lookup fails"""
+        mock_requests_post.return_value = make_batch_response(
+            {"error": {"message": "Site not found"}},
+            {"error": {"message": "Site not found"}},
+            status=404
+        )
+
+        with pytest.raises(Exception, match="Site not found"):
+            mock_sharepoint_manager.connect("/sites/missing")
+
+    def test_connect_uses_cached_ids(self, mock_sharepoint_manager, mock_requests_post, make_batch_response, tmp_path):
+        """Test a second connect is served from the on-disk ID cache"""
+        mock_requests_post.return_value = make_batch_response(
+            {"id": "site-123"},
+            {"value": [{"name": "Documents", "id": "drive-123"}]}
+        )
+        mock_sharepoint_manager.cache_dir = str(tmp_path)
+
+        mock_sharepoint_manager.connect("/sites/mysite", "Documents")
+        result = mock_sharepoint_manager.connect("/sites/mysite", "Documents")
+
+        assert result == ("site-123", "drive-123")
+        mock_requests_post.assert_called_once()
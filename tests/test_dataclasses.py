@@ -70,3 +70,18 @@ class TestFileInfo:
         assert "(" in file_info.name
         assert "[" in file_info.name
 
+    def test_file_info_has_no_instance_dict(self):
+        """Test ItemInfo uses slots instead of a per-instance __dict__"""
+        file_info = ItemInfo("a.txt", "a.txt", 1, "2024-01-01T00:00:00Z", "file-1", "https://sharepoint.com/a")
+
+        assert not hasattr(file_info, "__dict__")
+
+    def test_total_size(self):
+        """Test summing the sizes of several items"""
+        items = [
+            ItemInfo("a.txt", "a.txt", 1024, "2024-01-01T00:00:00Z", "file-1", "https://sharepoint.com/a"),
+            ItemInfo("b.txt", "b.txt", 2048, "2024-01-01T00:00:00Z", "file-2", "https://sharepoint.com/b")
+        ]
+
+        assert ItemInfo.total_size(items) == 3072
+        assert ItemInfo.total_size([]) == 0
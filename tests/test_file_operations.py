@@ -4,58 +4,111 @@ Tests for file operations (download, upload, delete, move)
 import pytest
 from unittest.mock import Mock, patch
 from io import BytesIO
-from requests.exceptions import HTTPError
-from sharepointer.sharepoint import SharePointManager
+from requests.exceptions import ConnectionError, HTTPError
 
 
 class TestDownloadFile:
     """Tests for download_file method"""
 
-    def test_download_file_to_memory(self, mock_sharepoint_manager, mock_requests_get):
-        """Test downloading file to memory"""
+    def test_download_item_file_to_memory(self, mock_sharepoint_manager, mock_requests_get, make_response):
+        """Test downloading a file to memory through the metadata lookup"""
         # Mock the metadata response
-        metadata_response = Mock()
-        metadata_response.json.return_value = {
+        metadata_response = make_response({
             "id": "file-123",
             "file": {},
             "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/file"
-        }
-        metadata_response.raise_for_status.return_value = None
+        })
 
         # Mock the download response
         download_response = Mock()
-        download_response.content = b"file content"
+        download_response.iter_content.return_value = [b"file ", b"content"]
         download_response.raise_for_status.return_value = None
 
         mock_requests_get.side_effect = [metadata_response, download_response]
 
-        result = mock_sharepoint_manager.download_file("test.txt")
+        result = mock_sharepoint_manager.download_item("test.txt")
 
         assert isinstance(result, BytesIO)
         assert result.getvalue() == b"file content"
-
-    def test_download_file_to_local_path(self, mock_sharepoint_manager, mock_requests_get):
-        """Test downloading file to local path"""
+        assert result.tell() == 0
+        assert mock_requests_get.call_args_list[1][0][0] == "https://download.sharepoint.com/file"
+        assert mock_requests_get.call_args_list[1][1]["stream"] is True
+        download_response.close.assert_called_once()
+
+    def test_download_item_file_to_local_path(self, mock_sharepoint_manager, mock_requests_get, tmp_path,
+                                              make_response):
+        """Test downloading a file to a local path through the metadata lookup"""
         # Mock the metadata response
-        metadata_response = Mock()
-        metadata_response.json.return_value = {
+        metadata_response = make_response({
             "file": {},
             "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/file"
-        }
-        metadata_response.raise_for_status.return_value = None
+        })
 
         # Mock the download response
         download_response = Mock()
-        download_response.content = b"file content"
+        download_response.headers = {}
+        download_response.iter_content.return_value = [b"file ", b"content"]
         download_response.raise_for_status.return_value = None
 
         mock_requests_get.side_effect = [metadata_response, download_response]
 
-        with patch('builtins.open', create=True) as mock_file:
-            result = mock_sharepoint_manager.download_file("test.txt", "/tmp/test.txt")
+        local_path = str(tmp_path / "test.txt")
+        result = mock_sharepoint_manager.download_item("test.txt", local_path)
+
+        assert result == local_path
+        assert (tmp_path / "test.txt").read_bytes() == b"file content"
+        assert mock_requests_get.call_args_list[1][1]["stream"] is True
+        download_response.close.assert_called_once()
 
-            assert result == "/tmp/test.txt"
-            mock_file.assert_called_once_with("/tmp/test.txt", 'wb')
+    def test_download_file_to_memory(self, mock_sharepoint_manager, mock_requests_get):
+        """Test download_file fetches the content with a single request"""
+        download_response = Mock()
+        download_response.iter_content.return_value = [b"file ", b"content"]
+        download_response.raise_for_status.return_value = None
+
+        mock_requests_get.return_value = download_response
+
+        result = mock_sharepoint_manager.download_file("folder/test.txt")
+
+        assert result.getvalue() == b"file content"
+        assert mock_requests_get.call_count == 1
+        url = mock_requests_get.call_args[0][0]
+        assert url.endswith("root:/folder/test.txt:/content")
+        assert mock_requests_get.call_args[1]["headers"] == {"Authorization": "Bearer test-token"}
+        assert mock_requests_get.call_args[1]["stream"] is True
+
+    def test_download_file_to_local_path(self, mock_sharepoint_manager, mock_requests_get, tmp_path):
+        """Test download_file streams the content to a local file with a single request"""
+        download_response = Mock()
+        download_response.headers = {}
+        download_response.iter_content.return_value = [b"file ", b"content"]
+        download_response.raise_for_status.return_value = None
+
+        mock_requests_get.return_value = download_response
+
+        local_path = str(tmp_path / "test.txt")
+        result = mock_sharepoint_manager.download_file("test.txt", local_path)
+
+        assert result == local_path
+        assert (tmp_path / "test.txt").read_bytes() == b"file content"
+        assert mock_requests_get.call_count == 1
+        assert not (tmp_path / "test.txt.part").exists()
+
+    def test_download_file_falls_back_for_folders(self, mock_sharepoint_manager, mock_requests_get, tmp_path,
+                                                  make_response):
+        """Test a path without downloadable content is downloaded through the metadata lookup"""
+        content_response = Mock()
+        content_response.status_code = 404
+        content_response.raise_for_status.side_effect = HTTPError(response=content_response)
+
+        metadata_response = make_response({"folder": {}, "children": []})
+
+        mock_requests_get.side_effect = [content_response, metadata_response]
+
+        result = mock_sharepoint_manager.download_file("folder", str(tmp_path))
+
+        assert result == str(tmp_path)
+        assert mock_requests_get.call_args_list[1][1]["params"] == {"$expand": "children"}
 
     def test_download_file_not_found(self, mock_sharepoint_manager, mock_requests_get):
         """Test downloading non-existent file"""
@@ -69,35 +122,19 @@ class TestDownloadFile:
         with pytest.raises(HTTPError):
             mock_sharepoint_manager.download_file("nonexistent.txt")
 
-    def test_download_file_without_drive_id(self, config):
+    @pytest.mark.parametrize("manager_missing", ["drive_id"], indirect=True)
+    def test_download_file_without_drive_id(self, manager_missing):
         """Test download_file raises exception without drive_id"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
-
-            manager = SharePointManager(
-                tenant_id=config["TENANT_ID"],
-                client_id=config["CLIENT_ID"],
-                client_secret=config["CLIENT_SECRET"],
-                site_name=config["SITE_NAME"]
-            )
-            manager.access_token = "token"
-            manager.site_id = "site-id"
-            manager.drive_id = None
-
-            with pytest.raises(Exception, match="Drive ID not set"):
-                manager.download_file("test.txt")
+        with pytest.raises(Exception, match="Drive ID not set"):
+            manager_missing.download_file("test.txt")
 
 
 class TestUploadFile:
     """Tests for upload_file and upload_file_from_memory methods"""
 
-    def test_upload_file_from_memory(self, mock_sharepoint_manager, mock_requests_put):
+    def test_upload_file_from_memory(self, mock_sharepoint_manager, mock_requests_put, make_response):
         """Test uploading file from memory"""
-        response = Mock()
-        response.json.return_value = {"id": "file-123", "name": "test.txt"}
-        response.raise_for_status.return_value = None
+        response = make_response({"id": "file-123", "name": "test.txt"})
 
         mock_requests_put.return_value = response
 
@@ -107,11 +144,9 @@ class TestUploadFile:
         assert result["id"] == "file-123"
         mock_requests_put.assert_called_once()
 
-    def test_upload_file_to_root(self, mock_sharepoint_manager, mock_requests_put):
+    def test_upload_file_to_root(self, mock_sharepoint_manager, mock_requests_put, make_response):
         """Test uploading file to root folder"""
-        response = Mock()
-        response.json.return_value = {"id": "file-456"}
-        response.raise_for_status.return_value = None
+        response = make_response({"id": "file-456"})
 
         mock_requests_put.return_value = response
 
@@ -122,28 +157,131 @@ class TestUploadFile:
         call_args = mock_requests_put.call_args
         assert "test.txt" in call_args[0][0] or "test.txt" in str(call_args)
 
-    def test_upload_file_from_path(self, mock_sharepoint_manager, mock_requests_put):
+    def test_upload_file_from_path(self, mock_sharepoint_manager, mock_requests_put, make_response):
         """Test uploading file from local path"""
-        response = Mock()
-        response.json.return_value = {"id": "file-789"}
-        response.raise_for_status.return_value = None
+        response = make_response({"id": "file-789"})
 
         mock_requests_put.return_value = response
 
-        with patch('builtins.open', create=True) as mock_file:
+        with patch('builtins.open', create=True) as mock_file, \
+                patch('sharepointer.sharepoint.os.path.getsize', return_value=7):
             mock_file.return_value.__enter__.return_value.read.return_value = b"content"
             mock_sharepoint_manager.upload_file("/local/path/test.txt", "folder")
 
             mock_requests_put.assert_called_once()
 
+    def test_upload_file_streams_from_disk(self, mock_sharepoint_manager, mock_requests_put, tmp_path, make_response):
+        """Test small files are passed to the request as a file object instead of bytes"""
+        local_file = tmp_path / "test.txt"
+        local_file.write_bytes(b"content")
+
+        response = make_response({"id": "file-789"})
+        mock_requests_put.return_value = response
+
+        mock_sharepoint_manager.upload_file(str(local_file), "folder")
+
+        data = mock_requests_put.call_args[1]["data"]
+        assert not isinstance(data, bytes)
+        assert mock_requests_put.call_args[0][0].endswith("root:/folder/test.txt:/content")
+
+    def test_upload_large_file_in_chunks(self, mock_sharepoint_manager, mock_requests_post, mock_requests_put,
+                                         tmp_path, make_response):
+        """Test large files are uploaded through an upload session in sequential chunks"""
+        mock_sharepoint_manager.SIMPLE_UPLOAD_LIMIT = 4
+        mock_sharepoint_manager.UPLOAD_CHUNK_SIZE = 4
+        local_file = tmp_path / "large.csv"
+        local_file.write_bytes(b"0123456789")
+
+        session_response = make_response({"uploadUrl": "https://upload.sharepoint.com/session"})
+        mock_requests_post.return_value = session_response
+
+        chunk_response = make_response({"id": "file-123", "name": "large.csv"})
+        mock_requests_put.return_value = chunk_response
+
+        result = mock_sharepoint_manager.upload_file(str(local_file), "folder")
+
+        assert result["id"] == "file-123"
+        assert mock_requests_post.call_args[0][0].endswith("root:/folder/large.csv:/createUploadSession")
+
+        chunk_calls = mock_requests_put.call_args_list
+        assert [call[0][0] for call in chunk_calls] == ["https://upload.sharepoint.com/session"] * 3
+        assert [call[1]["headers"]["Content-Range"] for call in chunk_calls] == [
+            "bytes 0-3/10", "bytes 4-7/10", "bytes 8-9/10"
+        ]
+        assert [call[1]["data"] for call in chunk_calls] == [b"0123", b"4567", b"89"]
+        assert all("Authorization" not in call[1]["headers"] for call in chunk_calls)
+
+    def test_upload_large_file_reports_progress(self, mock_sharepoint_manager, mock_requests_post, mock_requests_put,
+                                                make_response):
+        """Test the progress callback is called with the bytes sent after each chunk"""
+        mock_sharepoint_manager.SIMPLE_UPLOAD_LIMIT = 4
+        mock_sharepoint_manager.UPLOAD_CHUNK_SIZE = 4
+
+        session_response = make_response({"uploadUrl": "https://upload.sharepoint.com/session"})
+        mock_requests_post.return_value = session_response
+
+        chunk_response = make_response({"id": "file-123"})
+        mock_requests_put.return_value = chunk_response
+
+        progress = []
+        mock_sharepoint_manager.upload_file_from_memory(
+            b"0123456789", "", "large.csv", progress_callback=lambda sent, total: progress.append((sent, total))
+        )
+
+        assert progress == [(4, 10), (8, 10), (10, 10)]
+
+    def test_upload_large_file_resumes_after_connection_error(self, mock_sharepoint_manager, mock_requests_post,
+                                                              mock_requests_put, mock_requests_get, make_response):
+        """Test a dropped chunk upload resumes from the offset the upload session expects next"""
+        mock_sharepoint_manager.SIMPLE_UPLOAD_LIMIT = 4
+        mock_sharepoint_manager.UPLOAD_CHUNK_SIZE = 4
+
+        session_response = make_response({"uploadUrl": "https://upload.sharepoint.com/session"})
+        mock_requests_post.return_value = session_response
+
+        chunk_response = make_response({"id": "file-123"})
+        mock_requests_put.side_effect = [chunk_response, ConnectionError("connection reset"), chunk_response]
+
+        # The server received the second chunk before the connection dropped
+        status_response = make_response({"nextExpectedRanges": ["6-"]})
+        mock_requests_get.return_value = status_response
+
+        result = mock_sharepoint_manager.upload_file_from_memory(b"0123456789", "", "large.csv")
+
+        assert result["id"] == "file-123"
+        mock_requests_get.assert_called_once_with("https://upload.sharepoint.com/session")
+        chunk_calls = mock_requests_put.call_args_list
+        assert [call[1]["headers"]["Content-Range"] for call in chunk_calls] == [
+            "bytes 0-3/10", "bytes 4-7/10", "bytes 6-9/10"
+        ]
+        assert chunk_calls[2][1]["data"] == b"6789"
+
+    def test_upload_large_file_cancels_session_on_failure(self, mock_sharepoint_manager, mock_requests_post,
+                                                          mock_requests_put, mock_requests_delete, make_response):
+        """Test a failed chunk deletes the upload session"""
+        mock_sharepoint_manager.SIMPLE_UPLOAD_LIMIT = 4
+
+        session_response = make_response({"uploadUrl": "https://upload.sharepoint.com/session"})
+        mock_requests_post.return_value = session_response
+
+        chunk_response = Mock()
+        chunk_response.status_code = 500
+        chunk_response.text = "Server Error"
+        chunk_response.raise_for_status.side_effect = HTTPError(response=chunk_response)
+        mock_requests_put.return_value = chunk_response
+
+        with pytest.raises(HTTPError):
+            mock_sharepoint_manager.upload_file_from_memory(b"0123456789", "", "large.csv")
+
+        mock_requests_delete.assert_called_once_with("https://upload.sharepoint.com/session")
+
 
 class TestDeleteFile:
     """Tests for delete_file method"""
 
-    def test_delete_file_success(self, mock_sharepoint_manager, mock_requests_delete):
+    def test_delete_file_success(self, mock_sharepoint_manager, mock_requests_delete, make_response):
         """Test successful file deletion"""
-        response = Mock()
-        response.raise_for_status.return_value = None
+        response = make_response()
 
         mock_requests_delete.return_value = response
 
@@ -164,83 +302,165 @@ class TestDeleteFile:
         with pytest.raises(HTTPError):
             mock_sharepoint_manager.delete_file("nonexistent.txt")
 
-    def test_delete_file_without_drive_id(self, config):
+    @pytest.mark.parametrize("manager_missing", ["drive_id"], indirect=True)
+    def test_delete_file_without_drive_id(self, manager_missing):
         """Test delete_file raises exception without drive_id"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
+        with pytest.raises(Exception, match="Drive ID not set"):
+            manager_missing.delete_file("test.txt")
+
+
+class TestDeleteItems:
+    """Tests for delete_items method"""
+
+    def test_delete_items_in_one_batch(self, mock_sharepoint_manager, mock_requests_post, make_batch_response):
+        """Test bulk deletes are sent as DELETE sub-requests of a single batch"""
+        mock_sharepoint_manager._remember_item_id("reports/a.csv", "file-a")
+        mock_requests_post.return_value = make_batch_response({}, {}, status=204)
+
+        result = mock_sharepoint_manager.delete_items(["reports/a.csv", "reports/b.csv", "reports/a.csv"])
+
+        assert result is True
+        mock_requests_post.assert_called_once()
+        deletes = mock_requests_post.call_args[1]["json"]["requests"]
+        assert [delete["method"] for delete in deletes] == ["DELETE", "DELETE"]
+        assert deletes[0]["url"].endswith("root:/reports/a.csv")
+        assert deletes[1]["url"].endswith("root:/reports/b.csv")
+        assert mock_sharepoint_manager._get_remembered_item_id("reports/a.csv") is None
+
+    def test_delete_items_reports_failed_deletes(self, mock_sharepoint_manager, mock_requests_post,
+                                                 make_batch_response):
+        """Test a failed sub-request raises an exception naming the item"""
+        mock_requests_post.return_value = make_batch_response({"error": {"message": "Item not found"}}, status=404)
+
+        with pytest.raises(Exception, match="deleting item 'missing.csv': 404 - Item not found"):
+            mock_sharepoint_manager.delete_items(["missing.csv"])
+
+    def test_delete_items_skips_items_inside_deleted_folders(self, mock_sharepoint_manager, mock_requests_post,
+                                                           make_batch_response):
+        """Test an item is not deleted separately when a folder above it is deleted too"""
+        mock_sharepoint_manager._remember_item_id("a/b/c.csv", "file-c")
+        mock_requests_post.return_value = make_batch_response({}, {}, status=204)
+
+        result = mock_sharepoint_manager.delete_items(["a/b/c.csv", "a/b", "/a/", "ab.csv"])
 
-            manager = SharePointManager(
-                tenant_id=config["TENANT_ID"],
-                client_id=config["CLIENT_ID"],
-                client_secret=config["CLIENT_SECRET"],
-                site_name=config["SITE_NAME"]
-            )
-            manager.access_token = "token"
-            manager.site_id = "site-id"
-            manager.drive_id = None
+        assert result is True
+        deletes = mock_requests_post.call_args[1]["json"]["requests"]
+        assert [delete["url"].rpartition("root:/")[2] for delete in deletes] == ["a", "ab.csv"]
+        assert mock_sharepoint_manager._get_remembered_item_id("a/b/c.csv") is None
+
+    def test_delete_items_empty(self, mock_sharepoint_manager, mock_requests_post):
+        """Test deleting nothing makes no requests"""
+        assert mock_sharepoint_manager.delete_items([]) is True
+        mock_requests_post.assert_not_called()
+
+
+class TestMoveItems:
+    """Tests for move_items method"""
+
+    def test_move_items_batches_lookups_and_moves(self, mock_sharepoint_manager, mock_requests_post, make_batch_response):
+        """Test bulk moves resolve each distinct path once and move in one batch"""
+        lookup_response = make_batch_response({"id": "file-a"}, {"id": "archive-id"}, {"id": "file-b"})
+        move_response = make_batch_response({}, {})
+        mock_requests_post.side_effect = [lookup_response, move_response]
+
+        result = mock_sharepoint_manager.move_items([("a.csv", "archive"), ("b.csv", "archive")])
+
+        assert result is True
+        assert mock_requests_post.call_count == 2
+
+        lookups = mock_requests_post.call_args_list[0][1]["json"]["requests"]
+        assert len(lookups) == 3
+
+        moves = mock_requests_post.call_args_list[1][1]["json"]["requests"]
+        assert [move["method"] for move in moves] == ["PATCH", "PATCH"]
+        assert moves[0]["url"].endswith("/items/file-a")
+        assert moves[1]["url"].endswith("/items/file-b")
+        assert all(move["body"] == {"parentReference": {"id": "archive-id"}} for move in moves)
+
+    def test_move_items_reports_failed_moves(self, mock_sharepoint_manager, mock_requests_post, make_batch_response):
+        """Test a failed sub-request raises an exception naming the item"""
+        lookup_response = make_batch_response({"id": "file-a"}, {"id": "archive-id"})
+        move_response = make_batch_response({"error": {"message": "Access denied"}}, status=403)
+        mock_requests_post.side_effect = [lookup_response, move_response]
+
+        with pytest.raises(Exception, match="moving item 'a.csv': 403 - Access denied"):
+            mock_sharepoint_manager.move_items([("a.csv", "archive")])
+
+    def test_repeated_moves_reuse_destination_id(self, mock_sharepoint_manager, mock_requests_post,
+                                                 mock_requests_patch, make_batch_response, make_response):
+        """Test the destination ID is only looked up once for repeated moves"""
+        mock_requests_post.side_effect = [
+            make_batch_response({"id": "file-a"}, {"id": "archive-id"}),
+            make_batch_response({"id": "file-b"})
+        ]
+        patch_response = make_response()
+        mock_requests_patch.return_value = patch_response
+
+        mock_sharepoint_manager.move_item("a.csv", "archive")
+        mock_sharepoint_manager.move_item("b.csv", "archive")
+
+        second_lookup = mock_requests_post.call_args_list[1][1]["json"]["requests"]
+        assert len(second_lookup) == 1
+        assert "b.csv" in second_lookup[0]["url"]
+        assert mock_requests_patch.call_args[1]["json"] == {"parentReference": {"id": "archive-id"}}
+
+    def test_moved_item_id_is_forgotten(self, mock_sharepoint_manager, mock_requests_post,
+                                        mock_requests_patch, make_batch_response, make_response):
+        """Test a moved item and its descendants are looked up again afterwards"""
+        mock_sharepoint_manager._remember_item_id("reports/a.csv", "file-a")
+        mock_sharepoint_manager._remember_item_id("archive", "archive-id")
+        mock_sharepoint_manager._remember_item_id("reports", "folder-r")
+        patch_response = make_response()
+        mock_requests_patch.return_value = patch_response
 
-            with pytest.raises(Exception, match="Drive ID not set"):
-                manager.delete_file("test.txt")
+        mock_sharepoint_manager.move_item("reports", "archive")
+
+        mock_requests_post.assert_not_called()
+        assert mock_sharepoint_manager._get_remembered_item_id("reports") is None
+        assert mock_sharepoint_manager._get_remembered_item_id("reports/a.csv") is None
+        assert mock_sharepoint_manager._get_remembered_item_id("archive") == "archive-id"
+
+    def test_move_items_empty(self, mock_sharepoint_manager, mock_requests_post):
+        """Test moving nothing makes no requests"""
+        assert mock_sharepoint_manager.move_items([]) is True
+        mock_requests_post.assert_not_called()
 
 
 class TestMoveFile:
     """Tests for move_file method"""
 
-    def test_move_file_success(self, mock_sharepoint_manager, mock_requests_get, mock_requests_patch):
+    def test_move_file_success(self, mock_sharepoint_manager, mock_requests_post, mock_requests_patch,
+                               make_batch_response, make_response):
         """Test successful file move"""
-        # Mock getting file ID
-        file_response = Mock()
-        file_response.json.return_value = {"id": "file-123"}
-        file_response.raise_for_status.return_value = None
-
-        # Mock getting destination folder ID
-        folder_response = Mock()
-        folder_response.json.return_value = {"id": "folder-456"}
-        folder_response.raise_for_status.return_value = None
-
-        mock_requests_get.side_effect = [file_response, folder_response]
+        # Mock getting the file ID and the destination folder ID in one batch
+        mock_requests_post.return_value = make_batch_response({"id": "file-123"}, {"id": "folder-456"})
 
         # Mock patch response
-        patch_response = Mock()
-        patch_response.raise_for_status.return_value = None
+        patch_response = make_response()
 
         mock_requests_patch.return_value = patch_response
 
         result = mock_sharepoint_manager.move_file("test.txt", "archive")
 
         assert result is True
+        mock_requests_post.assert_called_once()
         mock_requests_patch.assert_called_once()
+        assert mock_requests_patch.call_args[0][0].endswith("/items/file-123")
+        assert mock_requests_patch.call_args[1]["json"] == {"parentReference": {"id": "folder-456"}}
 
-    def test_move_file_not_found(self, mock_sharepoint_manager, mock_requests_get):
+    def test_move_file_not_found(self, mock_sharepoint_manager, mock_requests_post, make_batch_response):
         """Test moving non-existent file"""
-        response = Mock()
-        response.status_code = 404
-        response.text = "Not Found"
-        response.raise_for_status.side_effect = HTTPError(response=response)
-
-        mock_requests_get.return_value = response
+        mock_requests_post.return_value = make_batch_response(
+            {"error": {"message": "Not Found"}},
+            {"error": {"message": "Not Found"}},
+            status=404
+        )
 
-        with pytest.raises(Exception):
+        with pytest.raises(Exception, match="Item not found"):
             mock_sharepoint_manager.move_file("nonexistent.txt", "archive")
 
-    def test_move_file_without_drive_id(self, config):
+    @pytest.mark.parametrize("manager_missing", ["drive_id"], indirect=True)
+    def test_move_file_without_drive_id(self, manager_missing):
         """Test move_file raises exception without drive_id"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
-
-            manager = SharePointManager(
-                tenant_id=config["TENANT_ID"],
-                client_id=config["CLIENT_ID"],
-                client_secret=config["CLIENT_SECRET"],
-                site_name=config["SITE_NAME"]
-            )
-            manager.access_token = "token"
-            manager.site_id = "site-id"
-            manager.drive_id = None
-
-            with pytest.raises(Exception, match="Drive ID not set"):
-                manager.move_file("test.txt", "archive")
+        with pytest.raises(Exception, match="Drive ID not set"):
+            manager_missing.move_file("test.txt", "archive")
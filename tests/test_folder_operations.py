@@ -1,6 +1,7 @@
 """
 Tests for folder operations (download, delete, move, search)
 """
+import json
 import pytest
 from unittest.mock import Mock, patch
 from requests.exceptions import HTTPError
@@ -10,11 +11,9 @@ from sharepointer.sharepoint import SharePointManager, ItemInfo
 class TestSearchFoldersByPrefix:
     """Tests for search_folders_by_suffix_recursive method"""
 
-    def test_search_folders_found(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_folders_found(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test finding folders with specific suffix"""
-        # First response contains the matching folder
-        response1 = Mock()
-        response1.json.return_value = {
+        response = make_response({
             "value": [
                 {
                     "name": "database.gdb",
@@ -26,27 +25,18 @@ class TestSearchFoldersByPrefix:
                     "webUrl": "https://sharepoint.com/database.gdb"
                 }
             ]
-        }
-        response1.raise_for_status.return_value = None
-
-        # Second response (when searching inside the folder) is empty
-        response2 = Mock()
-        response2.json.return_value = {"value": []}
-        response2.raise_for_status.return_value = None
+        })
 
-        # Return different responses for each call
-        mock_requests_get.side_effect = [response1, response2]
+        mock_requests_get.return_value = response
 
         results = mock_sharepoint_manager.search_folders_by_suffix_recursive(".gdb")
 
         assert len(results) > 0
         assert results[0].name == "database.gdb"
 
-    def test_search_folders_no_matches(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_folders_no_matches(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test searching with no matches"""
-        response = Mock()
-        response.json.return_value = {"value": []}
-        response.raise_for_status.return_value = None
+        response = make_response({"value": []})
 
         mock_requests_get.return_value = response
 
@@ -54,11 +44,9 @@ class TestSearchFoldersByPrefix:
 
         assert len(results) == 0
 
-    def test_search_folders_without_dot_prefix(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_folders_without_dot_prefix(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test search suffix without dot is auto-added"""
-        response = Mock()
-        response.json.return_value = {"value": []}
-        response.raise_for_status.return_value = None
+        response = make_response({"value": []})
 
         mock_requests_get.return_value = response
 
@@ -66,36 +54,132 @@ class TestSearchFoldersByPrefix:
         mock_sharepoint_manager.search_folders_by_suffix_recursive("gdb")
 
         # Verify the suffix was converted
-        mock_requests_get.assert_called()
+        assert "search(q='.gdb')" in mock_requests_get.call_args[0][0]
 
-    def test_search_folders_without_drive_id(self, config):
-        """Test search raises exception without drive_id"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
+    def test_search_folders_filters_results(self, mock_sharepoint_manager, mock_requests_get, make_response):
+        """Test server-side search results are filtered by type and exact suffix"""
+        response = make_response({
+            "value": [
+                {"name": "match.gdb", "id": "folder-1", "folder": {}, "parentReference": {"path": "/drives/test-drive-id/root:"}},
+                {"name": "file.gdb", "id": "file-1", "file": {}, "parentReference": {"path": "/drives/test-drive-id/root:"}},
+                {"name": "match.gdb.old", "id": "folder-2", "folder": {}, "parentReference": {"path": "/drives/test-drive-id/root:"}}
+            ]
+        })
+
+        mock_requests_get.return_value = response
+
+        results = mock_sharepoint_manager.search_folders_by_suffix_recursive(".gdb")
+
+        assert [result.path for result in results] == ["/match.gdb"]
+        mock_requests_get.assert_called_once()
+
+    def test_search_folders_follows_next_link(self, mock_sharepoint_manager, mock_requests_get, make_response):
+        """Test search results are paged using @odata.nextLink"""
+        page1 = make_response({
+            "value": [{"name": "a.gdb", "id": "folder-1", "folder": {}, "parentReference": {"path": "/drives/test-drive-id/root:"}}],
+            "@odata.nextLink": "https://graph.microsoft.com/v1.0/next-page"
+        })
+
+        page2 = make_response({
+            "value": [{"name": "b.gdb", "id": "folder-2", "folder": {},
+                       "parentReference": {"path": "/drives/test-drive-id/root:/maps"}}]
+        })
+
+        mock_requests_get.side_effect = [page1, page2]
+
+        results = mock_sharepoint_manager.search_folders_by_suffix_recursive(".gdb")
+
+        assert [result.path for result in results] == ["/a.gdb", "/maps/b.gdb"]
+        assert mock_requests_get.call_args_list[1][0][0] == "https://graph.microsoft.com/v1.0/next-page"
+
+    def test_search_folders_limited_to_start_path(self, mock_sharepoint_manager, mock_requests_get, make_response):
+        """Test search results outside the start folder are skipped"""
+        response = make_response({
+            "value": [
+                {"name": "in.gdb", "id": "folder-1", "folder": {}, "parentReference": {"path": "/drives/d/root:/Data"}},
+                {"name": "nested.gdb", "id": "folder-2", "folder": {}, "parentReference": {"path": "/drives/d/root:/Data/sub"}},
+                {"name": "out.gdb", "id": "folder-3", "folder": {}, "parentReference": {"path": "/drives/d/root:/Database"}}
+            ]
+        })
+
+        mock_requests_get.return_value = response
 
-            manager = SharePointManager(
-                tenant_id=config["TENANT_ID"],
-                client_id=config["CLIENT_ID"],
-                client_secret=config["CLIENT_SECRET"],
-                site_name=config["SITE_NAME"]
-            )
-            manager.access_token = "token"
-            manager.site_id = "site-id"
-            manager.drive_id = None
+        results = mock_sharepoint_manager.search_folders_by_suffix_recursive(".gdb", "Data")
 
-            with pytest.raises(Exception, match="Drive ID not set"):
-                manager.search_folders_by_suffix_recursive(".gdb")
+        assert [result.name for result in results] == ["in.gdb", "nested.gdb"]
+
+    def test_search_folders_resolves_missing_parent_paths(self, mock_sharepoint_manager, mock_requests_get,
+                                                          mock_requests_post, make_response, make_batch_response):
+        """Test search hits carrying only the parent ID get their paths looked up in one batch and scoped"""
+        mock_requests_get.return_value = make_response({
+            "value": [
+                {"name": "nested.gdb", "id": "folder-2", "folder": {"childCount": 3},
+                 "parentReference": {"driveId": "test-drive-id", "driveType": "documentLibrary", "id": "folder-1"}},
+                {"name": "other.gdb", "id": "folder-3", "folder": {"childCount": 0},
+                 "parentReference": {"driveId": "test-drive-id", "driveType": "documentLibrary", "id": "folder-9"}},
+                {"name": "notes.txt", "id": "file-1", "file": {},
+                 "parentReference": {"driveId": "test-drive-id", "driveType": "documentLibrary", "id": "folder-1"}}
+            ]
+        })
+        mock_requests_post.return_value = make_batch_response(
+            {"id": "folder-2", "parentReference": {"id": "folder-1", "path": "/drives/test-drive-id/root:/maps"}},
+            {"id": "folder-3", "parentReference": {"id": "folder-9", "path": "/drives/test-drive-id/root:/archive"}}
+        )
+
+        results = mock_sharepoint_manager.search_folders_by_suffix_recursive(".gdb", "maps")
+
+        assert [result.path for result in results] == ["/maps/nested.gdb"]
+        mock_requests_get.assert_called_once()
+        lookups = mock_requests_post.call_args[1]["json"]["requests"]
+        assert [request["url"] for request in lookups] == [
+            "/sites/test-site-id/drives/test-drive-id/items/folder-2?$select=id,parentReference",
+            "/sites/test-site-id/drives/test-drive-id/items/folder-3?$select=id,parentReference"
+        ]
+
+    def test_search_folders_falls_back_to_batched_walk(self, mock_sharepoint_manager, mock_requests_get,
+                                                       mock_requests_post, make_batch_response):
+        """Test that sibling folders are listed in a single batch request when search is unavailable"""
+        search_response = Mock()
+        search_response.status_code = 501
+        search_response.raise_for_status.side_effect = HTTPError(response=search_response)
+        mock_requests_get.return_value = search_response
+
+        root_listing = make_batch_response({
+            "value": [
+                {"name": "a.gdb", "id": "folder-a", "folder": {}},
+                {"name": "b", "id": "folder-b", "folder": {}},
+                {"name": "c.gdb", "id": "folder-c", "folder": {}}
+            ]
+        })
+        children_listing = make_batch_response({"value": []}, {"value": []}, {"value": []})
+
+        mock_requests_post.side_effect = [root_listing, children_listing]
+
+        results = mock_sharepoint_manager.search_folders_by_suffix_recursive(".gdb")
+
+        assert [result.name for result in results] == ["a.gdb", "c.gdb"]
+        assert mock_requests_post.call_count == 2
+        second_batch = mock_requests_post.call_args_list[1][1]["json"]["requests"]
+        query = f"?$select={SharePointManager.CHILDREN_SELECT}&$top={SharePointManager.CHILDREN_PAGE_SIZE}"
+        assert [request["url"] for request in second_batch] == [
+            "/sites/test-site-id/drives/test-drive-id/root:/a.gdb:/children" + query,
+            "/sites/test-site-id/drives/test-drive-id/root:/b:/children" + query,
+            "/sites/test-site-id/drives/test-drive-id/root:/c.gdb:/children" + query
+        ]
+
+    @pytest.mark.parametrize("manager_missing", ["drive_id"], indirect=True)
+    def test_search_folders_without_drive_id(self, manager_missing):
+        """Test search raises exception without drive_id"""
+        with pytest.raises(Exception, match="Drive ID not set"):
+            manager_missing.search_folders_by_suffix_recursive(".gdb")
 
 
 class TestSearchFoldersBySuffix:
     """Tests for search_folders_by_suffix method (non-recursive)"""
 
-    def test_search_folders_found(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_folders_found(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test finding folders with specific suffix in a single folder"""
-        response = Mock()
-        response.json.return_value = {
+        response = make_response({
             "value": [
                 {
                     "name": "data.gdb",
@@ -125,8 +209,7 @@ class TestSearchFoldersBySuffix:
                     "webUrl": "https://sharepoint.com/other_folder"
                 }
             ]
-        }
-        response.raise_for_status.return_value = None
+        })
 
         mock_requests_get.return_value = response
 
@@ -137,10 +220,9 @@ class TestSearchFoldersBySuffix:
         assert results[1].name == "archive.gdb"
         assert isinstance(results[0], ItemInfo)
 
-    def test_search_folders_no_matches(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_folders_no_matches(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test searching with no matching folders"""
-        response = Mock()
-        response.json.return_value = {
+        response = make_response({
             "value": [
                 {
                     "name": "regular_folder",
@@ -152,8 +234,7 @@ class TestSearchFoldersBySuffix:
                     "webUrl": "https://sharepoint.com/regular_folder"
                 }
             ]
-        }
-        response.raise_for_status.return_value = None
+        })
 
         mock_requests_get.return_value = response
 
@@ -161,10 +242,9 @@ class TestSearchFoldersBySuffix:
 
         assert len(results) == 0
 
-    def test_search_folders_without_dot_prefix(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_folders_without_dot_prefix(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test search suffix without dot is auto-added"""
-        response = Mock()
-        response.json.return_value = {
+        response = make_response({
             "value": [
                 {
                     "name": "test.gdb",
@@ -176,8 +256,7 @@ class TestSearchFoldersBySuffix:
                     "webUrl": "https://sharepoint.com/test.gdb"
                 }
             ]
-        }
-        response.raise_for_status.return_value = None
+        })
 
         mock_requests_get.return_value = response
 
@@ -187,10 +266,9 @@ class TestSearchFoldersBySuffix:
         assert len(results) == 1
         assert results[0].name == "test.gdb"
 
-    def test_search_folders_in_specific_folder(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_folders_in_specific_folder(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test searching in a specific folder path"""
-        response = Mock()
-        response.json.return_value = {
+        response = make_response({
             "value": [
                 {
                     "name": "project.gdb",
@@ -202,8 +280,7 @@ class TestSearchFoldersBySuffix:
                     "webUrl": "https://sharepoint.com/Data/project.gdb"
                 }
             ]
-        }
-        response.raise_for_status.return_value = None
+        })
 
         mock_requests_get.return_value = response
 
@@ -213,10 +290,10 @@ class TestSearchFoldersBySuffix:
         assert results[0].name == "project.gdb"
         mock_requests_get.assert_called_once()
 
-    def test_search_folders_only_returns_folders_not_files(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_folders_only_returns_folders_not_files(self, mock_sharepoint_manager, mock_requests_get,
+                                                           make_response):
         """Test that search only returns folders, not files"""
-        response = Mock()
-        response.json.return_value = {
+        response = make_response({
             "value": [
                 {
                     "name": "folder.gdb",
@@ -237,8 +314,7 @@ class TestSearchFoldersBySuffix:
                     "webUrl": "https://sharepoint.com/file.gdb"
                 }
             ]
-        }
-        response.raise_for_status.return_value = None
+        })
 
         mock_requests_get.return_value = response
 
@@ -247,35 +323,64 @@ class TestSearchFoldersBySuffix:
         # Should only return the folder, not the file
         assert len(results) == 1
         assert results[0].name == "folder.gdb"
+        assert mock_requests_get.call_args[1]["params"]["$filter"] == "endswith(tolower(name),'.gdb')"
+
+    @pytest.mark.parametrize("status_code", [400, 501])
+    def test_search_folders_falls_back_when_filter_unsupported(self, mock_sharepoint_manager, mock_requests_get,
+                                                              make_response, status_code):
+        """Test a drive rejecting the name filter is listed unfiltered, without retrying the filter"""
+        rejected_response = Mock()
+        rejected_response.status_code = status_code
+        rejected_response.raise_for_status.side_effect = HTTPError(response=rejected_response)
+        listing_response = make_response({
+            "value": [
+                {"name": "a.gdb", "id": "folder-1", "folder": {}},
+                {"name": "b.txt", "id": "folder-2", "folder": {}}
+            ]
+        })
+        requested_params = []
 
-    def test_search_folders_without_drive_id(self, config):
-        """Test search raises exception without drive_id"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
+        def fake_get(url, headers=None, params=None):
+            requested_params.append(dict(params))
+            return rejected_response if "$filter" in params else listing_response
 
-            manager = SharePointManager(
-                tenant_id=config["TENANT_ID"],
-                client_id=config["CLIENT_ID"],
-                client_secret=config["CLIENT_SECRET"],
-                site_name=config["SITE_NAME"]
-            )
-            manager.access_token = "token"
-            manager.site_id = "site-id"
-            manager.drive_id = None
+        mock_requests_get.side_effect = fake_get
 
-            with pytest.raises(Exception, match="Drive ID not set"):
-                manager.search_folders_by_suffix(".gdb")
+        first_results = mock_sharepoint_manager.search_folders_by_suffix(".gdb")
+        second_results = mock_sharepoint_manager.search_folders_by_suffix(".gdb")
+
+        assert [result.name for result in first_results] == ["a.gdb"]
+        assert [result.name for result in second_results] == ["a.gdb"]
+        assert ["$filter" in params for params in requested_params] == [True, False, False]
+
+    @pytest.mark.parametrize("status_code", [401, 403, 404, 429, 500])
+    def test_search_folders_other_errors_are_not_treated_as_unsupported_filter(self, mock_sharepoint_manager,
+                                                                               mock_requests_get, status_code):
+        """Test other errors on the filtered listing are raised instead of listing unfiltered"""
+        error_response = Mock()
+        error_response.status_code = status_code
+        error_response.raise_for_status.side_effect = HTTPError(response=error_response)
+        mock_requests_get.return_value = error_response
+
+        with pytest.raises(Exception):
+            mock_sharepoint_manager.search_folders_by_suffix(".gdb")
+
+        assert mock_requests_get.call_count == 1
+        assert mock_sharepoint_manager._children_filter_supported is True
+
+    @pytest.mark.parametrize("manager_missing", ["drive_id"], indirect=True)
+    def test_search_folders_without_drive_id(self, manager_missing):
+        """Test search raises exception without drive_id"""
+        with pytest.raises(Exception, match="Drive ID not set"):
+            manager_missing.search_folders_by_suffix(".gdb")
 
 
 class TestDeleteFolder:
     """Tests for delete_folder method"""
 
-    def test_delete_folder_success(self, mock_sharepoint_manager, mock_requests_delete):
+    def test_delete_folder_success(self, mock_sharepoint_manager, mock_requests_delete, make_response):
         """Test successful folder deletion"""
-        response = Mock()
-        response.raise_for_status.return_value = None
+        response = make_response()
 
         mock_requests_delete.return_value = response
 
@@ -296,102 +401,63 @@ class TestDeleteFolder:
         with pytest.raises(HTTPError):
             mock_sharepoint_manager.delete_folder("nonexistent_folder")
 
-    def test_delete_folder_without_drive_id(self, config):
+    @pytest.mark.parametrize("manager_missing", ["drive_id"], indirect=True)
+    def test_delete_folder_without_drive_id(self, manager_missing):
         """Test delete_folder raises exception without drive_id"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
-
-            manager = SharePointManager(
-                tenant_id=config["TENANT_ID"],
-                client_id=config["CLIENT_ID"],
-                client_secret=config["CLIENT_SECRET"],
-                site_name=config["SITE_NAME"]
-            )
-            manager.access_token = "token"
-            manager.site_id = "site-id"
-            manager.drive_id = None
-
-            with pytest.raises(Exception, match="Drive ID not set"):
-                manager.delete_folder("test_folder")
+        with pytest.raises(Exception, match="Drive ID not set"):
+            manager_missing.delete_folder("test_folder")
 
 
 class TestMoveFolder:
     """Tests for move_folder method"""
 
-    def test_move_folder_success(self, mock_sharepoint_manager, mock_requests_get, mock_requests_patch):
+    def test_move_folder_success(self, mock_sharepoint_manager, mock_requests_post, mock_requests_patch,
+                                 make_batch_response, make_response):
         """Test successful folder move"""
-        # Mock getting folder ID
-        folder_response = Mock()
-        folder_response.json.return_value = {"id": "folder-123"}
-        folder_response.raise_for_status.return_value = None
-
-        # Mock getting destination parent folder ID
-        dest_response = Mock()
-        dest_response.json.return_value = {"id": "folder-456"}
-        dest_response.raise_for_status.return_value = None
-
-        mock_requests_get.side_effect = [folder_response, dest_response]
+        # Mock getting the folder ID and the destination folder ID in one batch
+        mock_requests_post.return_value = make_batch_response({"id": "folder-123"}, {"id": "folder-456"})
 
         # Mock patch response
-        patch_response = Mock()
-        patch_response.raise_for_status.return_value = None
+        patch_response = make_response()
 
         mock_requests_patch.return_value = patch_response
 
         result = mock_sharepoint_manager.move_folder("active/old_project", "archive")
 
         assert result is True
+        mock_requests_post.assert_called_once()
         mock_requests_patch.assert_called_once()
+        assert mock_requests_patch.call_args[0][0].endswith("/items/folder-123")
+        assert mock_requests_patch.call_args[1]["json"] == {"parentReference": {"id": "folder-456"}}
 
-    def test_move_folder_not_found(self, mock_sharepoint_manager, mock_requests_get):
+    def test_move_folder_not_found(self, mock_sharepoint_manager, mock_requests_post, make_batch_response):
         """Test moving non-existent folder"""
-        response = Mock()
-        response.status_code = 404
-        response.text = "Not Found"
-        response.raise_for_status.side_effect = HTTPError(response=response)
-
-        mock_requests_get.return_value = response
+        mock_requests_post.return_value = make_batch_response(
+            {"error": {"message": "Not Found"}},
+            {"error": {"message": "Not Found"}},
+            status=404
+        )
 
-        with pytest.raises(Exception):
+        with pytest.raises(Exception, match="Item not found"):
             mock_sharepoint_manager.move_folder("nonexistent", "archive")
 
-    def test_move_folder_without_drive_id(self, config):
+    @pytest.mark.parametrize("manager_missing", ["drive_id"], indirect=True)
+    def test_move_folder_without_drive_id(self, manager_missing):
         """Test move_folder raises exception without drive_id"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
-
-            manager = SharePointManager(
-                tenant_id=config["TENANT_ID"],
-                client_id=config["CLIENT_ID"],
-                client_secret=config["CLIENT_SECRET"],
-                site_name=config["SITE_NAME"]
-            )
-            manager.access_token = "token"
-            manager.site_id = "site-id"
-            manager.drive_id = None
-
-            with pytest.raises(Exception, match="Drive ID not set"):
-                manager.move_folder("test_folder", "archive")
+        with pytest.raises(Exception, match="Drive ID not set"):
+            manager_missing.move_folder("test_folder", "archive")
 
 
 class TestDownloadFolder:
     """Tests for download_folder method"""
 
-    def test_download_folder_path_creation(self, mock_sharepoint_manager, mock_requests_get):
+    def test_download_folder_path_creation(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test folder download path creation"""
         # Mock metadata response
-        metadata_response = Mock()
-        metadata_response.json.return_value = {"folder": {}}
-        metadata_response.raise_for_status.return_value = None
+        metadata_response = make_response({"folder": {}})
 
         # Mock folder contents response
-        contents_response = Mock()
-        contents_response.json.return_value = {"value": []}
-        contents_response.raise_for_status.return_value = None
+        contents_response = make_response({"value": []})
 
         mock_requests_get.side_effect = [metadata_response, contents_response]
 
@@ -401,37 +467,19 @@ class TestDownloadFolder:
 
                 assert result == "test_folder"
 
-    def test_download_folder_without_drive_id(self, config):
+    @pytest.mark.parametrize("manager_missing", ["drive_id"], indirect=True)
+    def test_download_folder_without_drive_id(self, manager_missing):
         """Test download_folder raises exception without drive_id"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
-
-            manager = SharePointManager(
-                tenant_id=config["TENANT_ID"],
-                client_id=config["CLIENT_ID"],
-                client_secret=config["CLIENT_SECRET"],
-                site_name=config["SITE_NAME"]
-            )
-            manager.access_token = "token"
-            manager.site_id = "site-id"
-            manager.drive_id = None
-
-            with pytest.raises(Exception, match="Drive ID not set"):
-                manager.download_folder("test_folder")
-
-    def test_download_folder_custom_path(self, mock_sharepoint_manager, mock_requests_get):
+        with pytest.raises(Exception, match="Drive ID not set"):
+            manager_missing.download_folder("test_folder")
+
+    def test_download_folder_custom_path(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test folder download with custom local path"""
         # Mock metadata response
-        metadata_response = Mock()
-        metadata_response.json.return_value = {"folder": {}}
-        metadata_response.raise_for_status.return_value = None
+        metadata_response = make_response({"folder": {}})
 
         # Mock folder contents response
-        contents_response = Mock()
-        contents_response.json.return_value = {"value": []}
-        contents_response.raise_for_status.return_value = None
+        contents_response = make_response({"value": []})
 
         mock_requests_get.side_effect = [metadata_response, contents_response]
 
@@ -440,3 +488,517 @@ class TestDownloadFolder:
                 result = mock_sharepoint_manager.download_folder("test_folder", "/custom/path")
 
                 assert result == "/custom/path"
+
+    def test_download_folder_downloads_all_files(self, mock_sharepoint_manager, mock_requests_get, tmp_path,
+                                                 make_response):
+        """Test folder download fetches every file in the folder tree"""
+        # Mock metadata response
+        metadata_response = make_response({"folder": {}})
+
+        # Mock folder contents response with two files
+        contents_response = make_response({
+            "value": [
+                {"name": "a.csv", "file": {}, "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/a"},
+                {"name": "b.csv", "file": {}, "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/b"}
+            ]
+        })
+
+        listing_responses = [metadata_response, contents_response]
+
+        def fake_get(url, *args, **kwargs):
+            if url.startswith("https://download.sharepoint.com/"):
+                download_response = Mock()
+                download_response.headers = {"Content-Length": "1"}
+                download_response.iter_content.return_value = [url.rsplit("/", 1)[-1].encode()]
+                download_response.raise_for_status.return_value = None
+                return download_response
+            return listing_responses.pop(0)
+
+        mock_requests_get.side_effect = fake_get
+
+        progress = []
+        result = mock_sharepoint_manager.download_folder(
+            "test_folder", str(tmp_path), progress_callback=lambda done, total: progress.append((done, total))
+        )
+
+        assert result == str(tmp_path)
+        assert (tmp_path / "a.csv").read_bytes() == b"a"
+        assert (tmp_path / "b.csv").read_bytes() == b"b"
+        assert progress == [(1, 2), (2, 2)]
+
+    def test_download_folder_lists_subfolders_level_by_level(self, mock_sharepoint_manager, mock_requests_get,
+                                                             tmp_path, make_response):
+        """Test nested folders are listed breadth-first and all files are downloaded"""
+        children_prefix = "https://graph.microsoft.com/v1.0/sites/test-site-id/drives/test-drive-id/root:/"
+        listings = {
+            "root": [{"name": "a", "folder": {}}, {"name": "b", "folder": {}}],
+            "root/a": [{"name": "c", "folder": {}}, {"name": "a.csv", "file": {}, "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/a"}],
+            "root/b": [{"name": "b.csv", "file": {}, "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/b"}],
+            "root/a/c": [{"name": "c.csv", "file": {}, "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/c"}]
+        }
+        listed_paths = []
+
+        def fake_get(url, *args, **kwargs):
+            response = make_response()
+            if url.startswith("https://download.sharepoint.com/"):
+                response.headers = {}
+                response.iter_content.return_value = [url.rsplit("/", 1)[-1].encode()]
+            elif url.endswith(":/children"):
+                folder = url[len(children_prefix):-len(":/children")]
+                listed_paths.append(folder)
+                response.json.return_value = {"value": listings[folder]}
+            else:
+                response.json.return_value = {"folder": {}}
+            return response
+
+        mock_requests_get.side_effect = fake_get
+
+        mock_sharepoint_manager.download_folder("root", str(tmp_path))
+
+        assert listed_paths[0] == "root"
+        assert sorted(listed_paths[1:3]) == ["root/a", "root/b"]
+        assert listed_paths[3] == "root/a/c"
+        assert (tmp_path / "a" / "a.csv").read_bytes() == b"a"
+        assert (tmp_path / "b" / "b.csv").read_bytes() == b"b"
+        assert (tmp_path / "a" / "c" / "c.csv").read_bytes() == b"c"
+
+    def test_download_folder_streams_in_chunks(self, mock_sharepoint_manager, mock_requests_get, tmp_path,
+                                               make_response):
+        """Test folder files are streamed to disk chunk by chunk"""
+        metadata_response = make_response({"folder": {}})
+
+        contents_response = make_response({
+            "value": [
+                {"name": "large.csv", "file": {}, "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/large"}
+            ]
+        })
+
+        download_response = Mock()
+        # Content-Length larger than the body, preallocated space must be truncated
+        download_response.headers = {"Content-Length": "100"}
+        download_response.iter_content.return_value = [b"part1,", b"part2"]
+        download_response.raise_for_status.return_value = None
+
+        mock_requests_get.side_effect = [metadata_response, contents_response, download_response]
+
+        mock_sharepoint_manager.download_folder("test_folder", str(tmp_path))
+
+        assert (tmp_path / "large.csv").read_bytes() == b"part1,part2"
+        assert mock_requests_get.call_args_list[2][1]["stream"] is True
+        download_response.iter_content.assert_called_once_with(chunk_size=mock_sharepoint_manager.DOWNLOAD_CHUNK_SIZE)
+        download_response.close.assert_called_once()
+
+    def test_download_folder_uses_expanded_children(self, mock_sharepoint_manager, mock_requests_get, tmp_path,
+                                                    make_response):
+        """Test the top-level listing comes from the $expand=children metadata response"""
+        metadata_response = make_response({
+            "folder": {},
+            "children": [
+                {"name": "data.csv", "file": {}, "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/data"}
+            ]
+        })
+
+        download_response = Mock()
+        download_response.headers = {}
+        download_response.iter_content.return_value = [b"a,b"]
+        download_response.raise_for_status.return_value = None
+
+        mock_requests_get.side_effect = [metadata_response, download_response]
+
+        mock_sharepoint_manager.download_folder("test_folder", str(tmp_path))
+
+        assert (tmp_path / "data.csv").read_bytes() == b"a,b"
+        assert mock_requests_get.call_count == 2
+        assert mock_requests_get.call_args_list[0][1]["params"] == {"$expand": "children"}
+
+    def test_download_folder_lists_children_when_expansion_truncated(self, mock_sharepoint_manager,
+                                                                     mock_requests_get, tmp_path, make_response):
+        """Test the folder is listed normally when the expanded children are paged"""
+        metadata_response = make_response({
+            "folder": {},
+            "children": [{"name": "first.csv", "file": {}, "size": 0}],
+            "children@odata.nextLink": "https://graph.microsoft.com/v1.0/next"
+        })
+
+        contents_response = make_response({
+            "value": [{"name": "first.csv", "file": {}, "size": 0}, {"name": "second.csv", "file": {}, "size": 0}]
+        })
+
+        mock_requests_get.side_effect = [metadata_response, contents_response]
+
+        mock_sharepoint_manager.download_folder("test_folder", str(tmp_path))
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["first.csv", "second.csv"]
+        assert mock_requests_get.call_count == 2
+
+    def _folder_download_responses(self, etag):
+        """Build metadata, listing and download responses for a folder with one file"""
+        metadata_response = Mock()
+        metadata_response.json.return_value = {
+            "folder": {},
+            "children": [
+                {"id": "item-1", "name": "data.csv", "file": {}, "size": 3, "eTag": etag,
+                 "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/data"}
+            ]
+        }
+        metadata_response.raise_for_status.return_value = None
+
+        download_response = Mock()
+        download_response.headers = {}
+        download_response.iter_content.return_value = [b"a,b"]
+        download_response.raise_for_status.return_value = None
+        return metadata_response, download_response
+
+    def test_download_folder_skips_unchanged_files(self, mock_sharepoint_manager, mock_requests_get, tmp_path):
+        """Test a re-run skips files whose eTag matches the download manifest"""
+        mock_sharepoint_manager.cache_dir = str(tmp_path / "cache")
+        local_directory = tmp_path / "download"
+
+        mock_requests_get.side_effect = [
+            *self._folder_download_responses('"{A},1"'),
+            self._folder_download_responses('"{A},1"')[0]
+        ]
+
+        mock_sharepoint_manager.download_folder("test_folder", str(local_directory))
+        mock_sharepoint_manager.download_folder("test_folder", str(local_directory))
+
+        assert (local_directory / "data.csv").read_bytes() == b"a,b"
+        assert mock_requests_get.call_count == 3
+
+    def test_download_folder_redownloads_changed_files(self, mock_sharepoint_manager, mock_requests_get, tmp_path):
+        """Test files are downloaded again when their eTag changed"""
+        mock_sharepoint_manager.cache_dir = str(tmp_path / "cache")
+        local_directory = tmp_path / "download"
+
+        mock_requests_get.side_effect = [
+            *self._folder_download_responses('"{A},1"'),
+            *self._folder_download_responses('"{A},2"')
+        ]
+
+        mock_sharepoint_manager.download_folder("test_folder", str(local_directory))
+        mock_sharepoint_manager.download_folder("test_folder", str(local_directory))
+
+        assert mock_requests_get.call_count == 4
+
+    def test_download_folder_logs_files_at_debug_level(self, mock_sharepoint_manager, mock_requests_get, tmp_path,
+                                                       caplog, make_response):
+        """Test per-file progress is only logged at DEBUG level"""
+        metadata_response = make_response({"folder": {}})
+
+        contents_response = make_response({
+            "value": [
+                {"name": "data.csv", "file": {}, "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/data"}
+            ]
+        })
+
+        download_response = Mock()
+        download_response.headers = {}
+        download_response.iter_content.return_value = [b"a,b"]
+        download_response.raise_for_status.return_value = None
+
+        mock_requests_get.side_effect = [metadata_response, contents_response, download_response]
+
+        with caplog.at_level("DEBUG", logger="sharepointer.sharepoint"):
+            mock_sharepoint_manager.download_folder("test_folder", str(tmp_path))
+
+        file_records = [record for record in caplog.records if "data.csv" in record.getMessage()]
+        assert [record.levelname for record in file_records] == ["DEBUG"]
+        assert any(record.levelname == "INFO" and "Folder downloaded" in record.getMessage() for record in caplog.records)
+
+    def test_download_folder_large_file_in_ranges(self, mock_sharepoint_manager, mock_requests_get, tmp_path,
+                                                  make_response):
+        """Test large files are downloaded as concurrent byte ranges"""
+        content = bytes(range(256)) * 4
+        mock_sharepoint_manager.RANGE_DOWNLOAD_THRESHOLD = 512
+        mock_sharepoint_manager.RANGE_DOWNLOAD_PARTS = 3
+
+        metadata_response = make_response({"folder": {}})
+
+        contents_response = make_response({
+            "value": [
+                {"name": "large.csv", "file": {}, "size": len(content),
+                 "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/large"}
+            ]
+        })
+
+        range_headers = []
+
+        def fake_get(url, headers=None, **kwargs):
+            if not url.startswith("https://download.sharepoint.com/"):
+                return metadata_response if "$expand" in kwargs["params"] else contents_response
+
+            range_headers.append(headers["Range"])
+            start, end = map(int, headers["Range"][len("bytes="):].split("-"))
+            range_response = Mock()
+            range_response.status_code = 206
+            range_response.raise_for_status.return_value = None
+            range_response.iter_content.return_value = [content[start:end + 1]]
+            return range_response
+
+        mock_requests_get.side_effect = fake_get
+
+        mock_sharepoint_manager.download_folder("test_folder", str(tmp_path))
+
+        assert (tmp_path / "large.csv").read_bytes() == content
+        assert sorted(range_headers) == ["bytes=0-341", "bytes=342-683", "bytes=684-1023"]
+
+    def test_download_folder_large_file_without_range_support(self, mock_sharepoint_manager, mock_requests_get,
+                                                              tmp_path, make_response):
+        """Test large files are streamed whole when the server ignores the Range header"""
+        mock_sharepoint_manager.RANGE_DOWNLOAD_THRESHOLD = 4
+
+        metadata_response = make_response({"folder": {}})
+
+        contents_response = make_response({
+            "value": [
+                {"name": "large.csv", "file": {}, "size": 11,
+                 "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/large"}
+            ]
+        })
+
+        full_response = Mock()
+        full_response.status_code = 200
+        full_response.headers = {}
+        full_response.iter_content.return_value = [b"part1,part2"]
+        full_response.raise_for_status.return_value = None
+
+        mock_requests_get.side_effect = [metadata_response, contents_response, full_response, full_response]
+
+        mock_sharepoint_manager.download_folder("test_folder", str(tmp_path))
+
+        assert (tmp_path / "large.csv").read_bytes() == b"part1,part2"
+        assert "Range" in mock_requests_get.call_args_list[2][1]["headers"]
+        assert not mock_requests_get.call_args_list[3][1].get("headers")
+
+    def test_download_folder_interrupted_download_leaves_no_file(self, mock_sharepoint_manager, mock_requests_get,
+                                                                 tmp_path, make_response):
+        """Test a failed download does not leave a partial file behind"""
+        metadata_response = make_response({"folder": {}})
+
+        contents_response = make_response({
+            "value": [
+                {"name": "large.csv", "file": {}, "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/large"}
+            ]
+        })
+
+        def interrupted_body(chunk_size):
+            yield b"part1,"
+            raise ConnectionError("Connection reset")
+
+        download_response = Mock()
+        download_response.headers = {}
+        download_response.iter_content.side_effect = interrupted_body
+        download_response.raise_for_status.return_value = None
+
+        mock_requests_get.side_effect = [metadata_response, contents_response, download_response]
+
+        with pytest.raises(ConnectionError):
+            mock_sharepoint_manager.download_folder("test_folder", str(tmp_path))
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_download_folder_creates_empty_files_without_request(self, mock_sharepoint_manager, mock_requests_get,
+                                                                 tmp_path, make_response):
+        """Test empty files are created locally without downloading them"""
+        metadata_response = make_response({"folder": {}})
+
+        contents_response = make_response({
+            "value": [
+                {"name": "empty.csv", "file": {}, "size": 0, "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/empty"}
+            ]
+        })
+
+        mock_requests_get.side_effect = [metadata_response, contents_response]
+
+        mock_sharepoint_manager.download_folder("test_folder", str(tmp_path))
+
+        assert (tmp_path / "empty.csv").read_bytes() == b""
+        assert mock_requests_get.call_count == 2
+
+    def test_download_folder_looks_up_missing_download_urls(self, mock_sharepoint_manager, mock_requests_get,
+                                                            mock_requests_post, make_batch_response, tmp_path,
+                                                            make_response):
+        """Test download URLs missing from folder listings are fetched with a batch request"""
+        metadata_response = make_response({"folder": {}})
+        contents_response = make_response({
+            "value": [
+                {"name": "a.csv", "id": "file-a", "file": {}, "size": 1},
+                {"name": "b.csv", "id": "file-b", "file": {}, "size": 1,
+                 "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/b"}
+            ]
+        })
+        listing_responses = [metadata_response, contents_response]
+
+        def fake_get(url, *args, **kwargs):
+            if url.startswith("https://download.sharepoint.com/"):
+                download_response = Mock()
+                download_response.headers = {"Content-Length": "1"}
+                download_response.iter_content.return_value = [url.rsplit("/", 1)[-1].encode()]
+                download_response.raise_for_status.return_value = None
+                return download_response
+            return listing_responses.pop(0)
+
+        mock_requests_get.side_effect = fake_get
+        mock_requests_post.return_value = make_batch_response(
+            {"id": "file-a", "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/a"}
+        )
+
+        mock_sharepoint_manager.download_folder("test_folder", str(tmp_path))
+
+        batch = mock_requests_post.call_args[1]["json"]["requests"]
+        assert [request["url"].partition("?")[0] for request in batch] == [
+            "/sites/test-site-id/drives/test-drive-id/items/file-a"
+        ]
+        assert (tmp_path / "a.csv").read_bytes() == b"a"
+        assert (tmp_path / "b.csv").read_bytes() == b"b"
+
+
+class TestSyncFolder:
+    """Tests for sync_folder method"""
+
+    DELTA_URL = "https://graph.microsoft.com/v1.0/sites/test-site-id/drives/test-drive-id/root/delta"
+    DELTA_LINK = "https://graph.microsoft.com/v1.0/drives/test-drive-id/root/delta?token=abc"
+
+    def fake_graph(self, mock_requests_get, pages):
+        """Serve delta pages by URL and file contents by download URL; returns the requested URLs"""
+        requested_urls = []
+
+        def fake_get(url, *args, **kwargs):
+            requested_urls.append(url)
+            response = Mock()
+            response.raise_for_status.return_value = None
+            if url.startswith("https://download.sharepoint.com/"):
+                response.headers = {}
+                response.iter_content.return_value = [url.rsplit("/", 1)[-1].encode()]
+            else:
+                page = pages[url]
+                if isinstance(page, Exception):
+                    raise page
+                response.json.return_value = page
+            return response
+
+        mock_requests_get.side_effect = fake_get
+        return requested_urls
+
+    def initial_page(self):
+        return {
+            "value": [
+                {"id": "root-id", "root": {}, "folder": {}},
+                {"id": "docs-id", "name": "docs", "folder": {}, "parentReference": {"id": "root-id"}},
+                {"id": "file-a", "name": "a.csv", "file": {}, "size": 1, "lastModifiedDateTime": "2024-01-01T00:00:00Z",
+                 "parentReference": {"id": "docs-id"}, "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/a"},
+                {"id": "file-x", "name": "x.csv", "file": {}, "size": 1, "lastModifiedDateTime": "2024-01-01T00:00:00Z",
+                 "parentReference": {"id": "root-id"}, "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/x"}
+            ],
+            "@odata.deltaLink": self.DELTA_LINK
+        }
+
+    def test_sync_folder_first_sync_downloads_folder(self, mock_sharepoint_manager, mock_requests_get, tmp_path):
+        """Test the first sync downloads the folder's files and stores the delta link"""
+        self.fake_graph(mock_requests_get, {self.DELTA_URL: self.initial_page()})
+        local_directory = tmp_path / "docs"
+
+        result = mock_sharepoint_manager.sync_folder("docs", str(local_directory))
+
+        assert result == str(local_directory)
+        assert (local_directory / "a.csv").read_bytes() == b"a"
+        assert not (local_directory / "x.csv").exists()
+        assert mock_requests_get.call_args_list[0][1]["params"]["$select"].endswith(",root,deleted")
+
+        state = json.loads((local_directory / ".sp_delta").read_text())
+        assert state["delta_link"] == self.DELTA_LINK
+        assert state["root_id"] == "root-id"
+
+    def test_sync_folder_applies_only_changes(self, mock_sharepoint_manager, mock_requests_get, tmp_path):
+        """Test a later sync resumes from the delta link and applies new, changed and deleted items"""
+        local_directory = tmp_path / "docs"
+        self.fake_graph(mock_requests_get, {self.DELTA_URL: self.initial_page()})
+        mock_sharepoint_manager.sync_folder("docs", str(local_directory))
+
+        requested_urls = self.fake_graph(mock_requests_get, {self.DELTA_LINK: {
+            "value": [
+                {"id": "file-a", "deleted": {}, "parentReference": {"id": "docs-id"}},
+                {"id": "file-b", "name": "b.csv", "file": {}, "size": 1, "lastModifiedDateTime": "2024-01-02T00:00:00Z",
+                 "parentReference": {"id": "docs-id"}, "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/b"}
+            ],
+            "@odata.deltaLink": self.DELTA_LINK + "2"
+        }})
+
+        mock_sharepoint_manager.sync_folder("docs", str(local_directory))
+
+        assert requested_urls == [self.DELTA_LINK, "https://download.sharepoint.com/b"]
+        assert not (local_directory / "a.csv").exists()
+        assert (local_directory / "b.csv").read_bytes() == b"b"
+        assert json.loads((local_directory / ".sp_delta").read_text())["delta_link"] == self.DELTA_LINK + "2"
+
+    def test_sync_folder_moves_renamed_folder(self, mock_sharepoint_manager, mock_requests_get, tmp_path):
+        """Test a folder renamed in SharePoint is renamed locally without downloading its files again"""
+        page = self.initial_page()
+        page["value"].insert(2, {"id": "sub-id", "name": "old", "folder": {}, "parentReference": {"id": "docs-id"}})
+        page["value"][3]["parentReference"] = {"id": "sub-id"}
+        local_directory = tmp_path / "docs"
+        self.fake_graph(mock_requests_get, {self.DELTA_URL: page})
+        mock_sharepoint_manager.sync_folder("docs", str(local_directory))
+
+        requested_urls = self.fake_graph(mock_requests_get, {self.DELTA_LINK: {
+            "value": [{"id": "sub-id", "name": "new", "folder": {}, "parentReference": {"id": "docs-id"}}],
+            "@odata.deltaLink": self.DELTA_LINK
+        }})
+
+        mock_sharepoint_manager.sync_folder("docs", str(local_directory))
+
+        assert requested_urls == [self.DELTA_LINK]
+        assert not (local_directory / "old").exists()
+        assert (local_directory / "new" / "a.csv").read_bytes() == b"a"
+
+    def test_sync_folder_skips_up_to_date_files(self, mock_sharepoint_manager, mock_requests_get, tmp_path):
+        """Test files whose local copy is as new as the SharePoint version are not downloaded"""
+        local_directory = tmp_path / "docs"
+        local_directory.mkdir()
+        (local_directory / "a.csv").write_bytes(b"a")
+        requested_urls = self.fake_graph(mock_requests_get, {self.DELTA_URL: self.initial_page()})
+
+        mock_sharepoint_manager.sync_folder("docs", str(local_directory))
+
+        assert requested_urls == [self.DELTA_URL]
+
+    def test_sync_folder_restarts_when_delta_link_expired(self, mock_sharepoint_manager, mock_requests_get, tmp_path):
+        """Test an expired delta link (410 Gone) falls back to a full sync"""
+        local_directory = tmp_path / "docs"
+        self.fake_graph(mock_requests_get, {self.DELTA_URL: self.initial_page()})
+        mock_sharepoint_manager.sync_folder("docs", str(local_directory))
+        (local_directory / "a.csv").unlink()
+
+        gone_response = Mock()
+        gone_response.status_code = 410
+        requested_urls = self.fake_graph(mock_requests_get, {
+            self.DELTA_LINK: HTTPError(response=gone_response),
+            self.DELTA_URL: self.initial_page()
+        })
+
+        mock_sharepoint_manager.sync_folder("docs", str(local_directory))
+
+        assert requested_urls[:2] == [self.DELTA_LINK, self.DELTA_URL]
+        assert (local_directory / "a.csv").read_bytes() == b"a"
+
+    def test_sync_folder_looks_up_missing_download_urls(self, mock_sharepoint_manager, mock_requests_get,
+                                                        mock_requests_post, make_batch_response, tmp_path):
+        """Test download URLs missing from delta items are fetched with a batch request"""
+        page = self.initial_page()
+        del page["value"][2]["@microsoft.graph.downloadUrl"]
+        self.fake_graph(mock_requests_get, {self.DELTA_URL: page})
+        mock_requests_post.return_value = make_batch_response(
+            {"id": "file-a", "@microsoft.graph.downloadUrl": "https://download.sharepoint.com/a"}
+        )
+
+        mock_sharepoint_manager.sync_folder("docs", str(tmp_path / "docs"))
+
+        batch = mock_requests_post.call_args[1]["json"]["requests"]
+        assert batch[0]["url"].startswith("/sites/test-site-id/drives/test-drive-id/items/file-a?")
+        assert (tmp_path / "docs" / "a.csv").read_bytes() == b"a"
+
+    @pytest.mark.parametrize("manager_missing", ["drive_id"], indirect=True)
+    def test_sync_folder_without_drive_id(self, manager_missing):
+        """Test sync raises exception without drive_id"""
+        with pytest.raises(Exception, match="Drive ID not set"):
+            manager_missing.sync_folder("docs")
@@ -1,18 +1,19 @@
 """
 Tests for file search operations
 """
+import threading
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
+from requests.exceptions import HTTPError
 from sharepointer.sharepoint import SharePointManager, ItemInfo
 
 
 class TestSearchFilesBySuffix:
     """Tests for search_files_by_suffix method"""
 
-    def test_search_files_found(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_files_found(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test finding files with specific suffix"""
-        response = Mock()
-        response.json.return_value = {
+        response = make_response({
             "value": [
                 {
                     "name": "data.csv",
@@ -24,8 +25,7 @@ class TestSearchFilesBySuffix:
                     "webUrl": "https://sharepoint.com/data.csv"
                 }
             ]
-        }
-        response.raise_for_status.return_value = None
+        })
 
         mock_requests_get.return_value = response
 
@@ -35,11 +35,9 @@ class TestSearchFilesBySuffix:
         assert results[0].name == "data.csv"
         assert isinstance(results[0], ItemInfo)
 
-    def test_search_files_no_matches(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_files_no_matches(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test searching with no matches"""
-        response = Mock()
-        response.json.return_value = {"value": []}
-        response.raise_for_status.return_value = None
+        response = make_response({"value": []})
 
         mock_requests_get.return_value = response
 
@@ -47,10 +45,9 @@ class TestSearchFilesBySuffix:
 
         assert len(results) == 0
 
-    def test_search_files_multiple_matches(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_files_multiple_matches(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test finding multiple files with same suffix"""
-        response = Mock()
-        response.json.return_value = {
+        response = make_response({
             "value": [
                 {
                     "name": "file1.csv",
@@ -71,8 +68,7 @@ class TestSearchFilesBySuffix:
                     "webUrl": "https://sharepoint.com/file2.csv"
                 }
             ]
-        }
-        response.raise_for_status.return_value = None
+        })
 
         mock_requests_get.return_value = response
 
@@ -82,11 +78,9 @@ class TestSearchFilesBySuffix:
         assert results[0].name == "file1.csv"
         assert results[1].name == "file2.csv"
 
-    def test_search_files_without_dot_prefix(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_files_without_dot_prefix(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test search suffix without dot is auto-added"""
-        response = Mock()
-        response.json.return_value = {"value": []}
-        response.raise_for_status.return_value = None
+        response = make_response({"value": []})
 
         mock_requests_get.return_value = response
 
@@ -96,11 +90,9 @@ class TestSearchFilesBySuffix:
         # Verify it was called (suffix conversion happens internally)
         mock_requests_get.assert_called()
 
-    def test_search_files_in_specific_folder(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_files_in_specific_folder(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test searching in specific folder"""
-        response = Mock()
-        response.json.return_value = {"value": []}
-        response.raise_for_status.return_value = None
+        response = make_response({"value": []})
 
         mock_requests_get.return_value = response
 
@@ -109,36 +101,92 @@ class TestSearchFilesBySuffix:
         # Verify the call was made
         mock_requests_get.assert_called()
 
-    def test_search_files_without_drive_id(self, config):
-        """Test search raises exception without drive_id"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
+    def test_search_files_follows_next_link(self, mock_sharepoint_manager, mock_requests_get, make_response):
+        """Test every page of the folder listing is searched, requesting only the needed properties"""
+        first_page = make_response({
+            "value": [{"name": "a.csv", "id": "file-1", "file": {}}],
+            "@odata.nextLink": "https://graph.microsoft.com/v1.0/next-page"
+        })
+        second_page = make_response({"value": [{"name": "b.csv", "id": "file-2", "file": {}}]})
+
+        mock_requests_get.side_effect = [first_page, second_page]
+
+        results = mock_sharepoint_manager.search_files_by_suffix(".csv")
+
+        assert [result.name for result in results] == ["a.csv", "b.csv"]
+        first_call, second_call = mock_requests_get.call_args_list
+        assert first_call[1]["params"] == {
+            "$select": SharePointManager.CHILDREN_SELECT,
+            "$top": SharePointManager.CHILDREN_PAGE_SIZE,
+            "$filter": "endswith(tolower(name),'.csv')"
+        }
+        assert second_call[0][0] == "https://graph.microsoft.com/v1.0/next-page"
+        assert second_call[1]["params"] is None
 
-            manager = SharePointManager(
-                tenant_id=config["TENANT_ID"],
-                client_id=config["CLIENT_ID"],
-                client_secret=config["CLIENT_SECRET"],
-                site_name=config["SITE_NAME"]
-            )
-            manager.access_token = "token"
-            manager.site_id = "site-id"
-            manager.drive_id = None
+    def test_search_files_with_multiple_suffixes(self, mock_sharepoint_manager, mock_requests_get, make_response):
+        """Test a tuple of suffixes is matched in a single listing"""
+        response = make_response({
+            "value": [
+                {"name": "a.csv", "id": "file-1", "file": {}},
+                {"name": "b.tsv", "id": "file-2", "file": {}},
+                {"name": "c.pdf", "id": "file-3", "file": {}}
+            ]
+        })
 
-            with pytest.raises(Exception, match="Drive ID not set"):
-                manager.search_files_by_suffix(".csv")
+        mock_requests_get.return_value = response
+
+        results = mock_sharepoint_manager.search_files_by_suffix((".csv", "tsv"))
+
+        assert [result.name for result in results] == ["a.csv", "b.tsv"]
+        assert mock_requests_get.call_count == 1
+        assert mock_requests_get.call_args[1]["params"]["$filter"] == \
+            "endswith(tolower(name),'.csv') or endswith(tolower(name),'.tsv')"
+
+    def test_search_is_case_insensitive(self, mock_sharepoint_manager, mock_requests_get, make_response):
+        """Test suffixes match regardless of case, as SharePoint names are case-insensitive"""
+        mock_requests_get.return_value = make_response({
+            "value": [
+                {"name": "Data.GDB", "id": "file-1", "file": {}},
+                {"name": "notes.gdb", "id": "file-2", "file": {}},
+                {"name": "data.csv", "id": "file-3", "file": {}}
+            ]
+        })
+
+        results = mock_sharepoint_manager.search_files_by_suffix(".Gdb")
+
+        assert [result.name for result in results] == ["Data.GDB", "notes.gdb"]
+        # The server-side filter has to match case-insensitively too
+        assert mock_requests_get.call_args[1]["params"]["$filter"] == "endswith(tolower(name),'.gdb')"
+
+    def test_search_non_ascii_suffix_is_matched_locally(self, mock_sharepoint_manager, mock_requests_get,
+                                                       make_response):
+        """Test a non-ASCII suffix is not filtered server-side, where lowercasing may differ from casefolding"""
+        mock_requests_get.return_value = make_response({
+            "value": [
+                {"name": "Menu.CAFÉ", "id": "file-1", "file": {}},
+                {"name": "data.csv", "id": "file-2", "file": {}}
+            ]
+        })
+
+        results = mock_sharepoint_manager.search_files_by_suffix(".Café")
+
+        assert [result.name for result in results] == ["Menu.CAFÉ"]
+        assert "$filter" not in mock_requests_get.call_args[1]["params"]
+
+    @pytest.mark.parametrize("manager_missing", ["drive_id"], indirect=True)
+    def test_search_files_without_drive_id(self, manager_missing):
+        """Test search raises exception without drive_id"""
+        with pytest.raises(Exception, match="Drive ID not set"):
+            manager_missing.search_files_by_suffix(".csv")
 
 
 class TestSearchFilesByRecursive:
     """Tests for search_files_by_suffix_recursive method"""
 
-    def test_search_files_recursive_found(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_files_recursive_found(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test recursively finding files"""
         # First call returns root items
-        response = Mock()
-        response.json.return_value = {"value": []}
-        response.raise_for_status.return_value = None
+        response = make_response({"value": []})
 
         mock_requests_get.return_value = response
 
@@ -147,31 +195,137 @@ class TestSearchFilesByRecursive:
         assert isinstance(results, list)
         mock_requests_get.assert_called()
 
-    def test_search_files_recursive_without_drive_id(self, config):
+    def test_search_files_recursive_uses_drive_search(self, mock_sharepoint_manager, mock_requests_get, make_response):
+        """Test recursive file search uses one server-side search and filters the results"""
+        response = make_response({
+            "value": [
+                {"name": "report.pdf", "id": "file-1", "file": {},
+                 "parentReference": {"path": "/drives/test-drive-id/root:/docs"}},
+                {"name": "archive.pdf", "id": "folder-1", "folder": {},
+                 "parentReference": {"path": "/drives/test-drive-id/root:"}},
+                {"name": "report.pdf.txt", "id": "file-2", "file": {},
+                 "parentReference": {"path": "/drives/test-drive-id/root:"}}
+            ]
+        })
+        mock_requests_get.return_value = response
+
+        results = mock_sharepoint_manager.search_files_by_suffix_recursive(".pdf")
+
+        assert [result.path for result in results] == ["/docs/report.pdf"]
+        mock_requests_get.assert_called_once()
+        assert "search(q='.pdf')" in mock_requests_get.call_args[0][0]
+
+    def test_search_files_recursive_falls_back_to_batched_walk(self, mock_sharepoint_manager, mock_requests_get,
+                                                               mock_requests_post, make_batch_response):
+        """Test the folder tree is walked with batch requests when search is unavailable"""
+        search_response = Mock()
+        search_response.status_code = 400
+        search_response.raise_for_status.side_effect = HTTPError(response=search_response)
+        mock_requests_get.return_value = search_response
+
+        root_listing = make_batch_response({
+            "value": [
+                {"name": "top.pdf", "id": "file-1", "file": {}},
+                {"name": "docs", "id": "folder-1", "folder": {}}
+            ]
+        })
+        docs_listing = make_batch_response({
+            "value": [{"name": "nested.pdf", "id": "file-2", "file": {}}]
+        })
+        mock_requests_post.side_effect = [root_listing, docs_listing]
+
+        results = mock_sharepoint_manager.search_files_by_suffix_recursive("pdf")
+
+        assert [result.name for result in results] == ["top.pdf", "nested.pdf"]
+        assert mock_requests_post.call_count == 2
+
+    def test_search_files_recursive_walk_follows_next_link(self, mock_sharepoint_manager, mock_requests_get,
+                                                           mock_requests_post, make_batch_response):
+        """Test paged folder listings are continued in the next batch request"""
+        search_response = Mock()
+        search_response.status_code = 501
+        search_response.raise_for_status.side_effect = HTTPError(response=search_response)
+        mock_requests_get.return_value = search_response
+
+        first_page = make_batch_response({
+            "value": [{"name": "a.pdf", "id": "file-1", "file": {}}],
+            "@odata.nextLink": "https://graph.microsoft.com/v1.0/drives/test-drive-id/items/root/children?$skiptoken=x"
+        })
+        second_page = make_batch_response({
+            "value": [{"name": "b.pdf", "id": "file-2", "file": {}}]
+        })
+        mock_requests_post.side_effect = [first_page, second_page]
+
+        results = mock_sharepoint_manager.search_files_by_suffix_recursive("pdf")
+
+        assert [result.name for result in results] == ["a.pdf", "b.pdf"]
+        second_batch = mock_requests_post.call_args_list[1][1]["json"]["requests"]
+        assert second_batch[0]["url"] == "/drives/test-drive-id/items/root/children?$skiptoken=x"
+
+    def test_search_files_recursive_with_multiple_suffixes(self, mock_sharepoint_manager, mock_requests_get,
+                                                           make_response):
+        """Test one drive search runs per suffix, concurrently, and items found twice are returned once"""
+        a_csv = {"name": "a.csv", "id": "file-1", "file": {},
+                 "parentReference": {"path": "/drives/test-drive-id/root:/data"}}
+        b_tsv = {"name": "b.tsv", "id": "file-2", "file": {},
+                 "parentReference": {"path": "/drives/test-drive-id/root:"}}
+        responses_by_query = {
+            "search(q='.csv')": make_response({"value": [a_csv]}),
+            "search(q='.tsv')": make_response({"value": [a_csv, b_tsv]})
+        }
+        # Both searches must be in flight before either can respond
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_get(url, headers=None, params=None):
+            barrier.wait()
+            return responses_by_query[url.rpartition("/")[2]]
+
+        mock_requests_get.side_effect = fake_get
+
+        results = mock_sharepoint_manager.search_files_by_suffix_recursive(("csv", ".tsv"))
+
+        assert [result.path for result in results] == ["/data/a.csv", "/b.tsv"]
+        assert mock_requests_get.call_count == 2
+
+    @pytest.mark.parametrize("status_code", [401, 429])
+    def test_search_files_recursive_does_not_mask_search_errors(self, mock_sharepoint_manager, mock_requests_get,
+                                                                mock_requests_post, status_code):
+        """Test auth and throttling errors from search are raised instead of walking the tree"""
+        search_response = Mock()
+        search_response.status_code = status_code
+        search_response.raise_for_status.side_effect = HTTPError(response=search_response)
+        mock_requests_get.return_value = search_response
+
+        with pytest.raises(HTTPError) as error:
+            mock_sharepoint_manager.search_files_by_suffix_recursive(".pdf")
+
+        assert error.value.response.status_code == status_code
+        mock_requests_post.assert_not_called()
+
+    def test_search_files_recursive_resolves_root_hit_paths(self, mock_sharepoint_manager, mock_requests_get,
+                                                            mock_requests_post, make_response, make_batch_response):
+        """Test a root search hit without a parent path is returned with its full drive path"""
+        mock_requests_get.return_value = make_response({
+            "value": [{"name": "a.csv", "id": "file-1", "file": {},
+                       "parentReference": {"driveId": "test-drive-id", "id": "folder-1"}}]
+        })
+        mock_requests_post.return_value = make_batch_response(
+            {"id": "file-1", "parentReference": {"id": "folder-1", "path": "/drives/test-drive-id/root:/data"}}
+        )
+
+        results = mock_sharepoint_manager.search_files_by_suffix_recursive(".csv")
+
+        assert [result.path for result in results] == ["/data/a.csv"]
+
+    @pytest.mark.parametrize("manager_missing", ["drive_id"], indirect=True)
+    def test_search_files_recursive_without_drive_id(self, manager_missing):
         """Test recursive search raises exception without drive_id"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
-
-            manager = SharePointManager(
-                tenant_id=config["TENANT_ID"],
-                client_id=config["CLIENT_ID"],
-                client_secret=config["CLIENT_SECRET"],
-                site_name=config["SITE_NAME"]
-            )
-            manager.access_token = "token"
-            manager.site_id = "site-id"
-            manager.drive_id = None
-
-            with pytest.raises(Exception, match="Drive ID not set"):
-                manager.search_files_by_suffix_recursive(".pdf")
-
-    def test_search_files_recursive_with_start_path(self, mock_sharepoint_manager, mock_requests_get):
+        with pytest.raises(Exception, match="Drive ID not set"):
+            manager_missing.search_files_by_suffix_recursive(".pdf")
+
+    def test_search_files_recursive_with_start_path(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test recursive search with specific start path"""
-        response = Mock()
-        response.json.return_value = {"value": []}
-        response.raise_for_status.return_value = None
+        response = make_response({"value": []})
 
         mock_requests_get.return_value = response
 
@@ -183,11 +337,9 @@ class TestSearchFilesByRecursive:
 class TestSearchFilesBySuffixValidation:
     """Tests for input validation in search operations"""
 
-    def test_search_with_empty_suffix(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_with_empty_suffix(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test search with empty suffix"""
-        response = Mock()
-        response.json.return_value = {"value": []}
-        response.raise_for_status.return_value = None
+        response = make_response({"value": []})
 
         mock_requests_get.return_value = response
 
@@ -196,10 +348,9 @@ class TestSearchFilesBySuffixValidation:
 
         assert isinstance(results, list)
 
-    def test_search_returns_correct_dataclass(self, mock_sharepoint_manager, mock_requests_get):
+    def test_search_returns_correct_dataclass(self, mock_sharepoint_manager, mock_requests_get, make_response):
         """Test that search returns FileInfo dataclass objects"""
-        response = Mock()
-        response.json.return_value = {
+        response = make_response({
             "value": [
                 {
                     "name": "test.txt",
@@ -211,8 +362,7 @@ class TestSearchFilesBySuffixValidation:
                     "webUrl": "https://sharepoint.com/test.txt"
                 }
             ]
-        }
-        response.raise_for_status.return_value = None
+        })
 
         mock_requests_get.return_value = response
 
@@ -224,3 +374,78 @@ class TestSearchFilesBySuffixValidation:
         assert result.id == "file-123"
         assert result.size == 1024
         assert hasattr(result, 'webUrl')
+
+
+class TestWalk:
+    """Tests for walk method"""
+
+    def test_walk_yields_files_and_folders_once(self, mock_sharepoint_manager, mock_requests_post, make_batch_response):
+        """Test every file and folder is yielded from a single traversal"""
+        root_listing = make_batch_response({
+            "value": [
+                {"name": "top.pdf", "id": "file-1", "file": {}, "size": 10},
+                {"name": "docs.gdb", "id": "folder-1", "folder": {}}
+            ]
+        })
+        docs_listing = make_batch_response({
+            "value": [{"name": "nested.pdf", "id": "file-2", "file": {}, "size": 20}]
+        })
+        mock_requests_post.side_effect = [root_listing, docs_listing]
+
+        items = list(mock_sharepoint_manager.walk())
+
+        assert [(item_type, item.name) for item_type, item in items] == [
+            ("file", "top.pdf"), ("folder", "docs.gdb"), ("file", "nested.pdf")
+        ]
+        assert all(isinstance(item, ItemInfo) for _, item in items)
+        assert mock_requests_post.call_count == 2
+
+    @pytest.mark.parametrize("manager_missing", ["drive_id"], indirect=True)
+    def test_walk_without_drive_id(self, manager_missing):
+        """Test walk raises exception without drive_id"""
+        with pytest.raises(Exception, match="Drive ID not set"):
+            manager_missing.walk()
+
+
+class TestLazySearch:
+    """Tests for isearch_files_by_suffix and isearch_folders_by_suffix methods"""
+
+    def test_isearch_files_stops_after_first_match(self, mock_sharepoint_manager, mock_requests_get, make_response):
+        """Test taking the first match fetches only the first listing page"""
+        mock_requests_get.return_value = make_response({
+            "value": [{"name": "a.csv", "id": "file-1", "file": {}}],
+            "@odata.nextLink": "https://graph.microsoft.com/v1.0/next-page"
+        })
+
+        results = mock_sharepoint_manager.isearch_files_by_suffix("csv")
+        mock_requests_get.assert_not_called()
+
+        first_match = next(results)
+
+        assert first_match.name == "a.csv"
+        assert isinstance(first_match, ItemInfo)
+        assert mock_requests_get.call_count == 1
+
+    def test_isearch_folders_recursive_walks_lazily(self, mock_sharepoint_manager, mock_requests_get,
+                                                    mock_requests_post, make_batch_response):
+        """Test a recursive fallback walk only lists the levels needed for the consumed matches"""
+        # Server-side search is unavailable
+        search_response = Mock()
+        search_response.status_code = 400
+        search_response.raise_for_status.side_effect = HTTPError(response=search_response)
+        mock_requests_get.return_value = search_response
+
+        mock_requests_post.return_value = make_batch_response({
+            "value": [{"name": "top.gdb", "id": "folder-1", "folder": {}}]
+        })
+
+        results = mock_sharepoint_manager.isearch_folders_by_suffix(".gdb", recursive=True)
+
+        assert next(results).name == "top.gdb"
+        assert mock_requests_post.call_count == 1
+
+    @pytest.mark.parametrize("manager_missing", ["drive_id"], indirect=True)
+    def test_isearch_without_drive_id(self, manager_missing):
+        """Test lazy searches raise when called, not when first iterated"""
+        with pytest.raises(Exception, match="Drive ID not set"):
+            manager_missing.isearch_files_by_suffix(".csv")
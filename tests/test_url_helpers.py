@@ -1,7 +1,8 @@
 """
 Tests for URL helper methods
 """
-from unittest.mock import Mock, patch
+from urllib.parse import quote
+
 from sharepointer.sharepoint import SharePointManager
 
 
@@ -33,6 +34,24 @@ class TestURLHelpers:
 
         assert "sites/test-site-id/drives/test-drive-id/root" in url
 
+    def test_get_drive_root_url_follows_drive_change(self, mock_sharepoint_manager):
+        """Test the cached drive root URL is rebuilt when the drive changes"""
+        assert mock_sharepoint_manager._get_drive_root_url().endswith("/drives/test-drive-id/root")
+
+        mock_sharepoint_manager.drive_id = "other-drive-id"
+
+        assert mock_sharepoint_manager._get_drive_root_url().endswith("/drives/other-drive-id/root")
+        assert mock_sharepoint_manager._get_drive_root_url(relative=True) == "/sites/test-site-id/drives/other-drive-id/root"
+
+    def test_relative_urls_match_stripped_absolute_urls(self, mock_sharepoint_manager):
+        """Test the relative URL forms equal the absolute ones without GRAPH_API_BASE"""
+        manager = mock_sharepoint_manager
+
+        assert manager._get_drive_root_url(relative=True) == manager._to_relative_url(manager._get_drive_root_url())
+        for folder_path in ("", "parent/child folder"):
+            assert manager._get_drive_children_url(folder_path, relative=True) == \
+                manager._to_relative_url(manager._get_drive_children_url(folder_path))
+
     def test_get_drive_item_url(self, mock_sharepoint_manager):
         """Test _get_drive_item_url"""
         url = mock_sharepoint_manager._get_drive_item_url("test%2Ffile.txt")
@@ -46,6 +65,17 @@ class TestURLHelpers:
 
         assert ":/test%2Ffile.txt:/content" in url
 
+    def test_get_drive_item_batch_urls(self, mock_sharepoint_manager):
+        """Test _get_drive_item_batch_urls matches the relative single-item URLs"""
+        paths = ["folder/a.txt", "b c.txt"]
+        urls = mock_sharepoint_manager._get_drive_item_batch_urls(paths)
+
+        assert urls == [
+            mock_sharepoint_manager._to_relative_url(mock_sharepoint_manager._get_drive_item_url(quote(path)))
+            for path in paths
+        ]
+        assert urls[1] == "/sites/test-site-id/drives/test-drive-id/root:/b%20c.txt"
+
     def test_get_drive_children_url_with_folder(self, mock_sharepoint_manager):
         """Test _get_drive_children_url with folder path"""
         url = mock_sharepoint_manager._get_drive_children_url("my_folder")
@@ -71,35 +101,25 @@ class TestURLHelpers:
 
     def test_site_name_formatting_with_domain(self):
         """Test site name formatting with full domain"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
-
-            manager = SharePointManager(
-                tenant_id="test-tenant",
-                client_id="test-client",
-                client_secret="test-secret",
-                site_name="mysite.sharepoint.com"
-            )
+        manager = SharePointManager(
+            tenant_id="test-tenant",
+            client_id="test-client",
+            client_secret="test-secret",
+            site_name="mysite.sharepoint.com"
+        )
 
-            assert manager.site_name == "mysite.sharepoint.com"
+        assert manager.site_name == "mysite.sharepoint.com"
 
     def test_site_name_formatting_without_domain(self):
         """Test site name formatting without domain"""
-        with patch('sharepointmanager.sharepoint.msal.ConfidentialClientApplication') as mock_auth:
-            mock_app = Mock()
-            mock_app.acquire_token_for_client.return_value = {"access_token": "test-token"}
-            mock_auth.return_value = mock_app
-
-            manager = SharePointManager(
-                tenant_id="test-tenant",
-                client_id="test-client",
-                client_secret="test-secret",
-                site_name="mysite"
-            )
-
-            assert manager.site_name == "mysite.sharepoint.com"
+        manager = SharePointManager(
+            tenant_id="test-tenant",
+            client_id="test-client",
+            client_secret="test-secret",
+            site_name="mysite"
+        )
+
+        assert manager.site_name == "mysite.sharepoint.com"
 
     def test_url_encoding_in_paths(self, mock_sharepoint_manager):
         """Test URL encoding for special characters in paths"""